@@ -3,7 +3,7 @@ import os
 
 import structlog
 from celery import Celery
-from celery.signals import setup_logging
+from celery.signals import setup_logging, worker_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
 
 logger = get_task_logger(__name__)
@@ -54,3 +54,27 @@ def receiver_setup_logging(loglevel, logfile, format, colorize, **kwargs):  # pr
             },
         }
     )
+
+
+@worker_init.connect
+def receiver_start_metrics_server(**kwargs):  # pragma: no cover
+    """
+    Expose the metrics of the worker (e.g. stale order sweeps) on `CORE__METRICS_WORKER_PORT`, when set.
+
+    NOTE: the pool processes record their samples to `PROMETHEUS_MULTIPROC_DIR`, which must then be set.
+    """
+
+    from django.conf import settings
+    from prometheus_client import start_http_server
+
+    from core.utils.metrics import get_metrics_registry
+
+    if settings.CORE__METRICS_WORKER_PORT:
+        start_http_server(settings.CORE__METRICS_WORKER_PORT, registry=get_metrics_registry())
+
+
+@worker_process_shutdown.connect
+def receiver_mark_metrics_process_dead(pid, **kwargs):  # pragma: no cover
+    from core.utils.metrics import mark_process_dead
+
+    mark_process_dead(pid)
@@ -0,0 +1,15 @@
+# Gunicorn configuration, i.e. `gunicorn -c config/gunicorn.py config.wsgi`
+# https://docs.gunicorn.org/en/stable/settings.html
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = int(os.getenv("GUNICORN_WORKERS", 4))
+
+
+def child_exit(server, worker):
+    # NOTE: discard the samples of exited workers from the metrics aggregated across workers (see `core.utils.metrics`)
+    from core.utils.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
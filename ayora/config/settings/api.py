@@ -0,0 +1,47 @@
+# ruff: noqa: F403, F405
+
+from core.utils.databases import DB_CONNECTION_MODE__PER_REQUEST, apply_connection_mode
+
+from .prod import *
+
+# NOTE: a slim, API-only, profile of the production settings, for serverless deployments (i.e. `serverless.yml`),
+# where every cold start pays for the apps (and URLs) loaded on startup. The admin, docs, schema, static files and
+# Celery beat (whose periodic tasks are set up from the full profile) are left out, as the order API never uses them.
+
+DJANGO_ENV = "PROD"
+
+API_ONLY_EXCLUDED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.admindocs",
+    "django.contrib.humanize",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django_celery_beat",
+    "django_extensions",
+    "drf_spectacular",
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_ONLY_EXCLUDED_APPS]
+
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE if middleware != "django.contrib.messages.middleware.MessageMiddleware"
+]
+
+TEMPLATES[0]["OPTIONS"]["context_processors"] = [
+    processor
+    for processor in TEMPLATES[0]["OPTIONS"]["context_processors"]
+    if processor != "django.contrib.messages.context_processors.messages"
+]
+
+ROOT_URLCONF = "config.urls_api"
+
+# NOTE: without a pooler, each (idle) container would otherwise pin a database connection for `CONN_MAX_AGE`,
+# exhausting `max_connections` under traffic spikes, deployments with one should use `pooler` instead
+DB_CONNECTION_MODE = env("DB_CONNECTION_MODE", default=DB_CONNECTION_MODE__PER_REQUEST)
+
+for alias in DATABASES:
+    DATABASES[alias] = apply_connection_mode(DATABASES[alias], DB_CONNECTION_MODE)
+
+# NOTE: the schema is never generated from this profile, so the views (which are annotated for `drf_spectacular`
+# on import) are given DRF's own schema class, rather than one pulling `drf_spectacular.openapi` (and `django.test`)
+REST_FRAMEWORK = {**REST_FRAMEWORK, "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.openapi.AutoSchema"}
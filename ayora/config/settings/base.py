@@ -4,6 +4,7 @@ from pathlib import Path
 import dj_database_url
 import rest_framework.exceptions as drf_exceptions
 import structlog
+from core.utils.databases import DB_CONNECTION_MODE__PERSISTENT, apply_connection_mode
 from django.utils.translation import gettext_lazy as _
 
 # Initialise environment variables
@@ -83,16 +84,19 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middlewares.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middlewares.replicas.PrimaryPinMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django_structlog.middlewares.RequestMiddleware",
+    "core.middlewares.profiling.RequestProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -134,11 +138,32 @@ DATABASES = {
     )
 }
 
+# NOTE: one of `persistent`, `per_request` or `pooler` (i.e. through PgBouncer in transaction mode),
+# see `core.utils.databases`
+DB_CONNECTION_MODE = env("DB_CONNECTION_MODE", default=DB_CONNECTION_MODE__PERSISTENT)
+
+# NOTE: an optional (streaming) read replica, which the list endpoints read from (see `core.routers.replicas`)
+if env("DB_REPLICA_URL", default=None):
+    DATABASES["replica"] = dj_database_url.config(
+        env="DB_REPLICA_URL",
+        conn_max_age=int(os.getenv("POSTGRES_CONN_MAX_AGE", 600)),
+        conn_health_checks=True,
+    )
+
+for alias in DATABASES:
+    DATABASES[alias] = apply_connection_mode(DATABASES[alias], DB_CONNECTION_MODE)
+
+DATABASE_ROUTERS = ["core.routers.replicas.ReadReplicaRouter"]
+
 # Cache
 
 # https://docs.djangoproject.com/en/dev/ref/settings/#cache
 CACHES = {"default": env.cache("REDIS_URL")}
 
+# NOTE: records cache hits and misses against the profile of each request (see `core.middlewares.profiling`)
+if CACHES["default"]["BACKEND"] == "django_redis.cache.RedisCache":
+    CACHES["default"]["BACKEND"] = "core.utils.caches.ProfiledRedisCache"
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -461,3 +486,39 @@ CORE__DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 CORE__STATIC_MEDIA_MAX_BYTES = DATA_UPLOAD_MAX_MEMORY_SIZE  # 50 MB
 
 CORE__REPR_OUTPUT_SIZE = 5
+
+# NOTE: runtime type checks of services and selectors (see `core.utils.typechecks`), one of `full`, `sampled` or `off`
+CORE__TYPECHECK_MODE = env("CORE__TYPECHECK_MODE", default="full")
+
+CORE__TYPECHECK_SAMPLE_RATE = env.float("CORE__TYPECHECK_SAMPLE_RATE", default=0.01)
+
+# NOTE: responses to requests with an `Idempotency-Key` are replayed for retries within this time
+CORE__IDEMPOTENCY_TIMEOUT = 60 * 60 * 24  # 24 hours
+
+CORE__IDEMPOTENCY_LOCK_TIMEOUT = 30
+
+# NOTE: expose the profile of each request (see `core.middlewares.profiling`) as a `Server-Timing` header
+CORE__SERVER_TIMING = env.bool("CORE__SERVER_TIMING", default=False)
+
+# NOTE: Celery queues whose depth is exposed by the metrics endpoint (see `core.views.metrics`)
+CORE__METRICS_CELERY_QUEUES = env.list("CORE__METRICS_CELERY_QUEUES", default=["celery"])
+
+# NOTE: Celery workers expose their metrics (e.g. stale order sweeps) on this port, when set
+CORE__METRICS_WORKER_PORT = env.int("CORE__METRICS_WORKER_PORT", default=None)
+
+# NOTE: the alias of the read replica (i.e. set through `DB_REPLICA_URL`), if any
+CORE__REPLICA_DATABASE = "replica" if "replica" in DATABASES else None
+
+# NOTE: how long (in seconds) clients read from the primary after writing, which must exceed the replication lag
+CORE__REPLICA_PIN_SECONDS = env.int("CORE__REPLICA_PIN_SECONDS", default=10)
+
+ORDER__EVENTS_REDIS_URL = env("REDIS_URL")
+
+# NOTE: only enable when served through ASGI (i.e. `config.asgi`), also mounts the order events stream
+ORDER__ASYNC_VIEWS = env.bool("ORDER__ASYNC_VIEWS", default=False)
+
+# NOTE: finalised (i.e. accepted or rejected) orders placed more than this many days ago are archived
+ORDER__ARCHIVE_AFTER_DAYS = env.int("ORDER__ARCHIVE_AFTER_DAYS", default=90)
+
+# NOTE: the alias (i.e. of `STORAGES`) of the storage archived orders are written to
+ORDER__ARCHIVE_STORAGE = env("ORDER__ARCHIVE_STORAGE", default="default")
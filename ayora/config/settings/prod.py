@@ -59,3 +59,6 @@ if not DEBUG:
     # ==================================================|
     # ============= Ayora apps settings ==============|
     # ==================================================|
+
+    # NOTE: the type checks are exercised by the test suite, so are skipped on the hot path in production
+    CORE__TYPECHECK_MODE = env("CORE__TYPECHECK_MODE", default="off")
@@ -15,6 +15,11 @@ PASSWORD_HASHERS = [
 # https://docs.djangoproject.com/en/5.1/ref/databases/#caveats
 DATABASES["default"]["CONN_MAX_AGE"] = 0
 
+# NOTE: the replica mirrors the test database, but is only read from by the tests which opt in to it
+DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+
+CORE__REPLICA_DATABASE = None
+
 # ==================================================|
 # ============ 3rd party apps settings =============|
 # ==================================================|
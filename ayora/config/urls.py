@@ -1,4 +1,4 @@
-from core.views import HealthCheckView
+from core.views import HealthCheckView, MetricsView
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
@@ -14,6 +14,7 @@ ADMIN_PATH = env("DJANGO_ADMIN_PATH", default="admin/")
 
 urlpatterns = [
     path("health/", HealthCheckView.as_view(), name="health"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     path(ADMIN_PATH + "docs/", include(admindocs_urls)),
     path(ADMIN_PATH, admin.site.urls),
     path("", include("order.urls", namespace="orders")),
@@ -0,0 +1,9 @@
+from core.views import HealthCheckView, MetricsView
+from django.urls import include, path
+
+# NOTE: the URLs of the API-only profile (i.e. `config.settings.api`), without the admin, docs and schema
+urlpatterns = [
+    path("health/", HealthCheckView.as_view(), name="health"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("", include("order.urls", namespace="orders")),
+]
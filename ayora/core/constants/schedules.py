@@ -6,6 +6,8 @@ Common cron schedules for periodic tasks.
 
 EVERY_MINUTE = CronSchedule()
 
+HOURLY = CronSchedule(minute="0")
+
 DAILY_MORNING = CronSchedule(minute="0", hour="8")
 
 DAILY_NOON = CronSchedule(minute="0", hour="12")
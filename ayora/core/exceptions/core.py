@@ -50,3 +50,19 @@ class DefaultStoreNotImplementedError(CoreException):
 
     default_code = "default_store_not_implemented_error"
     default_detail = _("Default store not implemented.")
+
+
+class IdempotencyConflictError(BaseException):
+    """Idempotency conflict exception (i.e. a request with the same idempotency key is still in progress)."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "idempotency_conflict"
+    default_detail = _("A request with the same idempotency key is already in progress, retry later.")
+
+
+class IdempotencyKeyMismatchError(BaseException):
+    """Idempotency key mismatch exception (i.e. the idempotency key was already used for a different request)."""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_code = "idempotency_key_mismatch"
+    default_detail = _("The idempotency key has already been used for a different request.")
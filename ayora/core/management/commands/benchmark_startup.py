@@ -0,0 +1,98 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.utils.benchmarks import get_git_commit, get_import_times_by_package, parse_importtime
+
+# NOTE: what a (WSGI) cold start does before serving its first request, the URLconf being imported lazily on it
+STARTUP_SCRIPT = """
+import time
+
+started = time.perf_counter()
+
+from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
+
+application = get_wsgi_application()
+get_resolver().url_patterns
+
+print(time.perf_counter() - started)
+"""
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark the cold start of the WSGI application (i.e. as on Lambda) for each of the given settings modules,
+    reporting the startup time, and the import time by package and module (parsed from `python -X importtime`).
+
+    Each run is a fresh interpreter, with bytecode already compiled (i.e. as when deployed). Results can be appended
+    to a file (see `--output`), to track regressions across commits, and `--max-ms` fails the command when the median
+    startup time of any settings module exceeds it (e.g. in CI).
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--settings-modules", nargs="+", default=["config.settings.prod", "config.settings.api"])
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--top", type=int, default=15, help="Number of slowest packages and modules to report.")
+        parser.add_argument("--output", help="Append the results (as JSON lines) to the given file.")
+        parser.add_argument("--max-ms", type=float, help="Fail if a median startup time exceeds this.")
+
+    def handle(self, *args, **options):
+        results = [
+            self.run(settings_module, options["runs"], options["top"])
+            for settings_module in options["settings_modules"]
+        ]
+
+        for result in results:
+            self.stdout.write(json.dumps(result))
+
+        if options["output"]:
+            with open(options["output"], "a") as file:
+                file.writelines(json.dumps(result) + "\n" for result in results)
+
+        if options["max_ms"] is not None:
+            slow = [result["settings"] for result in results if result["startup_ms"] > options["max_ms"]]
+            if slow:
+                raise CommandError(f"Startup exceeded {options['max_ms']}ms for: {', '.join(slow)}")
+
+    def run(self, settings_module: str, runs: int, top: int) -> dict:
+        """Start the application `runs` times in fresh interpreters, returning the median timings of a start."""
+
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+        startups, imports = [], []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            # NOTE: the startup time is the last line, as logs may also be written to stdout
+            startups.append(float(output.stdout.strip().splitlines()[-1]))
+            imports.append(parse_importtime(output.stderr))
+
+        # report the imports of the median run
+        median_run = sorted(range(runs), key=lambda index: startups[index])[runs // 2]
+        modules = imports[median_run]
+        packages = get_import_times_by_package(modules)
+        slowest = sorted(modules, key=lambda module: module["self_us"], reverse=True)[:top]
+
+        return {
+            "settings": settings_module,
+            "commit": get_git_commit(),
+            "created_at": timezone.now().isoformat(),
+            "runs": runs,
+            "startup_ms": round(statistics.median(startups) * 1000, 1),
+            "modules": len(modules),
+            "import_ms": round(sum(module["self_us"] for module in modules) / 1000, 1),
+            "packages_ms": {package: round(us / 1000, 1) for package, us in list(packages.items())[:top]},
+            "modules_ms": {module["module"]: round(module["self_us"] / 1000, 1) for module in slowest},
+        }
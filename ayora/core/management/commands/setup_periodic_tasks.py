@@ -2,10 +2,12 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils.timezone import get_default_timezone_name
 from django_celery_beat.models import CrontabSchedule, IntervalSchedule, PeriodicTask
-from order.tasks import RejectStaleOrdersTask
+from order.tasks import ArchiveOrdersTask, CreateOrderPartitionsTask, RejectStaleOrdersTask
 
 from core.constants.schedules import (
+    DAILY_MIDNIGHT,
     EVERY_MINUTE,
+    HOURLY,
 )
 from core.types.schedules import TaskSchedule
 
@@ -23,6 +25,20 @@ class Command(BaseCommand):
                 cron=EVERY_MINUTE,
             ),
         ],
+        CreateOrderPartitionsTask: [
+            TaskSchedule(
+                task=CreateOrderPartitionsTask,
+                name="Create order partitions ahead of time.",
+                cron=DAILY_MIDNIGHT,
+            ),
+        ],
+        ArchiveOrdersTask: [
+            TaskSchedule(
+                task=ArchiveOrdersTask,
+                name="Archive finalised orders.",
+                cron=HOURLY,
+            ),
+        ],
     }
 
     @transaction.atomic
@@ -0,0 +1,51 @@
+import time
+from collections.abc import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from core.utils.metrics import REQUEST_LATENCY
+
+
+class RequestMetricsMiddleware:
+    """
+    Observe the latency of each request in the `ayora_http_request_duration_seconds` histogram, by route (i.e. URL
+    name, such as `customer-orders`), method and status code.
+
+    NOTE: requests which did not resolve to a route are observed as `unmatched`, so unknown paths (e.g. scanners)
+    cannot blow up the cardinality of the histogram.
+
+    NOTE: both synchronous and asynchronous, so it does not force the (whole) middleware chain to be adapted to
+    synchronous under ASGI, being the outermost middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+
+        return response
+
+    @staticmethod
+    def observe(request: HttpRequest, response: HttpResponse, latency: float) -> None:
+        resolver_match = getattr(request, "resolver_match", None)
+        route = (resolver_match.url_name if resolver_match else None) or "unmatched"
+        REQUEST_LATENCY.labels(route=route, method=request.method, status=response.status_code).observe(latency)
@@ -0,0 +1,99 @@
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import ExitStack
+
+import structlog
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from core.utils.profiling import QueryProfiler, RequestProfile, profile_request, start_stage, stop_stage
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile each request, i.e. its total latency, database queries (and their time), cache hits and misses, and the
+    time spent in serializers, rendering the response and enqueueing Celery tasks.
+
+    The profile is bound to the `structlog` context (as `profile`), so it is included in the `request_finished` log
+    line of `django_structlog`, and is optionally exposed as a `Server-Timing` header (see `CORE__SERVER_TIMING`).
+
+    NOTE: must come after `django_structlog.middlewares.RequestMiddleware` (i.e. within it), which clears the context
+    at the start of a request and logs the request once the inner middlewares have returned.
+
+    NOTE: both synchronous and asynchronous (i.e. under ASGI), in which case the database execute wrappers are
+    installed (and removed) from the thread of `sync_to_async`, the connections being local to the request context
+    (so shared with the thread the ORM runs the queries of the request in).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+
+        with profile_request() as profile, self.profile_queries(profile):
+            response = self.get_response(request)
+
+        return self.finish(response, profile, started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+
+        with profile_request() as profile:
+            stack = await sync_to_async(self.profile_queries)(profile)
+            try:
+                response = await self.get_response(request)
+            finally:
+                await sync_to_async(stack.close)()
+
+        return self.finish(response, profile, started)
+
+    @staticmethod
+    def profile_queries(profile: RequestProfile) -> ExitStack:
+        """Install a `QueryProfiler` on the connection to each database, until the returned stack is closed."""
+
+        stack = ExitStack()
+        for alias in settings.DATABASES:
+            stack.enter_context(connections[alias].execute_wrapper(QueryProfiler(profile)))
+        return stack
+
+    def finish(self, response: HttpResponse, profile: RequestProfile, started: float) -> HttpResponse:
+        """Complete the profile of a request, binding it to the `structlog` context (and exposing it, if enabled)."""
+
+        profile.total_ms = (time.perf_counter() - started) * 1000
+
+        structlog.contextvars.bind_contextvars(profile=profile.as_dict())
+        if settings.CORE__SERVER_TIMING:
+            response.headers["Server-Timing"] = self.get_server_timing(profile)
+
+        return response
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        # time the (deferred) rendering of template responses, which include DRF's responses
+        start_stage("render")
+        response.add_post_render_callback(lambda _: stop_stage("render"))
+        return response
+
+    @staticmethod
+    def get_server_timing(profile: RequestProfile) -> str:
+        """Format a profile as a `Server-Timing` header, see https://www.w3.org/TR/server-timing/."""
+
+        metrics = [
+            f'db;dur={profile.db_ms:.3f};desc="{profile.db_queries} queries"',
+            f'cache;desc="{profile.cache_hits} hits / {profile.cache_misses} misses"',
+            f"serializer;dur={profile.serializer_ms:.3f}",
+            f"render;dur={profile.render_ms:.3f}",
+            f'celery;dur={profile.celery_enqueue_ms:.3f};desc="{profile.celery_tasks} tasks"',
+            f"total;dur={profile.total_ms:.3f}",
+        ]
+        return ", ".join(metrics)
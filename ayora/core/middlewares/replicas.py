@@ -0,0 +1,41 @@
+from collections.abc import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from core.utils.replicas import get_replica_database, pin_to_primary
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class PrimaryPinMiddleware:
+    """
+    Pin the clients which write (i.e. successful unsafe requests) to the primary for `CORE__REPLICA_PIN_SECONDS`,
+    so they read their own writes rather than the (lagging) replica, when one is configured.
+
+    NOTE: both synchronous and asynchronous, so async views are not run in a thread under ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return self.process_response(request, await self.get_response(request))
+
+    @staticmethod
+    def process_response(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if get_replica_database() and request.method not in SAFE_METHODS and response.status_code < 400:
+            pin_to_primary(request, response)
+
+        return response
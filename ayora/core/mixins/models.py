@@ -4,10 +4,10 @@ from typing import Any
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from typeguard import typechecked
 
 from core.utils.encoders import LazyJsonEncoder
 from core.utils.serializers import model_to_dict
+from core.utils.typechecks import typechecked
 
 
 class BaseModel(models.Model):
@@ -0,0 +1,37 @@
+from typing import Any
+
+from core.utils.paginators import CursorPaginator
+
+
+class OptionalCursorPaginationMixin:
+    """
+    A mixin that lets clients opt in to cursor (keyset) pagination, while
+    the default pagination class is kept for existing clients.
+
+    Cursor pagination is used when the `pagination=cursor` query param is
+    provided, or when following a cursor link (i.e. the `cursor` query param).
+    Unlike page number pagination, it avoids a `COUNT(*)` and an `OFFSET` scan
+    per page, so the cost of deep pages remains constant.
+    """
+
+    cursor_pagination_query_param = "pagination"
+    cursor_pagination_class: Any = CursorPaginator
+    # NOTE: should be backed by an index, with a unique field as the tiebreaker for stable ordering
+    cursor_ordering: tuple[str, ...] = ("-created_at", "-id")
+
+    def use_cursor_pagination(self) -> bool:
+        query_params = self.request.query_params
+        return (
+            query_params.get(self.cursor_pagination_query_param) == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in query_params
+        )
+
+    @property
+    def paginator(self) -> Any:
+        if not hasattr(self, "_paginator"):
+            if self.request is not None and self.use_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+                self._paginator.ordering = self.cursor_ordering
+            else:
+                self._paginator = super().paginator
+        return self._paginator
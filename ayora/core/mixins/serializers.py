@@ -2,6 +2,8 @@ from typing import Any
 
 from rest_framework.permissions import SAFE_METHODS
 
+from core.utils.profiling import profile_stage
+
 
 class ReadWriteSerializerMixin:
     """
@@ -34,3 +36,20 @@ class ReadWriteSerializerMixin:
             "`get_write_serializer_class()` method."
         )
         return self.write_serializer_class
+
+
+class ProfiledSerializerMixin:
+    """
+    A mixin that times the validation and representation of a serializer, as the `serializer` stage of the profile
+    of the current request (see `RequestProfilingMiddleware`).
+
+    NOTE: nested (and `many=True`) serializers are timed once, as part of their outermost profiled serializer.
+    """
+
+    def run_validation(self, *args: Any, **kwargs: Any) -> Any:
+        with profile_stage("serializer"):
+            return super().run_validation(*args, **kwargs)
+
+    def to_representation(self, *args: Any, **kwargs: Any) -> Any:
+        with profile_stage("serializer"):
+            return super().to_representation(*args, **kwargs)
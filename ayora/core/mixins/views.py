@@ -0,0 +1,263 @@
+import hashlib
+import inspect
+from contextvars import Token
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from rest_framework.response import Response
+
+from core.exceptions.core import IdempotencyConflictError, IdempotencyKeyMismatchError
+from core.utils.replicas import get_replica_database, is_pinned_to_primary, reset_read_database, set_read_database
+
+IDEMPOTENCY_CACHE_KEY = "idempotency:{digest}"
+
+IDEMPOTENCY_LOCK_CACHE_KEY = "idempotency:{digest}:lock"
+
+
+class IdempotentReplay(Exception):
+    """Raised to short-circuit a request with the stored response of its first attempt."""
+
+    def __init__(self, entry: dict) -> None:
+        super().__init__()
+        self.entry = entry
+
+
+class AsyncAPIViewMixin:
+    """
+    A mixin that lets DRF views define `async` handlers, which are dispatched on the event loop when served
+    through ASGI, rather than each request holding a thread (via `sync_to_async`) for its whole duration.
+
+    Synchronous handlers (e.g. the inherited `options`, or handlers which only raise) are still supported.
+
+    NOTE: the user is resolved asynchronously before the (synchronous) authentication, permission and throttle
+    checks are run, as those must not hit the database from the event loop.
+
+    NOTE: mixins doing I/O around the handler (e.g. `IdempotentViewMixin`, on the cache) can define the async hooks
+    `ainitial` (awaited after `initial`) and `afinalize` (awaited after `finalize_response`, or with no response
+    when an exception escapes `handle_exception`), to keep that I/O off the event loop.
+    """
+
+    view_is_async = True
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Response:
+        self.args = args
+        self.kwargs = kwargs
+
+        # resolve the (lazy) user, so the session authentication does not query the database
+        if hasattr(request, "auser"):
+            request.user = await request.auser()
+
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        ainitial = getattr(self, "ainitial", None)
+        afinalize = getattr(self, "afinalize", None)
+
+        try:
+            self.initial(request, *args, **kwargs)
+            if ainitial is not None:
+                await ainitial(request, *args, **kwargs)
+
+            # get the appropriate handler method
+            method = request.method.lower()
+            handler = getattr(self, method, self.http_method_not_allowed)
+            if method not in self.http_method_names:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+
+        except Exception as exc:
+            try:
+                response = self.handle_exception(exc)
+            except Exception:
+                if afinalize is not None:
+                    await afinalize(request, None)
+                raise
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        if afinalize is not None:
+            await afinalize(request, self.response)
+        return self.response
+
+
+class IdempotentViewMixin:
+    """
+    A mixin that honours the `Idempotency-Key` header on unsafe methods, so that clients can safely retry requests.
+
+    The response to the first request with a given key (and path) is stored in the cache for a bounded time
+    (i.e. `CORE__IDEMPOTENCY_TIMEOUT`), and replayed for any retry without running the handler again. While the
+    first request is in progress, concurrent duplicates are rejected with a conflict (i.e. serialized by a lock),
+    and reusing a key for a different request body is rejected altogether.
+
+    NOTE: server errors (including unhandled exceptions) are not stored and release the lock, so such requests can
+    be retried with the same key.
+
+    NOTE: async views (i.e. `AsyncAPIViewMixin`) go through the async hooks (i.e. `ainitial` and `afinalize`)
+    instead, so the cache is not hit from the event loop.
+    """
+
+    idempotency_header = "Idempotency-Key"
+    idempotency_replayed_header = "Idempotent-Replayed"
+    idempotent_methods = ("POST", "PATCH")
+
+    idempotency_digest: str | None = None
+    idempotency_fingerprint: str | None = None
+
+    def initial(self, request: Any, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+
+        if self.view_is_async or (idempotency := self.get_idempotency(request)) is None:
+            return
+
+        digest, fingerprint = idempotency
+        self.check_idempotency(cache.get(IDEMPOTENCY_CACHE_KEY.format(digest=digest)), fingerprint)
+
+        lock_key = IDEMPOTENCY_LOCK_CACHE_KEY.format(digest=digest)
+        self.lock_idempotency(cache.add(lock_key, True, timeout=settings.CORE__IDEMPOTENCY_LOCK_TIMEOUT), *idempotency)
+
+    async def ainitial(self, request: Any, *args: Any, **kwargs: Any) -> None:
+        """Async variant of the idempotency checks of `initial`."""
+
+        if (idempotency := self.get_idempotency(request)) is None:
+            return
+
+        digest, fingerprint = idempotency
+        self.check_idempotency(await cache.aget(IDEMPOTENCY_CACHE_KEY.format(digest=digest)), fingerprint)
+
+        lock_key = IDEMPOTENCY_LOCK_CACHE_KEY.format(digest=digest)
+        acquired = await cache.aadd(lock_key, True, timeout=settings.CORE__IDEMPOTENCY_LOCK_TIMEOUT)
+        self.lock_idempotency(acquired, *idempotency)
+
+    def get_idempotency(self, request: Any) -> tuple[str, str] | None:
+        """Return the digest of the key and the fingerprint of the body of a request, unless it is not idempotent."""
+
+        key = request.headers.get(self.idempotency_header)
+        if not key or request.method not in self.idempotent_methods:
+            return None
+
+        # keys are scoped per method and path (i.e. per resource)
+        digest = hashlib.md5(f"{request.method}:{request.path}:{key}".encode(), usedforsecurity=False).hexdigest()
+        fingerprint = hashlib.md5(request.body, usedforsecurity=False).hexdigest()
+        return digest, fingerprint
+
+    @staticmethod
+    def check_idempotency(entry: dict | None, fingerprint: str) -> None:
+        """Replay the (stored) response to the first request, if any."""
+
+        if entry is not None:
+            if entry["fingerprint"] != fingerprint:
+                raise IdempotencyKeyMismatchError()
+            raise IdempotentReplay(entry)
+
+    def lock_idempotency(self, acquired: bool, digest: str, fingerprint: str) -> None:
+        """Reject a concurrent duplicate, the lock being added (i.e. `SET NX`) with an expiry, in case of a crash."""
+
+        if not acquired:
+            raise IdempotencyConflictError()
+
+        self.idempotency_digest = digest
+        self.idempotency_fingerprint = fingerprint
+
+    def release_idempotency(self, response: Response | None) -> tuple[str, str, dict | None]:
+        """
+        Release this request of its lock, returning the keys of the lock and of the entry to store, along with the
+        entry itself (i.e. unless there is no response or a server error).
+        """
+
+        digest, self.idempotency_digest = self.idempotency_digest, None
+        entry = None
+        if response is not None and response.status_code < 500:
+            entry = {"fingerprint": self.idempotency_fingerprint, "status": response.status_code, "data": response.data}
+        return IDEMPOTENCY_LOCK_CACHE_KEY.format(digest=digest), IDEMPOTENCY_CACHE_KEY.format(digest=digest), entry
+
+    def handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, IdempotentReplay):
+            headers = {self.idempotency_replayed_header: "true"}
+            return Response(exc.entry["data"], status=exc.entry["status"], headers=headers)
+
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            # NOTE: unhandled exceptions are re-raised, skipping `finalize_response`, so the lock is released here
+            if not self.view_is_async and self.idempotency_digest is not None:
+                lock_key, _, _ = self.release_idempotency(None)
+                cache.delete(lock_key)
+            raise
+
+    def finalize_response(self, request: Any, response: Response, *args: Any, **kwargs: Any) -> Response:
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        # store the response (if this request holds the lock), and release the lock
+        if not self.view_is_async and self.idempotency_digest is not None:
+            lock_key, key, entry = self.release_idempotency(response)
+            if entry is not None:
+                cache.set(key, entry, timeout=settings.CORE__IDEMPOTENCY_TIMEOUT)
+            cache.delete(lock_key)
+
+        return response
+
+    async def afinalize(self, request: Any, response: Response | None) -> None:
+        """Async variant of `finalize_response` (and of `handle_exception`, without a response)."""
+
+        if self.idempotency_digest is not None:
+            lock_key, key, entry = self.release_idempotency(response)
+            if entry is not None:
+                await cache.aset(key, entry, timeout=settings.CORE__IDEMPOTENCY_TIMEOUT)
+            await cache.adelete(lock_key)
+
+
+class ReplicaReadViewMixin:
+    """
+    A mixin that routes the reads of safe requests (i.e. list endpoints) to the read replica, when one is configured
+    (i.e. `CORE__REPLICA_DATABASE`), to offload the primary.
+
+    Clients which wrote recently are pinned to the primary (see `PrimaryPinMiddleware`), so they read their own
+    writes rather than a lagging replica, and views can keep the reads which cannot tolerate the lag on the primary
+    (see `use_replica`).
+
+    NOTE: the reads are routed from `initial` until `finalize_response`, so this works with `AsyncAPIViewMixin`
+    too, the context being copied into the threads of `sync_to_async`.
+    """
+
+    replica_methods = ("GET", "HEAD")
+
+    reads_from_replica: bool = False
+    replica_token: Token | None = None
+
+    def use_replica(self, request: Any) -> bool:
+        """Whether the reads of a request can be routed to the replica, i.e. can tolerate its lag."""
+
+        return request.method in self.replica_methods and not is_pinned_to_primary(request)
+
+    def initial(self, request: Any, *args: Any, **kwargs: Any) -> None:
+        replica = get_replica_database()
+        if replica and self.use_replica(request):
+            self.reads_from_replica = True
+            self.replica_token = set_read_database(replica)
+
+        super().initial(request, *args, **kwargs)
+
+    def handle_exception(self, exc: Exception) -> Response:
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            # NOTE: unhandled exceptions are re-raised, skipping `finalize_response`, so the reads are routed back here
+            self.reset_replica()
+            raise
+
+    def finalize_response(self, request: Any, response: Response, *args: Any, **kwargs: Any) -> Response:
+        self.reset_replica()
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def reset_replica(self) -> None:
+        """Route the reads of the current context back to the primary (i.e. to the database of the enclosing one)."""
+
+        if self.replica_token is not None:
+            token, self.replica_token = self.replica_token, None
+            reset_read_database(token)
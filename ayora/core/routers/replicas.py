@@ -0,0 +1,31 @@
+from django.db import DEFAULT_DB_ALIAS
+
+from core.utils.replicas import get_read_database, get_replica_database
+
+
+class ReadReplicaRouter:
+    """
+    Route reads to the read replica (i.e. `CORE__REPLICA_DATABASE`) in the contexts which opt in to it (see
+    `ReplicaReadViewMixin`), and everything else to the primary.
+
+    NOTE: writes always go to the primary, including those of instances loaded from the replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        return get_read_database()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the replica holds the same data as the primary
+        databases = {DEFAULT_DB_ALIAS, get_replica_database()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # the replica is migrated through replication
+        if db == get_replica_database():
+            return False
+        return None
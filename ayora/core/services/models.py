@@ -1,11 +1,23 @@
 from collections.abc import Iterable
+from functools import cache
 from typing import Any
 
 from django.db import models
 from django.utils import timezone
-from typeguard import typechecked
 
 from core.types.models import DjangoModelType
+from core.utils.typechecks import typechecked
+
+
+@cache
+def get_model_fields(model: type[models.Model]) -> dict[str, models.Field]:
+    """
+    Return the fields of a model, by name.
+
+    NOTE: cached per model, as building the map is relatively costly on hot paths (i.e. on every update).
+    """
+
+    return {field.name: field for field in model._meta.get_fields()}
 
 
 @typechecked
@@ -15,6 +27,7 @@ def model__update(
     fields: Iterable[str],
     data: dict[str, Any],
     auto_updated_at=True,
+    validate_all_fields=False,
 ) -> tuple[DjangoModelType, bool]:
     """
     Generic update service meant to be reused in local update services.
@@ -43,6 +56,8 @@ def model__update(
             the update on `instance`.
         - If `auto_updated_at` is True, we'll try bumping `updated_at`
             with the current timestmap.
+        - Only the updated fields are validated (so uniqueness checks, which hit the
+            database, are skipped for untouched fields), unless `validate_all_fields` is True.
 
 
     NOTE: from https://github.com/HackSoftware/Django-Styleguide
@@ -51,19 +66,20 @@ def model__update(
     m2m_data = {}
     update_fields = []
 
-    model_fields = {field.name: field for field in instance._meta.get_fields()}
+    model_fields = get_model_fields(type(instance))
 
     for field in fields:
+        # Skip if a field is not present in the actual data
+        # NOTE: checked first, so skipped (i.e. related) fields are never loaded
+        if field not in data:
+            continue
+
         # Get the current value
         current_value = getattr(instance, field)
 
         # Get the incoming value
         incoming_value = data.get(field)
 
-        # Skip if a field is not present in the actual data
-        if field not in data:
-            continue
-
         # If field is not an actual model field, raise an error
         model_field = model_fields.get(field)
 
@@ -91,7 +107,9 @@ def model__update(
                 update_fields.append("updated_at")
                 instance.updated_at = timezone.now()  # type: ignore
 
-        instance.full_clean()
+        # Validate the updated fields only, the untouched fields were validated when they were last saved
+        exclude = None if validate_all_fields else [name for name in model_fields if name not in update_fields]
+        instance.full_clean(exclude=exclude)
         # Update only the fields that are meant to be updated.
         # Django docs reference:
         # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
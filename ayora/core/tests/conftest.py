@@ -1,15 +1,20 @@
+import logging
 import time
 from contextlib import contextmanager
 from random import seed
 
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
 from factory import Faker
 from factory.django import DjangoModelFactory
 from factory.random import reseed_random
 from rest_framework.reverse import reverse
 from typeguard import typechecked
 
+from core.utils.loggers import SQLFormatter
+
 ########################################################################################
 # constants ############################################################################
 ########################################################################################
@@ -89,6 +94,43 @@ def assert_not_raises(exception: Exception):
         raise pytest.fail(f"DID RAISE {exception}")
 
 
+def format_queries(queries: list[dict]) -> str:
+    """Format captured queries (i.e. `CaptureQueriesContext.captured_queries`) as the SQL logs are formatted."""
+
+    formatter = SQLFormatter("%(duration).3f %(statement)s")
+    records = [logging.makeLogRecord({"sql": query["sql"], "duration": float(query["time"])}) for query in queries]
+    return "\n".join(f"{index}. {formatter.format(record)}" for index, record in enumerate(records, start=1))
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, max_time_ms: float | None = None, using: str = "default"):
+    """
+    Assert that at most `max_queries` SQL queries are executed (and optionally, within `max_time_ms` in total)
+    in the block, or by the decorated function, failing with the offending queries.
+
+    NOTE: tests run in a transaction, so any atomic blocks executed add a `SAVEPOINT` and `RELEASE SAVEPOINT`.
+    """
+
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+
+    queries = context.captured_queries
+    total_ms = sum(float(query["time"]) for query in queries) * 1000
+
+    if len(queries) > max_queries:
+        pytest.fail(
+            f"Query budget exceeded: {len(queries)} queries executed, expected at most {max_queries}.\n\n"
+            + format_queries(queries),
+            pytrace=False,
+        )
+    if max_time_ms is not None and total_ms > max_time_ms:
+        pytest.fail(
+            f"Query time budget exceeded: {total_ms:.1f}ms spent, expected at most {max_time_ms}ms.\n\n"
+            + format_queries(queries),
+            pytrace=False,
+        )
+
+
 ########################################################################################
 # mixins ###############################################################################
 ########################################################################################
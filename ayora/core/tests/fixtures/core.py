@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from random import seed
 
 import pytest
@@ -10,6 +11,7 @@ from typeguard import typechecked
 from core.tests.conftest import fake
 
 from ..conftest import DEFAULT_SEED_VALUE
+from ..conftest import assert_query_budget as _assert_query_budget
 from ..conftest import generate_rand_int as _generate_rand_int
 
 faker = fake._get_faker()
@@ -45,3 +47,13 @@ def api_client() -> APIClient:
     """Unauthenticated (anonymous) API client."""
 
     return APIClient()
+
+
+@pytest.fixture
+def query_budget(db) -> Callable[..., AbstractContextManager]:
+    """
+    Provides a context manager asserting an upper bound on the SQL queries (and optionally their total time)
+    executed in a block, e.g. `with query_budget(3, max_time_ms=50): ...`.
+    """
+
+    return _assert_query_budget
@@ -0,0 +1,107 @@
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse, JsonResponse
+from django.test import AsyncClient
+from django.urls import path
+from rest_framework import response, serializers
+from rest_framework.views import APIView
+
+from core.middlewares.profiling import RequestProfilingMiddleware
+from core.mixins.serializers import ProfiledSerializerMixin
+from core.utils.profiling import profile_request, profile_stage
+
+
+class ProfiledSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    name = serializers.CharField()
+
+
+class ProfiledView(APIView):
+    def get(self, request):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        cache.get("profiled")
+        cache.set("profiled", 1)
+        cache.get("profiled")
+
+        return response.Response(ProfiledSerializer(instance={"name": "profiled"}).data)
+
+
+async def async_profiled_view(request):
+    users = [user async for user in get_user_model().objects.all()]
+    return JsonResponse({"users": len(users)})
+
+
+urlpatterns = [
+    path("profiled", ProfiledView.as_view(), name="profiled"),
+    path("async-profiled", async_profiled_view, name="async-profiled"),
+]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+def test__success__profiling__logged(api_client, db, caplog):
+    """Test that the profile of a request is bound to the structlog context, i.e. logged with the request."""
+
+    response = api_client.get("/profiled")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+    [finished] = [record.msg for record in caplog.records if record.msg["event"] == "request_finished"]
+    profile = finished["profile"]
+    assert profile["db_queries"] >= 1
+    assert profile["cache_hits"] == 1
+    assert profile["cache_misses"] == 1
+    assert profile["serializer_ms"] > 0
+    assert profile["render_ms"] > 0
+    assert profile["total_ms"] >= profile["db_ms"] + profile["serializer_ms"] + profile["render_ms"]
+
+
+def test__success__profiling__server_timing(api_client, db, settings):
+    """Test that the profile of a request is exposed as a `Server-Timing` header, when enabled."""
+
+    settings.CORE__SERVER_TIMING = True
+
+    response = api_client.get("/profiled")
+
+    metrics = {metric.split(";")[0]: metric for metric in response.headers["Server-Timing"].split(", ")}
+    assert list(metrics) == ["db", "cache", "serializer", "render", "celery", "total"]
+    assert 'desc="1 hits / 1 misses"' in metrics["cache"]
+
+
+def test__success__profiling__async(db, settings):
+    """Test that requests are profiled without leaving the event loop under ASGI, queries of the async ORM included."""
+
+    async def get_response(request):
+        return HttpResponse()
+
+    assert iscoroutinefunction(RequestProfilingMiddleware(get_response))
+
+    settings.CORE__SERVER_TIMING = True
+
+    response = async_to_sync(AsyncClient().get)("/async-profiled")
+
+    assert response.status_code == 200
+    metrics = {metric.split(";")[0]: metric for metric in response.headers["Server-Timing"].split(", ")}
+    assert 'desc="1 queries"' in metrics["db"]
+
+
+def test__success__profiling__nested_stages():
+    """Test that nested stages (e.g. nested serializers) are only timed once, and not at all outside requests."""
+
+    with profile_stage("serializer"):
+        pass
+
+    with profile_request() as profile:
+        with profile_stage("serializer"):
+            with profile_stage("serializer"):
+                pass
+            nested_ms = profile.serializer_ms
+
+    assert nested_ms == 0
+    assert profile.serializer_ms > 0
+    assert profile.stages == {}
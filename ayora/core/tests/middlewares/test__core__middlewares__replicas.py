@@ -0,0 +1,22 @@
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+from core.middlewares.replicas import PrimaryPinMiddleware
+
+
+def test__success__primary_pin__async():
+    """Test that the primary pin middleware is async under ASGI, rather than adapted (i.e. run in a thread)."""
+
+    async def get_response(request):
+        return HttpResponse()
+
+    assert iscoroutinefunction(PrimaryPinMiddleware(get_response))
+
+
+def test__success__middlewares__not_adapted_under_asgi(settings):
+    """Test that every middleware is async-capable, as under ASGI a sync one would run every async view in a thread."""
+
+    sync_only = [path for path in settings.MIDDLEWARE if not getattr(import_string(path), "async_capable", False)]
+
+    assert sync_only == []
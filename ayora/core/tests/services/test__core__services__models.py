@@ -0,0 +1,55 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from core.services.models import get_model_fields, model__update
+from order.models import Order
+
+
+def test__core__services__model__update__changed_fields_only(generate_orders, django_assert_num_queries):
+    """Test that only the changed fields are validated, so no uniqueness checks are issued for untouched fields."""
+
+    order = generate_orders()[0]
+    accepted_at = timezone.now()
+
+    # NOTE: the only query is the update itself (i.e. no `SELECT` to validate the uniqueness of `uid`)
+    with django_assert_num_queries(1):
+        order, has_updated = model__update(instance=order, fields=["accepted_at"], data={"accepted_at": accepted_at})
+
+    assert has_updated
+    order.refresh_from_db()
+    assert order.accepted_at == accepted_at
+
+
+def test__core__services__model__update__all_fields(generate_orders, django_assert_num_queries):
+    """Test that every field is validated (including uniqueness checks) when requested."""
+
+    order = generate_orders()[0]
+
+    with django_assert_num_queries(2):
+        _, has_updated = model__update(
+            instance=order, fields=["accepted_at"], data={"accepted_at": timezone.now()}, validate_all_fields=True
+        )
+
+    assert has_updated
+
+
+def test__core__services__model__update__unchanged(generate_orders, django_assert_num_queries):
+    """Test that nothing is validated or written when no field has changed."""
+
+    order = generate_orders()[0]
+
+    with django_assert_num_queries(0):
+        _, has_updated = model__update(instance=order, fields=["status"], data={"status": order.status})
+
+    assert not has_updated
+    assert get_model_fields(Order) is get_model_fields(Order)
+
+
+def test__core__services__model__update__invalid_changed_field(generate_orders):
+    """Test that the changed fields are still validated."""
+
+    order = generate_orders()[0]
+
+    with pytest.raises(ValidationError):
+        model__update(instance=order, fields=["status"], data={"status": "unknown"})
@@ -0,0 +1,28 @@
+from core.utils.benchmarks import get_import_times_by_package, parse_importtime
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     redis.exceptions
+import time:       300 |        420 |   redis
+import time:        80 |        500 | order.services.events
+Some unrelated output
+import time:        50 |         50 | redis.asyncio
+"""
+
+
+def test__core__utils__parse_importtime():
+    """Test that the `-X importtime` report is parsed into modules, skipping its header and unrelated lines."""
+
+    modules = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert modules == [
+        {"module": "redis.exceptions", "self_us": 120, "cumulative_us": 120, "depth": 2},
+        {"module": "redis", "self_us": 300, "cumulative_us": 420, "depth": 1},
+        {"module": "order.services.events", "self_us": 80, "cumulative_us": 500, "depth": 0},
+        {"module": "redis.asyncio", "self_us": 50, "cumulative_us": 50, "depth": 0},
+    ]
+
+
+def test__core__utils__get_import_times_by_package():
+    """Test that the import times are summed by top-level package, slowest first."""
+
+    assert get_import_times_by_package(parse_importtime(IMPORTTIME_OUTPUT)) == {"redis": 470, "order": 80}
@@ -0,0 +1,74 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from core.utils.databases import (
+    DB_CONNECTION_MODE__PER_REQUEST,
+    DB_CONNECTION_MODE__PERSISTENT,
+    DB_CONNECTION_MODE__POOLER,
+    advisory_lock,
+    apply_connection_mode,
+)
+
+DATABASE_CONFIG = {
+    "ENGINE": "django.db.backends.postgresql",
+    "NAME": "ayora",
+    "CONN_MAX_AGE": 600,
+    "CONN_HEALTH_CHECKS": True,
+    "OPTIONS": {"sslmode": "require"},
+}
+
+
+def test__core__utils__apply_connection_mode__persistent():
+    """Test that the persistent mode leaves the database config untouched."""
+
+    assert apply_connection_mode(DATABASE_CONFIG, DB_CONNECTION_MODE__PERSISTENT) == DATABASE_CONFIG
+
+
+def test__core__utils__apply_connection_mode__per_request():
+    """Test that the per request mode closes connections at the end of each request."""
+
+    config = apply_connection_mode(DATABASE_CONFIG, DB_CONNECTION_MODE__PER_REQUEST)
+
+    assert config["CONN_MAX_AGE"] == 0
+    assert config["CONN_HEALTH_CHECKS"] is False
+    assert DATABASE_CONFIG["CONN_MAX_AGE"] == 600
+
+
+def test__core__utils__apply_connection_mode__pooler():
+    """Test that the pooler mode keeps connections (to the pooler) open, without server-side cursors."""
+
+    config = apply_connection_mode(DATABASE_CONFIG, DB_CONNECTION_MODE__POOLER)
+
+    assert config["CONN_MAX_AGE"] == 600
+    assert config["DISABLE_SERVER_SIDE_CURSORS"] is True
+    assert config["OPTIONS"]["sslmode"] == "require"
+    assert "DISABLE_SERVER_SIDE_CURSORS" not in DATABASE_CONFIG
+
+
+def test__core__utils__apply_connection_mode__invalid():
+    """Test that an unknown connection mode is rejected."""
+
+    with pytest.raises(ImproperlyConfigured):
+        apply_connection_mode(DATABASE_CONFIG, "session")
+
+
+def test__core__utils__advisory_lock(db):
+    """Test that an advisory lock is only acquired by one holder at a time, and released at the end of its block."""
+
+    with advisory_lock(1):
+        with advisory_lock(1) as acquired, advisory_lock(2) as other_acquired:
+            assert not acquired
+            assert other_acquired
+
+    with advisory_lock(1) as acquired:
+        assert acquired
+
+
+def test__core__utils__advisory_lock__released_on_error(db):
+    """Test that an advisory lock is released when its block raises."""
+
+    with pytest.raises(RuntimeError), advisory_lock(1):
+        raise RuntimeError
+
+    with advisory_lock(1) as acquired:
+        assert acquired
@@ -0,0 +1,23 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+
+def test__core__query_budget__within(query_budget):
+    """Test that a block within its budget passes."""
+
+    with query_budget(1, max_time_ms=1000):
+        get_user_model().objects.exists()
+
+
+def test__core__query_budget__exceeded(query_budget):
+    """Test that a block exceeding its budget fails, listing the (formatted) offending queries."""
+
+    with pytest.raises(pytest.fail.Exception) as exc_info:
+        with query_budget(1):
+            get_user_model().objects.exists()
+            get_user_model().objects.count()
+
+    message = str(exc_info.value)
+    assert "2 queries executed, expected at most 1" in message
+    assert "1. " in message and "2. " in message
+    assert "COUNT" in message
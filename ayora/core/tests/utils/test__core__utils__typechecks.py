@@ -0,0 +1,60 @@
+import asyncio
+import inspect
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from typeguard import TypeCheckError
+
+from core.utils.typechecks import typechecked
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+async def aadd(a: int, b: int) -> int:
+    return a + b
+
+
+def test__core__utils__typechecked__full(settings):
+    """Test that every call is checked in `full` mode."""
+
+    settings.CORE__TYPECHECK_MODE = "full"
+
+    with pytest.raises(TypeCheckError):
+        typechecked(add)("1", "2")
+
+
+def test__core__utils__typechecked__off(settings):
+    """Test that the function is left untouched in `off` mode."""
+
+    settings.CORE__TYPECHECK_MODE = "off"
+
+    assert typechecked(add) is add
+    assert typechecked(add)("1", "2") == "12"
+
+
+@pytest.mark.parametrize("sample_rate, raises", [(0, False), (1, True)])
+def test__core__utils__typechecked__sampled(sample_rate, raises, settings):
+    """Test that only the sampled calls are checked in `sampled` mode, and async functions remain async."""
+
+    settings.CORE__TYPECHECK_MODE = "sampled"
+    settings.CORE__TYPECHECK_SAMPLE_RATE = sample_rate
+
+    if raises:
+        with pytest.raises(TypeCheckError):
+            typechecked(add)("1", "2")
+    else:
+        assert typechecked(add)("1", "2") == "12"
+
+    assert inspect.iscoroutinefunction(typechecked(aadd))
+    assert asyncio.run(typechecked(aadd)(1, 2)) == 3
+
+
+def test__core__utils__typechecked__invalid_mode(settings):
+    """Test that an unknown mode is reported as a misconfiguration."""
+
+    settings.CORE__TYPECHECK_MODE = "partial"
+
+    with pytest.raises(ImproperlyConfigured):
+        typechecked(add)
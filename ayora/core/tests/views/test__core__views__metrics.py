@@ -0,0 +1,41 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import AsyncClient
+from django.urls import reverse
+from prometheus_client import REGISTRY
+
+from core.middlewares.metrics import RequestMetricsMiddleware
+
+
+def test__core__view__metrics(api_client, db):
+    """Test that the metrics endpoint exposes the request latencies by route, and the scrape time metrics."""
+
+    _ = api_client.get(reverse("health"))
+
+    response = api_client.get(reverse("metrics"))
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+
+    metrics = response.content.decode()
+    assert 'ayora_http_request_duration_seconds_count{method="GET",route="health",status="204"}' in metrics
+    assert "ayora_db_connections{" in metrics
+    assert "ayora_db_max_connections " in metrics
+    assert 'ayora_celery_queue_depth{queue="celery"}' in metrics
+
+
+def test__core__view__metrics__async(db):
+    """Test that the latencies of requests made through the ASGI handler are observed too, without adapting them."""
+
+    async def get_response(request):
+        return HttpResponse()
+
+    assert iscoroutinefunction(RequestMetricsMiddleware(get_response))
+
+    labels = {"route": "health", "method": "GET", "status": "204"}
+    count = REGISTRY.get_sample_value("ayora_http_request_duration_seconds_count", labels) or 0
+
+    response = async_to_sync(AsyncClient().get)(reverse("health"))
+
+    assert response.status_code == 204
+    assert REGISTRY.get_sample_value("ayora_http_request_duration_seconds_count", labels) == count + 1
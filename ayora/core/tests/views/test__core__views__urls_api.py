@@ -0,0 +1,17 @@
+import pytest
+from django.urls import NoReverseMatch, reverse
+
+pytestmark = pytest.mark.urls("config.urls_api")
+
+
+def test__core__urls_api(api_client, db):
+    """Test that the API-only URLs (see `config.settings.api`) route the API, and only the API."""
+
+    response = api_client.get(reverse("health"))
+    assert response.status_code == 204
+
+    response = api_client.get(reverse("order:restaurant-orders"))
+    assert response.status_code == 200
+
+    with pytest.raises(NoReverseMatch):
+        reverse("swagger-ui")
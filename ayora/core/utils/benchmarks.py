@@ -0,0 +1,76 @@
+import re
+import statistics
+import subprocess
+from collections import defaultdict
+
+from django.conf import settings
+from django.test import override_settings
+
+
+def get_latency_stats(latencies: list[float], elapsed: float) -> dict:
+    """Summarise the latencies (in seconds) of a benchmark run, as throughput and percentiles (in milliseconds)."""
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p95_ms": round(quantiles[94] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+    }
+
+
+def get_git_commit() -> str | None:
+    """Return the current git commit (if any), to identify benchmark results."""
+
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def override_client_settings(**kwargs) -> override_settings:
+    """
+    Override the settings for in-process benchmark requests (i.e. through Django's test clients).
+
+    NOTE: the test clients use the `testserver` host, which is not otherwise allowed outside of tests.
+    """
+
+    return override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], **kwargs)
+
+
+# NOTE: e.g. `import time:       586 |     110445 |           requests`, times are in microseconds
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """
+    Parse the report written to stderr by `python -X importtime`, returning each imported module with its own
+    (`self_us`) and cumulative (`cumulative_us`, i.e. including the modules it imported first) import time.
+    """
+
+    modules = []
+    for line in output.splitlines():
+        if match := IMPORTTIME_LINE.match(line):
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append(
+                {
+                    "module": module,
+                    "self_us": int(self_us),
+                    "cumulative_us": int(cumulative_us),
+                    "depth": len(indent) // 2,
+                }
+            )
+    return modules
+
+
+def get_import_times_by_package(modules: list[dict]) -> dict[str, int]:
+    """Sum the (own) import time of the parsed modules by top-level package, slowest first."""
+
+    packages: dict[str, int] = defaultdict(int)
+    for module in modules:
+        packages[module["module"].split(".")[0]] += module["self_us"]
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
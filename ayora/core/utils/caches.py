@@ -0,0 +1,87 @@
+import hashlib
+import time
+from collections.abc import Mapping
+
+from django.core.cache import cache
+from django_redis.cache import RedisCache
+
+from core.utils.profiling import record_cache_lookup
+from core.utils.typechecks import typechecked
+
+CACHE_VERSION_KEY = "{namespace}:version"
+
+
+class ProfiledRedisCache(RedisCache):
+    """
+    The `django_redis` cache backend, recording the hits and misses of lookups against the profile of the current
+    request (see `RequestProfilingMiddleware`).
+
+    NOTE: the async lookups are covered too, as Django implements them (i.e. `aget`) on top of the sync ones.
+    """
+
+    def get(self, key, default=None, version=None, client=None):
+        value = super().get(key, self._missing_key, version=version, client=client)
+        hit = value is not self._missing_key
+        record_cache_lookup(hits=int(hit), misses=int(not hit))
+        return value if hit else default
+
+    def get_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        values = super().get_many(keys, version=version, client=client)
+        record_cache_lookup(hits=len(values), misses=len(keys) - len(values))
+        return values
+
+
+@typechecked
+def get_cache_version(namespace: str) -> int:
+    """
+    Return the current version of a cache namespace.
+
+    NOTE: versions are initialised from the current time (rather than `1`), so a version key that has
+    been evicted can never be re-initialised to a version that still has entries cached against it.
+    """
+
+    key = CACHE_VERSION_KEY.format(namespace=namespace)
+    return cache.get_or_set(key, time.time_ns(), timeout=None)
+
+
+@typechecked
+def bump_cache_version(namespace: str) -> None:
+    """Bump the version of a cache namespace, invalidating every entry cached against the previous version."""
+
+    key = CACHE_VERSION_KEY.format(namespace=namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # handle a missing (i.e. never initialised, or evicted) version
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+@typechecked
+def make_cache_key(namespace: str, version: int, params: Mapping, database: str | None = None) -> str:
+    """
+    Build a cache key for an entry of a versioned cache namespace, identified by (unordered) params.
+
+    NOTE: entries read from a database other than the primary (i.e. a lagging replica, see `get_read_database`) are
+    keyed apart, so they are never served to the clients reading from the primary (e.g. to read their own writes).
+    """
+
+    # handle multi-value params (i.e. query params)
+    if hasattr(params, "lists"):
+        items = sorted((str(key), sorted(map(str, values))) for key, values in params.lists())
+    else:
+        items = sorted((str(key), str(value)) for key, value in params.items())
+
+    digest = hashlib.md5(repr(items).encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    if database is not None:
+        return f"{namespace}:{version}:{database}:{digest}"
+    return f"{namespace}:{version}:{digest}"
+
+
+@typechecked
+async def aget_cache_version(namespace: str) -> int:
+    """Async variant of `get_cache_version`."""
+
+    key = CACHE_VERSION_KEY.format(namespace=namespace)
+    return await cache.aget_or_set(key, time.time_ns(), timeout=None)
@@ -1,4 +1,4 @@
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
 
 
 @typechecked
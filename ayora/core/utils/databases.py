@@ -0,0 +1,85 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# NOTE: connections are kept open (up to `CONN_MAX_AGE`) between requests, e.g. on long-running servers
+DB_CONNECTION_MODE__PERSISTENT = "persistent"
+
+# NOTE: connections are closed at the end of each request, so idle (e.g. serverless) containers never pin one
+DB_CONNECTION_MODE__PER_REQUEST = "per_request"
+
+# NOTE: connections are made to a pooler in transaction mode (e.g. PgBouncer), which lends a database connection
+# to each transaction rather than to each client, so clients can keep theirs open
+DB_CONNECTION_MODE__POOLER = "pooler"
+
+DB_CONNECTION_MODES = [DB_CONNECTION_MODE__PERSISTENT, DB_CONNECTION_MODE__PER_REQUEST, DB_CONNECTION_MODE__POOLER]
+
+
+def apply_connection_mode(config: dict, mode: str) -> dict:
+    """
+    Return a copy of a database config (i.e. an entry of `DATABASES`) set up for the given connection mode.
+
+    In `pooler` mode, consecutive transactions of a client may run on different database connections, so nothing
+    may span transactions on a connection:
+
+        - server-side cursors (i.e. `QuerySet.iterator()`) are disabled, as they are closed with their transaction.
+        - server-side prepared statements are disabled (psycopg 3 prepares repeated queries by default, while
+            psycopg2 never prepares them), as they are only known to the connection which prepared them.
+
+    NOTE: session state (e.g. `SET`) must not be relied upon either, so the database (or pooler) should default to
+    UTC, sparing Django from setting the time zone of each new connection.
+    """
+
+    if mode not in DB_CONNECTION_MODES:
+        raise ImproperlyConfigured(f"`DB_CONNECTION_MODE` must be one of {DB_CONNECTION_MODES}, got `{mode}`.")
+
+    config = {**config, "OPTIONS": {**config.get("OPTIONS", {})}}
+
+    if mode == DB_CONNECTION_MODE__PER_REQUEST:
+        config["CONN_MAX_AGE"] = 0
+        config["CONN_HEALTH_CHECKS"] = False
+
+    if mode == DB_CONNECTION_MODE__POOLER:
+        config["DISABLE_SERVER_SIDE_CURSORS"] = True
+        if _is_psycopg3():
+            config["OPTIONS"]["prepare_threshold"] = None
+            config["OPTIONS"]["server_side_binding"] = False
+
+    return config
+
+
+@contextmanager
+def advisory_lock(key: int, using: str = DEFAULT_DB_ALIAS) -> Iterator[bool]:
+    """
+    Try to take the (exclusive) Postgres advisory lock of a key for the duration of the block, yielding whether it
+    was acquired, i.e. whether no other process holds it.
+
+    The lock is taken within a transaction of its own, on a dedicated connection, which is held open for the block
+    and rolled back at its end, so the lock is released along with the transaction (even if the process dies, as the
+    connection is then dropped), and never by anyone else. Being bound to a transaction rather than to a session, it
+    works in every connection mode, as a pooler in transaction mode keeps a database connection for the whole of
+    the transaction.
+
+    NOTE: the transaction stays idle for the block, without holding a snapshot (at the default isolation level), so
+    it never holds back vacuum, yet the block should be shorter than `idle_in_transaction_session_timeout` (if set).
+    """
+
+    connection = connections.create_connection(using)
+    try:
+        connection.set_autocommit(False)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [key])
+            [acquired] = cursor.fetchone()
+        yield acquired
+    finally:
+        connection.close()
+
+
+def _is_psycopg3() -> bool:
+    try:
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+    except ImportError:
+        return False
+    return is_psycopg3
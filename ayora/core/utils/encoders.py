@@ -3,8 +3,8 @@ from decimal import Decimal
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
-from pydantic_core import Url
-from typeguard import typechecked
+
+from core.utils.typechecks import typechecked
 
 
 class LazyJsonEncoder(DjangoJSONEncoder):
@@ -18,6 +18,9 @@ class LazyJsonEncoder(DjangoJSONEncoder):
         # avoid circular imports
         from core.mixins.models import BaseModel
 
+        # NOTE: imported lazily, to keep `pydantic` off the startup path (i.e. cold starts)
+        from pydantic_core import Url
+
         # ...handle custom types if unable to serialize in a JSON field.
 
         # handle decimal objects
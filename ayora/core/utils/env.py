@@ -2,7 +2,8 @@ from enum import Enum
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from typeguard import typechecked
+
+from core.utils.typechecks import typechecked
 
 
 def env_to_enum(enum_cls: Enum, value: str) -> Enum:
@@ -8,10 +8,10 @@ from rest_framework.exceptions import APIException
 from rest_framework.exceptions import ValidationError as DrfValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
-from typeguard import typechecked
 
 from core.exceptions.core import StrategyException, ValidationError
 from core.utils.core import instance_but_not_subclass
+from core.utils.typechecks import typechecked
 
 logger = structlog.get_logger(__name__)
 
@@ -1,13 +1,14 @@
 import logging
 
-import pygments
-import sqlparse
-from pygments.formatters.terminal256 import TerminalTrueColorFormatter
-from pygments.lexers.sql import SqlLexer
-
 
 class SQLFormatter(logging.Formatter):
     def format(self, record):
+        # NOTE: imported lazily, as the formatter is configured on every startup but only used to debug queries
+        import pygments
+        import sqlparse
+        from pygments.formatters.terminal256 import TerminalTrueColorFormatter
+        from pygments.lexers.sql import SqlLexer
+
         sql = sqlparse.format(record.sql.strip(), reindent=True)
         record.statement = pygments.highlight(sql, SqlLexer(), TerminalTrueColorFormatter(style="monokai"))
         return super().format(record)
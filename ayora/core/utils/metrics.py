@@ -0,0 +1,112 @@
+import os
+
+import structlog
+from django.db import connection
+from prometheus_client import REGISTRY, CollectorRegistry, Histogram, multiprocess
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+logger = structlog.get_logger(__name__)
+
+# NOTE: buckets (in seconds) spanning cached reads (~1ms) to bulk placements (~1s)
+REQUEST_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+REQUEST_LATENCY = Histogram(
+    "ayora_http_request_duration_seconds",
+    "Latency of HTTP requests, by route (URL name), method and status code.",
+    ["route", "method", "status"],
+    buckets=REQUEST_LATENCY_BUCKETS,
+)
+
+
+def is_multiprocess() -> bool:
+    """
+    Whether metrics are aggregated across processes (e.g. gunicorn workers), i.e. `PROMETHEUS_MULTIPROC_DIR` is set.
+
+    NOTE: each process then writes its samples to (memory-mapped) files in that directory, rather than to its own
+    memory, and the directory must be emptied before the processes start.
+    """
+
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def get_metrics_registry(*collectors: Collector) -> CollectorRegistry:
+    """
+    Return the registry to expose metrics from, which aggregates the samples of every process in multiprocess mode,
+    with the given (scrape time) collectors registered.
+    """
+
+    if not is_multiprocess() and not collectors:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    if is_multiprocess():
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+
+    for collector in collectors:
+        registry.register(collector)
+
+    return registry
+
+
+def mark_process_dead(pid: int) -> None:
+    """Discard the live (i.e. gauge) samples of an exited process, in multiprocess mode."""
+
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
+
+
+class DatabaseConnectionsCollector(Collector):
+    """Collects the connections to the (default) database at scrape time, by state, along with the connection limit."""
+
+    def collect(self):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT COALESCE(state, 'unknown'), COUNT(*) FROM pg_stat_activity "
+                    "WHERE datname = current_database() GROUP BY 1"
+                )
+                states = cursor.fetchall()
+                cursor.execute("SELECT setting::int FROM pg_settings WHERE name = 'max_connections'")
+                max_connections = cursor.fetchone()[0]
+        except Exception:
+            logger.warning("metrics_collect_failed", collector="database_connections")
+            return
+
+        connections = GaugeMetricFamily(
+            "ayora_db_connections", "Connections to the database, by state.", labels=["state"]
+        )
+        for state, count in states:
+            connections.add_metric([state], count)
+        yield connections
+
+        yield GaugeMetricFamily("ayora_db_max_connections", "Connection limit of the database.", value=max_connections)
+
+
+class CeleryQueueCollector(Collector):
+    """Collects the depth (i.e. messages waiting) of the Celery queues at scrape time."""
+
+    def __init__(self, app, queues: list[str]) -> None:
+        self.app = app
+        self.queues = queues
+
+    def collect(self):
+        depth = GaugeMetricFamily("ayora_celery_queue_depth", "Messages waiting in a Celery queue.", labels=["queue"])
+
+        try:
+            with self.app.connection_for_read() as conn:
+                channel = conn.default_channel
+                for queue in self.queues:
+                    try:
+                        message_count = channel.queue_declare(queue=queue, passive=True).message_count
+                    except conn.channel_errors:
+                        # the queue has not been declared (i.e. no worker has consumed from it yet)
+                        message_count = 0
+                    depth.add_metric([queue], message_count)
+        except Exception:
+            logger.warning("metrics_collect_failed", collector="celery_queue")
+            return
+
+        yield depth
@@ -1,5 +1,8 @@
 from collections import OrderedDict
 
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
+
 from rest_framework.pagination import CursorPagination as DrfCursorPagination
 from rest_framework.pagination import LimitOffsetPagination as DrfLimitOffsetPagination
 from rest_framework.pagination import PageNumberPagination as DrfPageNumberPagination
@@ -68,6 +71,38 @@ class PageNumberPaginator(DrfPageNumberPagination):
         )
 
 
+class AsyncPageNumberPaginator(PageNumberPaginator):
+    """
+    A page number paginator which can also paginate a queryset using the async ORM (i.e. from an async view).
+
+    NOTE: the count is evaluated with `acount`, and assigned to Django's (cached) `Paginator.count`, so that
+    the page (and its links) can be resolved without further queries.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+
+        self.request = request
+        self.page.object_list = [obj async for obj in self.page.object_list]
+        return self.page.object_list
+
+
 class CursorPaginator(DrfCursorPagination):
     cursor_query_param = "cursor"  # default
     page_size_query_param = "size"
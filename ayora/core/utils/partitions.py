@@ -0,0 +1,121 @@
+import re
+from datetime import date, datetime
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+# NOTE: monthly partitions of a table are named after it (e.g. `order_order_p2026_10`), alongside a default
+# partition catching rows outside of every month created (which should stay empty, see `create_month_partitions`)
+MONTH_PARTITION_NAME = "{table}_p{year:04d}_{month:02d}"
+
+MONTH_PARTITION_NAME_REGEX = re.compile(r"_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+DEFAULT_PARTITION_NAME = "{table}_default"
+
+
+def get_month(value: date | datetime) -> date:
+    """Return the first day of the month of a date (or datetime, in its own time zone)."""
+
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month the given number of months after (or before) a month."""
+
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_months(start: date | datetime, end: date | datetime) -> list[date]:
+    """Return the first day of every month from `start` to `end` (both inclusive)."""
+
+    months, month = [], get_month(start)
+    while month <= get_month(end):
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def get_month_partition_name(table: str, month: date) -> str:
+    return MONTH_PARTITION_NAME.format(table=table, year=month.year, month=month.month)
+
+
+def create_month_partitions(connection: BaseDatabaseWrapper, table: str, months: list[date]) -> list[str]:
+    """
+    Create the (missing) monthly partitions of a table partitioned by range (on a `timestamptz` column), along with
+    its default partition, returning the names of the partitions created.
+
+    Month bounds are in UTC, and each partition inherits the indexes and constraints of the table.
+
+    NOTE: a month cannot be created once the default partition holds rows of it, so months should be created ahead
+    of time (i.e. before any of their rows are inserted).
+    """
+
+    created, existing = [], set(get_partitions(connection, table))
+    with connection.cursor() as cursor:
+        for month in months:
+            name = get_month_partition_name(table, month)
+            if name in existing:
+                continue
+
+            # NOTE: DDL cannot be parametrized (server-side), the bounds being dates they are inlined
+            lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+            cursor.execute(
+                f"CREATE TABLE {connection.ops.quote_name(name)} PARTITION OF {connection.ops.quote_name(table)} "
+                f"FOR VALUES FROM ('{lower} 00:00:00+00') TO ('{upper} 00:00:00+00')"
+            )
+            created.append(name)
+
+        default = DEFAULT_PARTITION_NAME.format(table=table)
+        if default not in existing:
+            cursor.execute(
+                f"CREATE TABLE {connection.ops.quote_name(default)} PARTITION OF {connection.ops.quote_name(table)} "
+                "DEFAULT"
+            )
+            created.append(default)
+
+    return created
+
+
+def get_partitions(connection: BaseDatabaseWrapper, table: str) -> list[str]:
+    """Return the names of the (attached) partitions of a table."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s AND parent.relnamespace = to_regnamespace(current_schema()) "
+            "ORDER BY child.relname",
+            [table],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+def get_month_partitions(connection: BaseDatabaseWrapper, table: str) -> dict[str, date]:
+    """Return the (attached) monthly partitions of a table, with their month."""
+
+    partitions = {}
+    for name in get_partitions(connection, table):
+        if match := MONTH_PARTITION_NAME_REGEX.search(name):
+            partitions[name] = date(int(match["year"]), int(match["month"]), 1)
+    return partitions
+
+
+def detach_partition(
+    connection: BaseDatabaseWrapper, table: str, partition: str, foreign_keys: list[str] | None = None
+) -> None:
+    """
+    Detach a partition from its table, leaving it as a standalone table (e.g. to be archived, or dropped).
+
+    Foreign keys of the table (to other partitioned tables) are dropped from the detached partition, so the rows it
+    referenced can in turn be detached.
+
+    NOTE: detaching takes a (brief) `ACCESS EXCLUSIVE` lock on the table, as it cannot be done `CONCURRENTLY` while a
+    default partition exists.
+    """
+
+    with connection.cursor() as cursor:
+        quoted = connection.ops.quote_name(partition)
+        cursor.execute(f"ALTER TABLE {connection.ops.quote_name(table)} DETACH PARTITION {quoted}")
+        for foreign_key in foreign_keys or []:
+            cursor.execute(f"ALTER TABLE {quoted} DROP CONSTRAINT IF EXISTS {connection.ops.quote_name(foreign_key)}")
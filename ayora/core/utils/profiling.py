@@ -0,0 +1,123 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from celery.signals import after_task_publish, before_task_publish
+
+
+@dataclass
+class RequestProfile:
+    """The timing breakdown of a request (durations in milliseconds), collected by `RequestProfilingMiddleware`."""
+
+    total_ms: float = 0.0
+    db_queries: int = 0
+    db_ms: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    serializer_ms: float = 0.0
+    render_ms: float = 0.0
+    celery_tasks: int = 0
+    celery_enqueue_ms: float = 0.0
+
+    # NOTE: nesting depth and start time of the stages being timed, so nested stages are only timed once
+    stages: dict[str, tuple[int, float]] = field(default_factory=dict, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("stages")
+        return {name: round(value, 3) if isinstance(value, float) else value for name, value in data.items()}
+
+
+_profile: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+def get_request_profile() -> RequestProfile | None:
+    """Return the profile of the current request, if it is being profiled."""
+
+    return _profile.get()
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """Profile the block as a request, i.e. collect the stages timed within it (see `profile_stage`)."""
+
+    profile = RequestProfile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+
+def start_stage(name: str) -> None:
+    """Start timing a stage (e.g. `serializer`) of the current request, which is a no-op when not profiling."""
+
+    if (profile := _profile.get()) is None:
+        return
+
+    depth, started = profile.stages.get(name, (0, 0.0))
+    profile.stages[name] = (depth + 1, time.perf_counter() if depth == 0 else started)
+
+
+def stop_stage(name: str) -> None:
+    """Stop timing a stage of the current request, adding its duration to the `<name>_ms` of the profile."""
+
+    if (profile := _profile.get()) is None or name not in profile.stages:
+        return
+
+    depth, started = profile.stages.pop(name)
+    if depth > 1:
+        profile.stages[name] = (depth - 1, started)
+        return
+
+    attr = f"{name}_ms"
+    setattr(profile, attr, getattr(profile, attr) + (time.perf_counter() - started) * 1000)
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """Time a stage of the current request (see `start_stage`), e.g. `with profile_stage("serializer"): ...`."""
+
+    start_stage(name)
+    try:
+        yield
+    finally:
+        stop_stage(name)
+
+
+def record_cache_lookup(*, hits: int, misses: int) -> None:
+    """Record the hits and misses of a cache lookup against the current request."""
+
+    if (profile := _profile.get()) is not None:
+        profile.cache_hits += hits
+        profile.cache_misses += misses
+
+
+class QueryProfiler:
+    """A database execute wrapper (see `connection.execute_wrapper`) counting and timing the queries of a request."""
+
+    def __init__(self, profile: RequestProfile) -> None:
+        self.profile = profile
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.profile.db_queries += 1
+            self.profile.db_ms += (time.perf_counter() - started) * 1000
+
+
+@before_task_publish.connect
+def _start_task_publish(**kwargs: Any) -> None:
+    start_stage("celery_enqueue")
+
+
+@after_task_publish.connect
+def _stop_task_publish(**kwargs: Any) -> None:
+    if (profile := _profile.get()) is not None:
+        profile.celery_tasks += 1
+    stop_stage("celery_enqueue")
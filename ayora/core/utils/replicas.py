@@ -0,0 +1,60 @@
+import time
+from contextvars import ContextVar, Token
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+# NOTE: the pin is the time (as a UNIX timestamp) until which a client reads from the primary, sent back
+# by clients either as a cookie (i.e. browsers) or as a header
+REPLICA_PIN_COOKIE = "primary_pin"
+
+REPLICA_PIN_HEADER = "X-Primary-Pin"
+
+_read_database: ContextVar[str | None] = ContextVar("read_database", default=None)
+
+
+def get_replica_database() -> str | None:
+    """Return the alias of the read replica (i.e. `CORE__REPLICA_DATABASE`), if one is configured."""
+
+    return settings.CORE__REPLICA_DATABASE
+
+
+def get_read_database() -> str | None:
+    """Return the alias reads are routed to in the current context, if not the primary."""
+
+    return _read_database.get()
+
+
+def set_read_database(alias: str | None) -> Token:
+    """Route the reads of the current context to the given alias, until reset (see `reset_read_database`)."""
+
+    return _read_database.set(alias)
+
+
+def reset_read_database(token: Token) -> None:
+    _read_database.reset(token)
+
+
+def is_pinned_to_primary(request: HttpRequest) -> bool:
+    """Whether a client wrote recently, so must read its own writes from the primary (i.e. ahead of the replica)."""
+
+    pin = request.headers.get(REPLICA_PIN_HEADER) or request.COOKIES.get(REPLICA_PIN_COOKIE)
+    try:
+        return float(pin) > time.time()
+    except (TypeError, ValueError):
+        return False
+
+
+def pin_to_primary(request: HttpRequest, response: HttpResponse) -> None:
+    """Pin a client to the primary for `CORE__REPLICA_PIN_SECONDS` (i.e. longer than the replica may lag)."""
+
+    pin = str(int(time.time()) + settings.CORE__REPLICA_PIN_SECONDS)
+    response.headers[REPLICA_PIN_HEADER] = pin
+    response.set_cookie(
+        REPLICA_PIN_COOKIE,
+        pin,
+        max_age=settings.CORE__REPLICA_PIN_SECONDS,
+        secure=request.is_secure(),
+        httponly=True,
+        samesite="Lax",
+    )
@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.response import Response
-from typeguard import typechecked
+
+from core.utils.typechecks import typechecked
 
 
 @typechecked
@@ -2,9 +2,9 @@ from itertools import chain
 
 from django.db import models
 from rest_framework import serializers
-from typeguard import typechecked
 
 from core.types.models import DjangoModelType
+from core.utils.typechecks import typechecked
 
 
 @typechecked
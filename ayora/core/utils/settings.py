@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from typeguard import typechecked
+
+from core.utils.typechecks import typechecked
 
 
 @typechecked
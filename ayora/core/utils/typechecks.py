@@ -0,0 +1,82 @@
+import functools
+import inspect
+import random
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+T_CallableOrType = TypeVar("T_CallableOrType", bound=Callable[..., Any])
+
+TYPECHECK_MODE__FULL = "full"
+TYPECHECK_MODE__SAMPLED = "sampled"
+TYPECHECK_MODE__OFF = "off"
+
+TYPECHECK_MODES = [TYPECHECK_MODE__FULL, TYPECHECK_MODE__SAMPLED, TYPECHECK_MODE__OFF]
+
+
+def get_typecheck_mode() -> str:
+    """
+    Return the configured runtime type checking mode (i.e. the `CORE__TYPECHECK_MODE` setting).
+
+    NOTE: decorated modules may be imported before the settings are configured (e.g. by tooling), in which
+    case the checks are kept.
+    """
+
+    try:
+        mode = getattr(settings, "CORE__TYPECHECK_MODE", TYPECHECK_MODE__FULL)
+    except ImproperlyConfigured:
+        return TYPECHECK_MODE__FULL
+
+    if mode not in TYPECHECK_MODES:
+        raise ImproperlyConfigured(f"`CORE__TYPECHECK_MODE` must be one of {TYPECHECK_MODES}, got `{mode}`.")
+    return mode
+
+
+def typechecked(target: T_CallableOrType) -> T_CallableOrType:
+    """
+    Drop-in replacement for `typeguard.typechecked`, which honours the configured type checking mode:
+
+        - `full`: arguments and return values are checked on every call (i.e. `typeguard.typechecked`).
+        - `sampled`: only a fraction of function calls are checked (i.e. `CORE__TYPECHECK_SAMPLE_RATE`).
+        - `off`: the function is returned as is, with no overhead at all.
+
+    NOTE: the mode is resolved once, when the function is decorated (i.e. on import), so switching modes
+    requires a restart.
+    """
+
+    mode = get_typecheck_mode()
+
+    if mode == TYPECHECK_MODE__OFF:
+        return target
+
+    # NOTE: imported lazily, so `typeguard` is never imported when the checks are off (i.e. in production)
+    import typeguard
+
+    checked = typeguard.typechecked(target)
+
+    # NOTE: classes are checked in full, when sampled (as only the calls to functions can be sampled)
+    if mode == TYPECHECK_MODE__FULL or inspect.isclass(target):
+        return checked
+
+    sample_rate = settings.CORE__TYPECHECK_SAMPLE_RATE
+
+    # handle async functions (i.e. keep them detectable as such)
+    if inspect.iscoroutinefunction(target):
+
+        @functools.wraps(target)
+        async def asampled(*args: Any, **kwargs: Any) -> Any:
+            if random.random() < sample_rate:
+                return await checked(*args, **kwargs)
+            return await target(*args, **kwargs)
+
+        return asampled  # type: ignore[return-value]
+
+    @functools.wraps(target)
+    def sampled(*args: Any, **kwargs: Any) -> Any:
+        if random.random() < sample_rate:
+            return checked(*args, **kwargs)
+        return target(*args, **kwargs)
+
+    return sampled  # type: ignore[return-value]
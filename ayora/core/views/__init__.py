@@ -1 +1,2 @@
 from .health import HealthCheckView
+from .metrics import MetricsView
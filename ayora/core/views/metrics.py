@@ -0,0 +1,23 @@
+from config.celery import app
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from ..utils.metrics import CeleryQueueCollector, DatabaseConnectionsCollector, get_metrics_registry
+
+
+class MetricsView(View):
+    """
+    Exposes the metrics of the service in the Prometheus text format, aggregated across (gunicorn) workers in
+    multiprocess mode.
+
+    NOTE: the database connections and Celery queue depths are collected at scrape time.
+    """
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        registry = get_metrics_registry(
+            DatabaseConnectionsCollector(),
+            CeleryQueueCollector(app, queues=settings.CORE__METRICS_CELERY_QUEUES),
+        )
+        return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -1 +1,28 @@
-from .orders import ORDER__ACCEPTED_SOURCE_STATES, ORDER__AUTO_REJECT_MINUTES, ORDER__REJECTED_SOURCE_STATES
+from .orders import (
+    ORDER__ACCEPTED_SOURCE_STATES,
+    ORDER__ARCHIVE_BATCH_SIZE,
+    ORDER__ARCHIVE_DIRECTORY_NAME,
+    ORDER__ARCHIVE_FILE_IDS,
+    ORDER__ARCHIVE_FILE_NAME,
+    ORDER__ARCHIVE_LOCK_KEY,
+    ORDER__ARCHIVE_MAX_BATCHES,
+    ORDER__AUTO_REJECT_CACHE_KEY,
+    ORDER__AUTO_REJECT_MINUTES,
+    ORDER__AUTO_REJECT_WINDOW_SECONDS,
+    ORDER__BULK_PLACE_MAX_SIZE,
+    ORDER__BULK_REJECT_BATCH_SIZE,
+    ORDER__DEFAULT_PREFETCH,
+    ORDER__EVENTS_CHANNEL,
+    ORDER__EVENTS_HEARTBEAT_SECONDS,
+    ORDER__EVENTS_STREAM_MAX_SECONDS,
+    ORDER__LIST_CACHE_NAMESPACE,
+    ORDER__LIST_CACHE_TIMEOUT,
+    ORDER__METRIC_EVENTS,
+    ORDER__PARTITION_FOREIGN_KEY,
+    ORDER__PARTITION_MONTHS_AHEAD,
+    ORDER__REFUNDS_FEED_DEFAULT_SIZE,
+    ORDER__REFUNDS_FEED_LAG_SECONDS,
+    ORDER__REFUNDS_FEED_MAX_SIZE,
+    ORDER__REJECTED_SOURCE_STATES,
+    ORDER__STALE_SWEEP_LOOKBACK_DAYS,
+)
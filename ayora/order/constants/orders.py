@@ -5,3 +5,76 @@ ORDER__ACCEPTED_SOURCE_STATES = [OrderStatus.PLACED]
 ORDER__REJECTED_SOURCE_STATES = [OrderStatus.PLACED]
 
 ORDER__AUTO_REJECT_MINUTES = 5
+
+# NOTE: related objects prefetched by `order__list` unless the caller provides its own plan
+ORDER__DEFAULT_PREFETCH = ["orderitems", "orderpayments"]
+
+# NOTE: upper bound of rows locked and rejected per statement by the set-based rejection path,
+# keeps each transaction short when a large backlog of stale orders has built up
+ORDER__BULK_REJECT_BATCH_SIZE = 1000
+
+# NOTE: orders placed within the same window share a single targeted auto-rejection task,
+# collapsing bursts of placements into a handful of scheduled tasks
+ORDER__AUTO_REJECT_WINDOW_SECONDS = 15
+
+ORDER__AUTO_REJECT_CACHE_KEY = "order:auto-reject:{window_start}"
+
+# NOTE: refunds only become visible to the incremental feed once their rejection is older than this lag,
+# so rejections committed out of timestamp order (e.g. concurrent transactions) are never skipped by a watermark
+ORDER__REFUNDS_FEED_LAG_SECONDS = 5
+
+ORDER__REFUNDS_FEED_DEFAULT_SIZE = 100
+
+ORDER__REFUNDS_FEED_MAX_SIZE = 1000
+
+# NOTE: cached order list pages are invalidated (by bumping the namespace version) whenever an order changes,
+# the timeout only bounds how long unused versions linger
+ORDER__LIST_CACHE_NAMESPACE = "order:list"
+
+ORDER__LIST_CACHE_TIMEOUT = 60 * 5
+
+# NOTE: order events (i.e. placements and status changes) are published to this Redis pub/sub channel,
+# and streamed to restaurants as server-sent events
+ORDER__EVENTS_CHANNEL = "order:events"
+
+ORDER__EVENTS_HEARTBEAT_SECONDS = 15
+
+# NOTE: streams are closed (and re-established by the client) periodically, to bound connection lifetimes
+ORDER__EVENTS_STREAM_MAX_SECONDS = 60 * 5
+
+# NOTE: upper bound on the orders placed by a single bulk request, so each batch is persisted in a bounded transaction
+ORDER__BULK_PLACE_MAX_SIZE = 500
+
+# NOTE: label values of the `ayora_orders_total` counter (see `order.services.metrics`)
+ORDER__METRIC_EVENTS = ("placed", "accepted", "rejected", "auto_rejected")
+
+# NOTE: the order tables are partitioned by month of placement (see `order/migrations/0005_partitioning.py`), with
+# partitions created this many months ahead (i.e. before any of their orders are placed) by a daily task
+ORDER__PARTITION_MONTHS_AHEAD = 3
+
+# NOTE: foreign keys of the order item and payment tables to the orders table, by model name
+ORDER__PARTITION_FOREIGN_KEY = "order__{model_name}__order_fk"
+
+# NOTE: lower bound on the placement time of the orders swept as stale, so the sweep only touches recent partitions
+ORDER__STALE_SWEEP_LOOKBACK_DAYS = 31
+
+# NOTE: finalised orders are archived in batches (each in its own short transaction), bounded per run so a backlog is
+# drained over several runs rather than by a single long-running task
+ORDER__ARCHIVE_BATCH_SIZE = 500
+
+ORDER__ARCHIVE_MAX_BATCHES = 100
+
+# NOTE: archive directories each hold the orders of a month within a fixed range of ids, named after its first and
+# last ids (zero-padded, so they sort in order), in the `ORDER__ARCHIVE_STORAGE` storage, so the directory an order is
+# archived to never depends on the batch it is archived in
+ORDER__ARCHIVE_DIRECTORY_NAME = "orders/{month}/{first_id:012d}-{last_id:012d}"
+
+# NOTE: archive files (gzipped newline-delimited JSON) are named after the time they are written at, as the orders of
+# a directory are rewritten to a new file, before its previous file is deleted
+ORDER__ARCHIVE_FILE_NAME = "{directory}/{version}.ndjson.gz"
+
+ORDER__ARCHIVE_FILE_IDS = 1000
+
+# NOTE: key of the (Postgres) advisory lock held by the archival run in progress, as concurrent runs could overwrite
+# each other's files, unique across the application (see `core.utils.databases.advisory_lock`)
+ORDER__ARCHIVE_LOCK_KEY = 1_001
@@ -1 +1,2 @@
+from .events import OrderEvent
 from .orders import OrderStatus
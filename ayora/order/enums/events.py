@@ -0,0 +1,9 @@
+from core.mixins.enums import BaseTextChoices
+from django.utils.translation import gettext_lazy as _
+
+
+class OrderEvent(BaseTextChoices):
+    PLACED = "placed", _("Placed")
+    UPDATED = "updated", _("Updated")
+    ACCEPTED = "accepted", _("Accepted")
+    REJECTED = "rejected", _("Rejected")
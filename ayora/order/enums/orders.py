@@ -1,8 +1,8 @@
 from typing import Union
 
 from core.mixins.enums import BaseTextChoices
+from core.utils.typechecks import typechecked
 from django.utils.translation import gettext_lazy as _
-from typeguard import typechecked
 
 
 class OrderStatus(BaseTextChoices):
@@ -0,0 +1 @@
+from .orders import OrderTransitionConflictError
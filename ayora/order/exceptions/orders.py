@@ -0,0 +1,11 @@
+from core.mixins.exceptions import BaseException
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+
+
+class OrderTransitionConflictError(BaseException):
+    """Order transition conflict exception (i.e. the order was transitioned concurrently)."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "order_transition_conflict"
+    default_detail = _("The order has already been finalised by another action.")
@@ -8,9 +8,27 @@ class OrderFilter(BaseFilter):
     status = filters.CharFilter(
         field_name="status",
         help_text="Order status.",
-        lookup_expr="iexact",
+        method="filter_status",
+    )
+    # NOTE: orders are partitioned by month of placement, so bounding it limits the partitions scanned
+    ordered_after = filters.IsoDateTimeFilter(
+        field_name="created_at",
+        lookup_expr="gte",
+        help_text="Only orders placed at or after this date and time (ISO 8601).",
+    )
+    ordered_before = filters.IsoDateTimeFilter(
+        field_name="created_at",
+        lookup_expr="lt",
+        help_text="Only orders placed before this date and time (ISO 8601).",
     )
 
     class Meta:
         model = Order
-        fields = ["status"]
+        fields = ["status", "ordered_after", "ordered_before"]
+
+    def filter_status(self, queryset, name, value):
+        """Filter by status (case-insensitive)."""
+
+        # NOTE: statuses are stored in lowercase, so normalise the value instead of using `iexact`
+        # (i.e. `UPPER(status)`), which would prevent the status indexes from being used
+        return queryset.filter(**{name: value.lower()})
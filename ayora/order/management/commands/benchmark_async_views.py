@@ -0,0 +1,119 @@
+import asyncio
+import json
+import time
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from core.utils.benchmarks import get_latency_stats, override_client_settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+from django.test import AsyncClient, Client
+from django.urls import include, path
+
+from order.urls import get_urlpatterns
+
+
+def get_urlconf(*, asynchronous: bool) -> types.ModuleType:
+    """Build an (in-memory) URL conf, routing the order endpoints to their sync or async variants."""
+
+    urlconf = types.ModuleType(f"benchmark_urls_{'async' if asynchronous else 'sync'}")
+    urlconf.urlpatterns = [path("", include((get_urlpatterns(asynchronous=asynchronous), "order")))]
+    return urlconf
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark the sync (WSGI) order views against their async (ASGI) variants, at a given concurrency.
+
+    Requests are made in-process, through Django's WSGI handler from a pool of threads for the sync views,
+    and through Django's ASGI handler from a single event loop for the async views (as served by
+    `config.wsgi` and `config.asgi` respectively), against the configured database and cache.
+
+    NOTE: orders are placed in the configured database, so this is meant for development databases only.
+    """
+
+    routes = {
+        "place": ("post", "/customers/{customer_id}/orders"),
+        "list": ("get", "/restaurant/orders"),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("--route", choices=list(self.routes), default="place")
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument("--output", help="Append the results (as JSON lines) to the given file.")
+
+    def get_request(self, route: str) -> tuple[str, str, dict]:
+        method, url = self.routes[route]
+        if method == "post":
+            data = {"menuItems": [{"itemId": "item1", "quantity": 1}], "paymentInfoId": str(uuid.uuid4())}
+            return method, url.format(customer_id=uuid.uuid4().hex), data
+        return method, url, {}
+
+    def run_sync(self, route: str, requests: int, concurrency: int) -> dict:
+        """Make the requests through the WSGI handler, from a pool of threads."""
+
+        def send(_) -> float:
+            method, url, data = self.get_request(route)
+            started = time.perf_counter()
+            response = getattr(Client(), method)(url, data, content_type="application/json")
+            assert response.status_code < 400, response.content
+            return time.perf_counter() - started
+
+        def send_and_close(index) -> float:
+            try:
+                return send(index)
+            finally:
+                connections.close_all()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = list(executor.map(send_and_close, range(requests)))
+        return get_latency_stats(latencies, time.perf_counter() - started)
+
+    def run_async(self, route: str, requests: int, concurrency: int) -> dict:
+        """Make the requests through the ASGI handler, from a single event loop."""
+
+        async def run() -> dict:
+            semaphore = asyncio.Semaphore(concurrency)
+            client = AsyncClient()
+
+            async def send() -> float:
+                async with semaphore:
+                    method, url, data = self.get_request(route)
+                    started = time.perf_counter()
+                    response = await getattr(client, method)(url, data, content_type="application/json")
+                    assert response.status_code < 400, response.content
+                    return time.perf_counter() - started
+
+            started = time.perf_counter()
+            latencies = await asyncio.gather(*(send() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+            await sync_to_async(close_old_connections)()
+            return get_latency_stats(list(latencies), elapsed)
+
+        return asyncio.run(run())
+
+    def handle(self, *args, **options):
+        route, requests, concurrency = options["route"], options["requests"], options["concurrency"]
+
+        results = []
+        for asynchronous in (False, True):
+            with override_client_settings(ROOT_URLCONF=get_urlconf(asynchronous=asynchronous)):
+                runner = self.run_async if asynchronous else self.run_sync
+                stats = runner(route, requests, concurrency)
+
+            result = {
+                "mode": "async-asgi" if asynchronous else "sync-wsgi",
+                "route": route,
+                "concurrency": concurrency,
+                **stats,
+            }
+            results.append(result)
+            self.stdout.write(json.dumps(result))
+
+        if options["output"]:
+            with open(options["output"], "a") as file:
+                file.writelines(json.dumps(result) + "\n" for result in results)
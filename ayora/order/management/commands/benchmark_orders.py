@@ -0,0 +1,258 @@
+import json
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from core.utils.benchmarks import get_git_commit, get_latency_stats, override_client_settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from order.enums import OrderStatus
+from order.models import Order, OrderItem, OrderPayment
+from order.serializers import RefundsFeedRequestSerializer
+from order.services import order__create__partitions, order__handle__stale_orders
+
+# NOTE: a request is described by its method, URL and (JSON) body
+Request = tuple[str, str, dict]
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark the order API, reporting the throughput, latency percentiles and queries per request of each route
+    in `order/urls.py`, as well as the duration of the stale order sweep.
+
+    Optionally seeds the configured database first (see `--seed`), with orders spread over `--seed-days`
+    (mostly finalised, with a recent tail of placed orders), each with its items and payment.
+    Requests are made in-process through Django's WSGI handler, against the configured database and cache,
+    e.g. the `db` and `redis` services from `compose.yaml`.
+
+    NOTE: the benchmark writes to the configured database (it places, updates and rejects orders),
+    so is meant for development databases only.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0, help="Number of orders to seed before benchmarking.")
+        parser.add_argument("--seed-days", type=int, default=90)
+        parser.add_argument("--seed-batch-size", type=int, default=100_000)
+        parser.add_argument("--items-per-order", type=int, default=3)
+        parser.add_argument("--requests", type=int, default=200, help="Number of requests per route.")
+        parser.add_argument("--concurrency", type=int, default=1)
+        parser.add_argument("--routes", nargs="*", help="Only benchmark the given routes (by URL name).")
+        parser.add_argument("--output", help="Write the results (as JSON) to the given file.")
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            self.seed(
+                count=options["seed"],
+                days=options["seed_days"],
+                batch_size=options["seed_batch_size"],
+                items_per_order=options["items_per_order"],
+            )
+
+        if not Order.objects.exists():
+            raise CommandError("No orders to benchmark against, seed some first (i.e. `--seed`).")
+
+        scenarios = self.get_scenarios(options["requests"])
+        if options["routes"]:
+            scenarios = {name: scenario for name, scenario in scenarios.items() if name in options["routes"]}
+
+        results = []
+        with override_client_settings():
+            for name, build_request in scenarios.items():
+                result = {"route": name, **self.run(build_request, options["requests"], options["concurrency"])}
+                results.append(result)
+                self.stdout.write(json.dumps(result))
+
+        result = {"route": "stale-sweep", **self.run_stale_sweep()}
+        results.append(result)
+        self.stdout.write(json.dumps(result))
+
+        if options["output"]:
+            report = {
+                "commit": get_git_commit(),
+                "created_at": timezone.now().isoformat(),
+                "orders": Order.objects.count(),
+                "concurrency": options["concurrency"],
+                "results": results,
+            }
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+    def seed(self, *, count: int, days: int, batch_size: int, items_per_order: int) -> None:
+        """
+        Seed orders (with their items and payments) in batches, generated in the database (i.e. `generate_series`).
+
+        Orders are spread over the given number of days, 90% accepted and 7% rejected, while the remaining 3%
+        are placed in the last 10 minutes (so roughly half of them are stale).
+        """
+
+        # the months seeded must be partitioned before their orders are inserted
+        order__create__partitions(since=timezone.now() - timedelta(days=days))
+
+        tables = {
+            "order": connection.ops.quote_name(Order._meta.db_table),
+            "item": connection.ops.quote_name(OrderItem._meta.db_table),
+            "payment": connection.ops.quote_name(OrderPayment._meta.db_table),
+        }
+
+        seeded = 0
+        while seeded < count:
+            size = min(batch_size, count - seeded)
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {tables['order']}")
+                last_id = cursor.fetchone()[0]
+
+                cursor.execute(
+                    f"""
+                    INSERT INTO {tables["order"]}
+                        (uid, created_at, updated_at, customer_id, status, accepted_at, rejected_at)
+                    SELECT
+                        gen_random_uuid(), ts, ts, 'customer' || (n %% 10000), status,
+                        CASE WHEN status = %(accepted)s THEN ts + interval '1 minute' END,
+                        CASE WHEN status = %(rejected)s THEN ts + interval '5 minutes' END
+                    FROM (
+                        SELECT
+                            n,
+                            CASE WHEN r < 0.97 THEN now() - random() * %(span)s * interval '1 second'
+                                ELSE now() - random() * interval '10 minutes' END AS ts,
+                            CASE WHEN r < 0.9 THEN %(accepted)s WHEN r < 0.97 THEN %(rejected)s
+                                ELSE %(placed)s END AS status
+                        FROM (SELECT n, random() AS r FROM generate_series(1, %(size)s) n) generated
+                    ) orders
+                    """,
+                    {
+                        "size": size,
+                        "span": days * 24 * 60 * 60,
+                        "accepted": str(OrderStatus.ACCEPTED),
+                        "rejected": str(OrderStatus.REJECTED),
+                        "placed": str(OrderStatus.PLACED),
+                    },
+                )
+                cursor.execute(
+                    f"""
+                    INSERT INTO {tables["item"]}
+                        (uid, created_at, updated_at, order_id, order_created_at, item_id, quantity)
+                    SELECT
+                        gen_random_uuid(), o.created_at, o.created_at, o.id, o.created_at, 'item' || i,
+                        1 + (random() * 4)::int
+                    FROM {tables["order"]} o CROSS JOIN generate_series(1, %(items)s) i
+                    WHERE o.id > %(last_id)s
+                    """,
+                    {"items": items_per_order, "last_id": last_id},
+                )
+                cursor.execute(
+                    f"""
+                    INSERT INTO {tables["payment"]}
+                        (uid, created_at, updated_at, order_id, order_created_at, payment_info_id)
+                    SELECT gen_random_uuid(), o.created_at, o.created_at, o.id, o.created_at, 'payment' || o.id
+                    FROM {tables["order"]} o
+                    WHERE o.id > %(last_id)s
+                    """,
+                    {"last_id": last_id},
+                )
+
+            seeded += size
+            self.stderr.write(f"Seeded {seeded}/{count} orders")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {tables['order']}, {tables['item']}, {tables['payment']}")
+
+    def get_scenarios(self, requests: int) -> dict[str, Callable[[int], Request]]:
+        """Return a request builder (by request index) for each benchmarked route (by URL name)."""
+
+        # NOTE: recent placed orders, which are transitioned (once each) or added to
+        placed = list(
+            Order.objects.filter(status=OrderStatus.PLACED)
+            .order_by("-created_at")
+            .values_list("uid", "customer_id")[: requests * 2]
+        )
+        accepted, added = placed[:requests], placed[requests:] or placed
+
+        latest_refund = RefundsFeedRequestSerializer.encode_watermark(timezone.now(), 0)
+        menu_items = [{"itemId": f"item{i}", "quantity": 1} for i in range(3)]
+
+        def place(index: int) -> Request:
+            url = reverse("order:customer-orders", kwargs={"customerId": f"customer{index}"})
+            return "post", url, {"menuItems": menu_items, "paymentInfoId": str(uuid.uuid4())}
+
+        def add_items(index: int) -> Request:
+            uid, customer_id = added[index % len(added)]
+            url = reverse("order:customer-order", kwargs={"customerId": customer_id, "orderId": uid})
+            return "patch", url, {"menuItems": menu_items[:1], "paymentInfoId": str(uuid.uuid4())}
+
+        def list_orders(index: int) -> Request:
+            params = random.choice(["", "status=placed", "status=accepted", "pagination=cursor"])
+            return "get", f"{reverse('order:restaurant-orders')}?{params}&page={random.randint(1, 50)}", {}
+
+        def accept(index: int) -> Request:
+            uid, _ = accepted[index % len(accepted)]
+            return "patch", reverse("order:restaurant-order", kwargs={"orderId": uid}), {"action": "accept"}
+
+        def place_bulk(index: int) -> Request:
+            orders = [
+                {"customerId": f"customer{index}", "menuItems": menu_items, "paymentInfoId": str(uuid.uuid4())}
+                for _ in range(50)
+            ]
+            return "post", reverse("order:partner-orders"), {"orders": orders}
+
+        def list_refunds(index: int) -> Request:
+            return "get", f"{reverse('order:internal-refunds')}?page={random.randint(1, 50)}", {}
+
+        def poll_refunds(index: int) -> Request:
+            return "get", f"{reverse('order:internal-refunds')}?since={latest_refund}", {}
+
+        return {
+            "customer-orders": place,
+            "customer-order": add_items,
+            "restaurant-orders": list_orders,
+            "restaurant-order": accept,
+            "partner-orders": place_bulk,
+            "internal-refunds": list_refunds,
+            "internal-refunds-feed": poll_refunds,
+        }
+
+    def run(self, build_request: Callable[[int], Request], requests: int, concurrency: int) -> dict:
+        """Make the requests (from a pool of threads), returning the latency and query count stats."""
+
+        def send(index: int) -> tuple[float, int, int]:
+            method, url, data = build_request(index)
+            try:
+                with CaptureQueriesContext(connections["default"]) as queries:
+                    started = time.perf_counter()
+                    response = getattr(Client(), method)(url, data, content_type="application/json")
+                    latency = time.perf_counter() - started
+            finally:
+                if concurrency > 1:
+                    connections.close_all()
+            return latency, len(queries), response.status_code
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(send, range(requests)))
+        elapsed = time.perf_counter() - started
+
+        latencies, query_counts, status_codes = zip(*samples, strict=True)
+        return {
+            **get_latency_stats(list(latencies), elapsed),
+            "queries_mean": round(statistics.fmean(query_counts), 2),
+            "queries_max": max(query_counts),
+            "errors": sum(status_code >= 400 for status_code in status_codes),
+        }
+
+    def run_stale_sweep(self) -> dict:
+        """Run the stale order sweep (as the periodic task does), returning its duration and rows processed."""
+
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            rows = order__handle__stale_orders()
+            elapsed = time.perf_counter() - started
+
+        return {"duration_ms": round(elapsed * 1000, 2), "rows": rows, "queries": len(queries)}
@@ -0,0 +1,95 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from core.utils.benchmarks import override_client_settings
+from core.utils.typechecks import TYPECHECK_MODES, get_typecheck_mode
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+
+
+class Rollback(Exception):
+    """Raised to roll back the orders placed by a benchmark run."""
+
+
+class Command(BaseCommand):
+    help = """
+    Micro-benchmark the overhead of the runtime type checks (i.e. `CORE__TYPECHECK_MODE`) on the order-create path.
+
+    Each mode is run in its own process (as the mode is resolved on import), placing orders through the
+    `customer-orders` endpoint, in a transaction which is rolled back, against the configured database.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--sample-rate", type=float, default=0.01)
+        parser.add_argument("--output", help="Append the results (as JSON lines) to the given file.")
+        parser.add_argument("--worker", action="store_true", help="Run the benchmark in the configured mode only.")
+
+    def handle(self, *args, **options):
+        if options["worker"]:
+            self.stdout.write(json.dumps(self.run(options["requests"])))
+            return
+
+        results = []
+        for mode in TYPECHECK_MODES:
+            env = {
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+                "CORE__TYPECHECK_MODE": mode,
+                "CORE__TYPECHECK_SAMPLE_RATE": str(options["sample_rate"]),
+            }
+            output = subprocess.run(
+                [sys.executable, "manage.py", "benchmark_typechecks", "--worker", f"--requests={options['requests']}"],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            # NOTE: the result is the last line, as request logs may also be written to stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+        # report the overhead relative to running without checks
+        baseline = next(result for result in results if result["mode"] == "off")["mean_us"]
+        for result in results:
+            result["overhead_us"] = round(result["mean_us"] - baseline, 1)
+            self.stdout.write(json.dumps(result))
+
+        if options["output"]:
+            with open(options["output"], "a") as file:
+                file.writelines(json.dumps(result) + "\n" for result in results)
+
+    def run(self, requests: int) -> dict:
+        """Place the given number of orders, returning the per-request timings (in microseconds)."""
+
+        client = Client()
+        data = {"menuItems": [{"itemId": f"item{i}", "quantity": 1} for i in range(5)], "paymentInfoId": "payment"}
+        timings = []
+
+        with override_client_settings():
+            try:
+                with transaction.atomic():
+                    for _ in range(requests):
+                        url = reverse("order:customer-orders", kwargs={"customerId": uuid.uuid4().hex})
+                        started = time.perf_counter()
+                        response = client.post(url, data, content_type="application/json")
+                        timings.append((time.perf_counter() - started) * 1_000_000)
+                        assert response.status_code == 201, response.content
+                    raise Rollback
+            except Rollback:
+                pass
+
+        return {
+            "mode": get_typecheck_mode(),
+            "requests": requests,
+            "mean_us": round(statistics.fmean(timings), 1),
+            "p50_us": round(statistics.median(timings), 1),
+        }
@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from core.mixins.managers import BaseQuerySet
-from django.db.models import Subquery
+from django.db.models import Q, Subquery
+from django.utils import timezone
+
+from ..constants import ORDER__REFUNDS_FEED_LAG_SECONDS
 
 if TYPE_CHECKING:
     from ..models import OrderPayment as OrderPaymentModelType  # noqa: F401
@@ -22,3 +26,21 @@ class OrderPaymentQuerySet(BaseQuerySet["OrderPaymentModelType"]):
         """Return order payments not linked to rejected orders."""
 
         return self.exclude(pk__in=self.rejected().values("pk"))
+
+    def rejected_since(self, rejected_at: datetime | None = None, pk: int | None = None) -> "OrderPaymentQuerySet":
+        """
+        Return order payments for rejected orders, after the (`rejected_at`, `pk`) watermark, in watermark order.
+
+        NOTE: payments for orders rejected within the feed lag are held back (see `ORDER__REFUNDS_FEED_LAG_SECONDS`).
+        """
+
+        # determine the cutoff for settled rejections
+        settled_before = timezone.now() - timedelta(seconds=ORDER__REFUNDS_FEED_LAG_SECONDS)
+
+        qs = self.filter(order__rejected_at__isnull=False, order__rejected_at__lt=settled_before)
+
+        # only return payments after the watermark (ties on `rejected_at` are broken by `pk`)
+        if rejected_at is not None:
+            qs = qs.filter(Q(order__rejected_at__gt=rejected_at) | Q(order__rejected_at=rejected_at, pk__gt=pk))
+
+        return qs.order_by("order__rejected_at", "pk")
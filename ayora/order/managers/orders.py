@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 from core.mixins.managers import BaseQuerySet
 from django.utils import timezone
 
-from ..constants import ORDER__AUTO_REJECT_MINUTES
+from ..constants import ORDER__AUTO_REJECT_MINUTES, ORDER__STALE_SWEEP_LOOKBACK_DAYS
 from ..enums import OrderStatus
 
 if TYPE_CHECKING:
@@ -15,7 +15,15 @@ class OrderQuerySet(BaseQuerySet["OrderModelType"]):
     def actionable(self) -> "OrderQuerySet":
         """Return orders which can be actioned."""
 
-        return self.exclude(status__in=[OrderStatus.ACCEPTED, OrderStatus.REJECTED])
+        # NOTE: expressed as an inclusion (rather than excluding finalised statuses) so the
+        # partial index on placed orders can be used
+        return self.filter(status=OrderStatus.PLACED)
+
+    def finalised(self) -> "OrderQuerySet":
+        """Return orders which have been actioned (i.e. accepted or rejected)."""
+
+        # NOTE: expressed as an inclusion so the status index can be used
+        return self.filter(status__in=[OrderStatus.ACCEPTED, OrderStatus.REJECTED])
 
     def accepted(self) -> "OrderQuerySet":
         """Return accepted orders."""
@@ -43,4 +51,7 @@ class OrderQuerySet(BaseQuerySet["OrderModelType"]):
         # determine the relative cutoff time
         cutoff_time = timezone.now() - timedelta(minutes=ORDER__AUTO_REJECT_MINUTES)
 
-        return self.filter(status=OrderStatus.PLACED, created_at__lt=cutoff_time)
+        # NOTE: bounded below, so only the recent (monthly) partitions of orders are scanned
+        lookback_time = cutoff_time - timedelta(days=ORDER__STALE_SWEEP_LOOKBACK_DAYS)
+
+        return self.filter(status=OrderStatus.PLACED, created_at__gte=lookback_time, created_at__lt=cutoff_time)
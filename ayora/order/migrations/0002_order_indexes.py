@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 18:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: indexes are built concurrently to avoid blocking writes on the (large) orders table
+    atomic = False
+
+    dependencies = [
+        ('order', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['created_at'], name='order__order__created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['status', 'created_at'], name='order__order__status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'placed')), fields=['created_at'], name='order__order__placed_idx'),
+        ),
+    ]
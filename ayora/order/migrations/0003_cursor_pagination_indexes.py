@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-17 18:03
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: indexes are built concurrently to avoid blocking writes on the (large) order tables
+    atomic = False
+
+    dependencies = [
+        ('order', '0002_order_indexes'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='order',
+            name='order__order__created_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='order',
+            name='order__order__status_idx',
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['created_at', 'id'], name='order__order__created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='order__order__status_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='orderpayment',
+            index=models.Index(fields=['created_at', 'id'], name='order__payment__created_idx'),
+        ),
+    ]
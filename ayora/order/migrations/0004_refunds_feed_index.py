@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 18:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # NOTE: indexes are built concurrently to avoid blocking writes on the (large) orders table
+    atomic = False
+
+    dependencies = [
+        ('order', '0003_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='order',
+            index=models.Index(condition=models.Q(('rejected_at__isnull', False)), fields=['rejected_at', 'id'], name='order__order__rejected_idx'),
+        ),
+    ]
@@ -0,0 +1,181 @@
+# Generated by Django 5.2 on 2026-10-17 18:45
+
+from datetime import UTC
+
+import django.db.models.deletion
+import order.mixins.models.orders
+from core.utils.partitions import add_months, create_month_partitions, get_month, get_months
+from django.db import migrations, models
+from django.utils import timezone
+
+# NOTE: months partitioned ahead of the current one, from then on the `CreateOrderPartitionsTask` keeps them ahead
+MONTHS_AHEAD = 3
+
+
+def partition_tables(apps, schema_editor):
+    """
+    Convert the order, order item and order payment tables to tables partitioned by month (i.e. by range) of the
+    placement time of their order, copying their rows over.
+
+    NOTE: the partition key must be part of every unique constraint (including the primary key) of a partitioned
+    table, so the database constraints are widened with it. These are weaker than the narrower ones, which Django
+    keeps validating (i.e. on `full_clean`) but the database no longer enforces: a `uid` is only unique per
+    placement time (rather than globally, relying on it being a random UUID), as is an `id` (relying on it being
+    drawn from a single identity sequence). The tables are locked (i.e. `ACCESS EXCLUSIVE`) while being copied, so
+    large tables should be converted during a maintenance window.
+    """
+
+    connection = schema_editor.connection
+    quote = schema_editor.quote_name
+
+    Order = apps.get_model("order", "Order")
+    OrderItem = apps.get_model("order", "OrderItem")
+    OrderPayment = apps.get_model("order", "OrderPayment")
+    order_table = Order._meta.db_table
+
+    # denormalise the placement time of the order onto its objects
+    for model in (OrderItem, OrderPayment):
+        table = quote(model._meta.db_table)
+        schema_editor.execute(f"ALTER TABLE {table} ADD COLUMN order_created_at timestamp with time zone")
+        schema_editor.execute(
+            f"UPDATE {table} SET order_created_at = o.created_at FROM {quote(order_table)} o WHERE o.id = order_id"
+        )
+        schema_editor.execute(f"ALTER TABLE {table} ALTER COLUMN order_created_at SET NOT NULL")
+
+    # partition from the month of the first order onwards
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(created_at) FROM {quote(order_table)}")
+        first_created_at = cursor.fetchone()[0] or timezone.now()
+    now = timezone.now().astimezone(UTC)
+    months = get_months(first_created_at.astimezone(UTC), add_months(get_month(now), MONTHS_AHEAD))
+
+    # swap each table for a partitioned copy (i.e. same columns and checks), created before the originals are dropped
+    models_keys = [(Order, "created_at"), (OrderItem, "order_created_at"), (OrderPayment, "order_created_at")]
+    for model, key in models_keys:
+        table = model._meta.db_table
+        schema_editor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(table + '_unpartitioned')}")
+        schema_editor.execute(
+            f"CREATE TABLE {quote(table)} (LIKE {quote(table + '_unpartitioned')} "
+            f"INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS) PARTITION BY RANGE ({quote(key)})"
+        )
+        create_month_partitions(connection, table, months)
+        schema_editor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(table + '_unpartitioned')}")
+        schema_editor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {quote(table)}",
+            [table],
+        )
+
+    for model, _ in reversed(models_keys):
+        schema_editor.execute(f"DROP TABLE {quote(model._meta.db_table + '_unpartitioned')}")
+
+    # widen the unique constraints with the partition key
+    for model, key in models_keys:
+        table = model._meta.db_table
+        schema_editor.execute(f"ALTER TABLE {quote(table)} ADD PRIMARY KEY (id, {quote(key)})")
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + '_uid_key')} UNIQUE (uid, {quote(key)})"
+        )
+        for index in model._meta.indexes:
+            schema_editor.add_index(model, index)
+
+    for model, unique_field in ((OrderItem, "item_id"), (OrderPayment, "payment_info_id")):
+        table, name = model._meta.db_table, model._meta.model_name
+        schema_editor.execute(f"CREATE INDEX {quote(table + '_order_id_idx')} ON {quote(table)} (order_id)")
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'order__{name}__unique_fields')} "
+            f"UNIQUE (order_id, order_created_at, {quote(unique_field)})"
+        )
+        # NOTE: changes to the placement time of an order (e.g. backdating) cascade, moving its objects along
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'order__{name}__order_fk')} "
+            f"FOREIGN KEY (order_id, order_created_at) REFERENCES {quote(order_table)} (id, created_at) "
+            "ON UPDATE CASCADE DEFERRABLE INITIALLY DEFERRED"
+        )
+
+
+def unpartition_tables(apps, schema_editor):
+    """
+    Convert the partitioned order, order item and order payment tables back to plain tables, copying the rows of
+    their (attached) partitions over, and restoring their original constraints.
+
+    NOTE: the rows of detached partitions (see `order__detach__partitions`) are not copied back, and the tables are
+    locked while being copied, as when partitioning them.
+    """
+
+    quote = schema_editor.quote_name
+
+    Order = apps.get_model("order", "Order")
+    OrderItem = apps.get_model("order", "OrderItem")
+    OrderPayment = apps.get_model("order", "OrderPayment")
+
+    # swap each partitioned table for a plain copy, created before the partitioned ones (and their partitions) are
+    # dropped
+    for model in (Order, OrderItem, OrderPayment):
+        table = model._meta.db_table
+        schema_editor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(table + '_partitioned')}")
+        schema_editor.execute(
+            f"CREATE TABLE {quote(table)} (LIKE {quote(table + '_partitioned')} "
+            "INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS)"
+        )
+        schema_editor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(table + '_partitioned')}")
+        schema_editor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {quote(table)}",
+            [table],
+        )
+
+    for model in (OrderPayment, OrderItem, Order):
+        schema_editor.execute(f"DROP TABLE {quote(model._meta.db_table + '_partitioned')}")
+
+    # restore the original constraints (named as Django created them)
+    for model in (Order, OrderItem, OrderPayment):
+        table = model._meta.db_table
+        schema_editor.execute(f"ALTER TABLE {quote(table)} ADD PRIMARY KEY (id)")
+        schema_editor.execute(f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(table + '_uid_key')} UNIQUE (uid)")
+        for index in model._meta.indexes:
+            schema_editor.add_index(model, index)
+
+    for model, unique_field in ((OrderItem, "item_id"), (OrderPayment, "payment_info_id")):
+        table, name = model._meta.db_table, model._meta.model_name
+        schema_editor.execute(f"ALTER TABLE {quote(table)} DROP COLUMN order_created_at")
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'order__{name}__unique_fields')} "
+            f"UNIQUE (order_id, {quote(unique_field)})"
+        )
+        field = model._meta.get_field("order")
+        schema_editor.execute(schema_editor._create_index_sql(model, fields=[field]))
+        schema_editor.execute(schema_editor._create_fk_sql(model, field, "_fk_%(to_table)s_%(to_column)s"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0004_refunds_feed_index'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='orderitem',
+                    name='order_created_at',
+                    field=order.mixins.models.orders.OrderCreatedAtField(blank=True, editable=False, help_text='Date and time the linked order was placed.', verbose_name='Order Created At'),
+                ),
+                migrations.AddField(
+                    model_name='orderpayment',
+                    name='order_created_at',
+                    field=order.mixins.models.orders.OrderCreatedAtField(blank=True, editable=False, help_text='Date and time the linked order was placed.', verbose_name='Order Created At'),
+                ),
+                migrations.AlterField(
+                    model_name='orderitem',
+                    name='order',
+                    field=models.ForeignKey(db_constraint=False, help_text='Order linked to object.', on_delete=django.db.models.deletion.CASCADE, related_name='%(class)ss', to='order.order', verbose_name='Order'),
+                ),
+                migrations.AlterField(
+                    model_name='orderpayment',
+                    name='order',
+                    field=models.ForeignKey(db_constraint=False, help_text='Order linked to object.', on_delete=django.db.models.deletion.CASCADE, related_name='%(class)ss', to='order.order', verbose_name='Order'),
+                ),
+            ],
+        ),
+        migrations.RunPython(partition_tables, unpartition_tables),
+    ]
@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_fsm import FSMField, transition
 
@@ -15,16 +14,41 @@ if TYPE_CHECKING:
     from ...models import Order as OrderModelType
 
 
+class OrderCreatedAtField(models.DateTimeField):
+    """
+    The placement time of the linked order, copied from it on insert (including bulk inserts), which partitions the
+    objects of an order alongside it (see `order/migrations/0005_partitioning.py`).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("blank", True)
+        super().__init__(*args, **kwargs)
+
+    def pre_save(self, model_instance: models.Model, add: bool):
+        value = getattr(model_instance, self.attname)
+        if add and value is None:
+            value = model_instance.order.created_at
+            setattr(model_instance, self.attname, value)
+        return value
+
+
 class OrderFK(models.Model):
     """Order foreign key mixin."""
 
+    # NOTE: the database constraint is on both the order and its placement time (i.e. the partition key of orders)
     order: models.ForeignKey["OrderModelType"] = models.ForeignKey(
         to="order.Order",
         related_name="%(class)ss",
         on_delete=models.CASCADE,
+        db_constraint=False,
         verbose_name=_("Order"),
         help_text=_("Order linked to object."),
     )
+    order_created_at: OrderCreatedAtField = OrderCreatedAtField(
+        verbose_name=_("Order Created At"),
+        help_text=_("Date and time the linked order was placed."),
+    )
 
     class Meta:
         abstract = True
@@ -77,10 +101,10 @@ class OrderFSM(models.Model):
         """Mark an order as accepted."""
 
         # avoid circular import
-        from ...services import order__update
+        from ...services import order__transition
 
-        # update the order
-        order__update(instance=self, updates={"accepted_at": timezone.now()})
+        # persist the transition (status and timestamp) in a single write
+        order__transition(order=self, target=OrderStatus.ACCEPTED)
 
     # `REJECTED`
 
@@ -103,7 +127,7 @@ class OrderFSM(models.Model):
         """Mark an order as rejected."""
 
         # avoid circular import
-        from ...services import order__update
+        from ...services import order__transition
 
-        # update the order
-        order__update(instance=self, updates={"rejected_at": timezone.now()})
+        # persist the transition (status and timestamp) in a single write
+        order__transition(order=self, target=OrderStatus.REJECTED)
@@ -19,6 +19,13 @@ class OrderPayment(OrderFK, BaseModel):
         verbose_name = _("Order Payment")
         verbose_name_plural = _("Order Payments")
         ordering = ("-created_at",)
+        indexes = [
+            # backs the default ordering and cursor pagination (i.e. the refunds list)
+            models.Index(
+                fields=["created_at", "id"],
+                name="order__payment__created_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["order", "payment_info_id"],
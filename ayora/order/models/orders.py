@@ -5,6 +5,7 @@ from django.db import models
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from ..enums import OrderStatus
 from ..managers import OrderQuerySet
 from ..mixins import (
     OrderFSM,
@@ -27,6 +28,30 @@ class Order(
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
         ordering = ("-created_at",)
+        indexes = [
+            # backs the default ordering and cursor pagination (i.e. the unfiltered restaurant list)
+            models.Index(
+                fields=["created_at", "id"],
+                name="order__order__created_idx",
+            ),
+            # backs the status filtered restaurant list (including cursor pagination)
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="order__order__status_idx",
+            ),
+            # backs the stale order sweep and actionable orders, only covering the (small) set of placed orders
+            models.Index(
+                fields=["created_at"],
+                name="order__order__placed_idx",
+                condition=models.Q(status=OrderStatus.PLACED),
+            ),
+            # backs the incremental refunds feed, only covering rejected orders
+            models.Index(
+                fields=["rejected_at", "id"],
+                name="order__order__rejected_idx",
+                condition=models.Q(rejected_at__isnull=False),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"({self.status}) Order for customer: {self.customer_id}"
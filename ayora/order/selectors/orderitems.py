@@ -1,12 +1,21 @@
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
 
 from ..managers import OrderItemQuerySet
 from ..models import OrderItem
 
 
 @typechecked
-def order_item__list(optimized: bool = True, *args, **kwargs) -> OrderItemQuerySet:
-    """Return a queryset of order item instances."""
+def order_item__list(
+    optimized: bool = True,
+    *args,
+    only: list[str] | None = None,
+    **kwargs,
+) -> OrderItemQuerySet:
+    """
+    Return a queryset of order item instances.
+
+    The loaded columns (including those of the order) can be restricted with `only`.
+    """
 
     qs = OrderItem.objects.filter(*args, **kwargs)
 
@@ -14,4 +23,8 @@ def order_item__list(optimized: bool = True, *args, **kwargs) -> OrderItemQueryS
     if optimized:
         qs = qs.select_related("order")
 
+    # restrict the loaded columns
+    if only is not None:
+        qs = qs.only(*only)
+
     return qs
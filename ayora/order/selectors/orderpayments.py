@@ -1,12 +1,21 @@
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
 
 from ..managers import OrderPaymentQuerySet
 from ..models import OrderPayment
 
 
 @typechecked
-def order_payment__list(optimized: bool = True, *args, **kwargs) -> OrderPaymentQuerySet:
-    """Return a queryset of order payment instances."""
+def order_payment__list(
+    optimized: bool = True,
+    *args,
+    only: list[str] | None = None,
+    **kwargs,
+) -> OrderPaymentQuerySet:
+    """
+    Return a queryset of order payment instances.
+
+    The loaded columns (including those of the order) can be restricted with `only`.
+    """
 
     qs = OrderPayment.objects.filter(*args, **kwargs)
 
@@ -14,4 +23,8 @@ def order_payment__list(optimized: bool = True, *args, **kwargs) -> OrderPayment
     if optimized:
         qs = qs.select_related("order")
 
+    # restrict the loaded columns
+    if only is not None:
+        qs = qs.only(*only)
+
     return qs
@@ -1,17 +1,35 @@
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
+from django.db.models import Prefetch
 
+from ..constants import ORDER__DEFAULT_PREFETCH
 from ..managers import OrderQuerySet
 from ..models import Order
 
 
 @typechecked
-def order__list(optimized: bool = True, *args, **kwargs) -> OrderQuerySet:
-    """Return a queryset of order instances."""
+def order__list(
+    optimized: bool = True,
+    *args,
+    prefetch: list[str | Prefetch] | None = None,
+    only: list[str] | None = None,
+    **kwargs,
+) -> OrderQuerySet:
+    """
+    Return a queryset of order instances.
+
+    The query optimizations can be tailored to what the caller actually needs:
+        - `prefetch`: related objects to prefetch (defaults to both items and payments, `[]` for none).
+        - `only`: columns to load (defaults to all).
+    """
 
     qs = Order.objects.filter(*args, **kwargs)
 
     # perform query optimizations
     if optimized:
-        qs = qs.prefetch_related("orderitems", "orderpayments")
+        qs = qs.prefetch_related(*(ORDER__DEFAULT_PREFETCH if prefetch is None else prefetch))
+
+    # restrict the loaded columns
+    if only is not None:
+        qs = qs.only(*only)
 
     return qs
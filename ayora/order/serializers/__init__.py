@@ -1,3 +1,11 @@
 from .orderitems import OrderItemSerializer
-from .orderpayments import RefundItemSerializer
-from .orders import AcceptRejectRequestSerializer, AddItemRequestSerializer, OrderRequestSerializer, OrderSerializer
+from .orderpayments import RefundItemSerializer, RefundsFeedRequestSerializer, RefundsFeedSerializer
+from .orders import (
+    AcceptRejectRequestSerializer,
+    AddItemRequestSerializer,
+    BulkOrderRequestSerializer,
+    BulkOrdersRequestSerializer,
+    BulkOrdersSerializer,
+    OrderRequestSerializer,
+    OrderSerializer,
+)
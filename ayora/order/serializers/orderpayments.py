@@ -1,9 +1,14 @@
+from datetime import datetime
+
+from core.mixins.serializers import ProfiledSerializerMixin
+from core.utils.encoders import decode_base64, encode_base64
 from rest_framework import serializers
 
+from ..constants import ORDER__REFUNDS_FEED_DEFAULT_SIZE, ORDER__REFUNDS_FEED_MAX_SIZE
 from ..models import OrderPayment
 
 
-class RefundItemSerializer(serializers.ModelSerializer):
+class RefundItemSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """Read-only details for an order payment requiring a refund."""
 
     order_id = serializers.SerializerMethodField(help_text="Unique identifier for the order.")
@@ -18,3 +23,48 @@ class RefundItemSerializer(serializers.ModelSerializer):
 
     def get_order_id(self, obj) -> str:
         return obj.order.uid
+
+
+class RefundsFeedRequestSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    """Serializer for the query params of the incremental refunds feed."""
+
+    since = serializers.CharField(
+        allow_blank=True,
+        help_text="Watermark returned by the previous poll, an empty value starts from the beginning of the history.",
+    )
+    size = serializers.IntegerField(
+        min_value=1,
+        max_value=ORDER__REFUNDS_FEED_MAX_SIZE,
+        default=ORDER__REFUNDS_FEED_DEFAULT_SIZE,
+        help_text="Maximum number of refunds to return.",
+    )
+
+    default_error_messages = {
+        "invalid_since": "The watermark is invalid.",
+    }
+
+    @staticmethod
+    def encode_watermark(rejected_at: datetime, pk: int) -> str:
+        """Encode the position of the last refund returned as an opaque watermark."""
+
+        return encode_base64(f"{rejected_at.isoformat()}|{pk}")
+
+    def validate_since(self, value: str) -> tuple[datetime, int] | None:
+        # handle starting from the beginning
+        if not value:
+            return None
+
+        # decode the watermark position
+        try:
+            rejected_at, pk = decode_base64(value).split("|")
+            return datetime.fromisoformat(rejected_at), int(pk)
+        except ValueError:
+            self.fail("invalid_since")
+
+
+class RefundsFeedSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    """Read-only serializer for a page of the incremental refunds feed."""
+
+    watermark = serializers.CharField(help_text="Watermark to pass as `since` on the next poll.")
+    has_more = serializers.BooleanField(help_text="Whether more refunds are available after the watermark.")
+    results = RefundItemSerializer(many=True, help_text="Refunds which became due since the previous watermark.")
@@ -1,6 +1,8 @@
+from core.mixins.serializers import ProfiledSerializerMixin
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from ..constants import ORDER__BULK_PLACE_MAX_SIZE
 from ..enums import OrderStatus
 from ..models import Order
 from .orderitems import OrderItemSerializer
@@ -9,15 +11,15 @@ from .orderitems import OrderItemSerializer
 class OrderItemRequestSerializer(serializers.Serializer):
     """Serializer for order item in requests."""
 
-    item_id = serializers.CharField(help_text="Unique identifier of the item.")
+    item_id = serializers.CharField(max_length=255, help_text="Unique identifier of the item.")
     quantity = serializers.IntegerField(help_text="Number of items ordered.")
 
 
-class OrderRequestSerializer(serializers.Serializer):
+class OrderRequestSerializer(ProfiledSerializerMixin, serializers.Serializer):
     """Serializer for creating an order."""
 
     menu_items = OrderItemRequestSerializer(many=True, required=True)
-    payment_info_id = serializers.CharField(required=True)
+    payment_info_id = serializers.CharField(max_length=255, required=True)
     # NOTE: although in the schema as part of the payload, is redundant due to URL params
     # customer_id = serializers.CharField(required=True)
 
@@ -40,7 +42,45 @@ class OrderRequestSerializer(serializers.Serializer):
         return attrs
 
 
-class AddItemRequestSerializer(serializers.Serializer):
+class BulkOrderRequestSerializer(OrderRequestSerializer):
+    """Serializer for an order placed in bulk (i.e. by an aggregator, on behalf of a customer)."""
+
+    customer_id = serializers.CharField(max_length=255, required=True)
+
+
+class BulkOrdersRequestSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    """
+    Serializer for placing orders in bulk.
+
+    NOTE: each order is validated separately by the view (see `BulkOrderRequestSerializer`), so that invalid
+    orders can be reported without failing the whole batch.
+    """
+
+    orders = serializers.ListField(
+        child=serializers.DictField(),
+        min_length=1,
+        max_length=ORDER__BULK_PLACE_MAX_SIZE,
+        help_text="Orders to place, each with its customer, menu items and payment.",
+    )
+
+
+class BulkOrderResultSerializer(serializers.Serializer):
+    """Read-only serializer for the result of an order placed in bulk."""
+
+    index = serializers.IntegerField(help_text="Position of the order in the request.")
+    order_id = serializers.CharField(allow_null=True, help_text="Unique identifier for the order, if placed.")
+    errors = serializers.DictField(allow_null=True, help_text="Validation errors, if the order was not placed.")
+
+
+class BulkOrdersSerializer(ProfiledSerializerMixin, serializers.Serializer):
+    """Read-only serializer for the results of placing orders in bulk."""
+
+    created = serializers.IntegerField(help_text="Number of orders placed.")
+    failed = serializers.IntegerField(help_text="Number of orders which failed validation.")
+    results = BulkOrderResultSerializer(many=True)
+
+
+class AddItemRequestSerializer(ProfiledSerializerMixin, serializers.Serializer):
     """Serializer for adding items to an existing order."""
 
     menu_items = OrderItemRequestSerializer(many=True, required=True)
@@ -57,12 +97,15 @@ class AddItemRequestSerializer(serializers.Serializer):
     def get_order_id(self, **kwargs) -> str | None:
         return self.context.get("orderId")
 
+    def get_order(self, **kwargs) -> Order:
+        return self.context["order"]
+
     def validate(self, attrs):
         # get the url params
-        customer_id, order_id = self.get_customer_id(), self.get_order_id()
+        customer_id = self.get_customer_id()
 
-        # get the order
-        order = Order.objects.get(uid=order_id)
+        # get the order (already loaded by the view)
+        order = self.get_order()
 
         # check if the customer is linked to the order
         if not customer_id == order.customer_id:
@@ -75,7 +118,7 @@ class AddItemRequestSerializer(serializers.Serializer):
         return attrs
 
 
-class AcceptRejectRequestSerializer(serializers.Serializer):
+class AcceptRejectRequestSerializer(ProfiledSerializerMixin, serializers.Serializer):
     """Serializer for accepting/rejecting an order."""
 
     action = serializers.ChoiceField(choices=["accept", "reject"], required=True)
@@ -87,12 +130,12 @@ class AcceptRejectRequestSerializer(serializers.Serializer):
     def get_order_id(self, **kwargs) -> str | None:
         return self.context.get("orderId")
 
-    def validate(self, attrs):
-        # get the url params
-        order_id = self.get_order_id()
+    def get_order(self, **kwargs) -> Order:
+        return self.context["order"]
 
-        # get the order
-        order = Order.objects.get(uid=order_id)
+    def validate(self, attrs):
+        # get the order (already loaded by the view)
+        order = self.get_order()
 
         # check if the order has already been finalised
         if order.is_finalised:
@@ -101,7 +144,7 @@ class AcceptRejectRequestSerializer(serializers.Serializer):
         return attrs
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(ProfiledSerializerMixin, serializers.ModelSerializer):
     """Read-only serializer for an order."""
 
     order_id = serializers.CharField(source="uid", help_text="Unique identifier for the order.")
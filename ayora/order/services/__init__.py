@@ -1,7 +1,16 @@
+from .archives import order__archive__batch, order__archive__finalised_orders
+from .events import get_events_client, order__publish__event
+from .metrics import (
+    order__record__archive_batch,
+    order__record__archive_lag,
+    order__record__event,
+    order__record__stale_sweep,
+)
 from .orderitems import (
     order_item__build,
     order_item__bulk_create,
     order_item__bulk_update,
+    order_item__bulk_upsert,
     order_item__create,
     order_item__get_or_create,
     order_item__update,
@@ -16,12 +25,19 @@ from .orderpayments import (
 )
 from .orders import (
     order__build,
+    order__atransition,
     order__bulk_create,
+    order__bulk_place,
+    order__bulk_reject,
     order__bulk_update,
     order__create,
     order__create_items_for_order,
     order__create_payment_for_order,
     order__get_or_create,
     order__handle__stale_orders,
+    order__invalidate__list_cache,
+    order__schedule__auto_reject,
+    order__transition,
     order__update,
 )
+from .partitions import order__create__partitions, order__detach__partitions
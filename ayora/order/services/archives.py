@@ -0,0 +1,175 @@
+import gzip
+import json
+import time
+from datetime import UTC, datetime, timedelta
+
+import structlog
+from core.utils.databases import advisory_lock
+from core.utils.typechecks import typechecked
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, storages
+from django.db import transaction
+from django.utils import timezone
+
+from ..constants import (
+    ORDER__ARCHIVE_BATCH_SIZE,
+    ORDER__ARCHIVE_DIRECTORY_NAME,
+    ORDER__ARCHIVE_FILE_IDS,
+    ORDER__ARCHIVE_FILE_NAME,
+    ORDER__ARCHIVE_LOCK_KEY,
+    ORDER__ARCHIVE_MAX_BATCHES,
+)
+from ..models import Order
+from .metrics import order__record__archive_batch, order__record__archive_lag
+from .orders import order__invalidate__list_cache
+
+logger = structlog.get_logger(__name__)
+
+
+def get_archive_directory_name(order: Order) -> str:
+    """Return the name of the archive directory of an order, i.e. that of the month (and range of ids) it falls in."""
+
+    first_id = order.pk - order.pk % ORDER__ARCHIVE_FILE_IDS
+    return ORDER__ARCHIVE_DIRECTORY_NAME.format(
+        month=order.created_at.astimezone(UTC).strftime("%Y/%m"),
+        first_id=first_id,
+        last_id=first_id + ORDER__ARCHIVE_FILE_IDS - 1,
+    )
+
+
+def get_archive_file_names(storage: Storage, directory: str) -> list[str]:
+    """Return the names of the files of an archive directory (i.e. usually one, or none if not yet archived to)."""
+
+    try:
+        _, names = storage.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return [f"{directory}/{name}" for name in sorted(names)]
+
+
+@typechecked
+def order__archive__batch(*, cutoff: datetime, batch_size: int = ORDER__ARCHIVE_BATCH_SIZE) -> int:
+    """
+    Archive the next batch of finalised orders placed before `cutoff` (oldest first), with their items and payments,
+    returning the number of orders archived.
+
+    The batch is written to the archive storage (i.e. `ORDER__ARCHIVE_STORAGE`) as gzipped newline-delimited JSON
+    files, an order per line with its items and payments nested, then deleted from the (hot) order tables in a short
+    transaction, so no lock is held while the files are written.
+
+    NOTE: each order is always archived to the same directory (see `get_archive_directory_name`), whose existing
+    orders are kept (i.e. merged, by id) in a new file replacing the previous one, so a batch which is archived again
+    (i.e. as its deletion failed) never duplicates its orders, even if it was picked differently. Finalised orders
+    never change, so they can be written before being deleted.
+    """
+
+    # avoid circular import
+    from ..selectors import order__list
+
+    orders = list(order__list().finalised().filter(created_at__lt=cutoff).order_by("created_at", "id")[:batch_size])
+    if not orders:
+        return 0
+
+    files: dict[str, dict[int, str]] = {}
+    for order in orders:
+        data = {
+            **order.dump_json_dict(),
+            "orderitems": [item.dump_json_dict() for item in order.orderitems.all()],
+            "orderpayments": [payment.dump_json_dict() for payment in order.orderpayments.all()],
+        }
+        files.setdefault(get_archive_directory_name(order), {})[order.pk] = json.dumps(data)
+
+    # write the archive files, before any of their orders are deleted
+    storage = storages[settings.ORDER__ARCHIVE_STORAGE]
+    version = timezone.now().astimezone(UTC).strftime("%Y%m%dT%H%M%S%f")
+    for directory, lines in files.items():
+        existing_names = get_archive_file_names(storage, directory)
+        for existing_name in existing_names:
+            with storage.open(existing_name) as file:
+                existing = {json.loads(line)["id"]: line for line in gzip.decompress(file.read()).decode().splitlines()}
+            lines = {**existing, **lines}
+
+        content = "\n".join(line for _, line in sorted(lines.items())) + "\n"
+        name = storage.save(
+            ORDER__ARCHIVE_FILE_NAME.format(directory=directory, version=version),
+            ContentFile(gzip.compress(content.encode())),
+        )
+
+        # NOTE: the previous files are only deleted once the merged one is saved, so its orders are never lost, while
+        # the storage may have saved it under another name (i.e. if taken), or over the previous file (i.e. if it
+        # overwrites files)
+        for existing_name in existing_names:
+            if existing_name != name:
+                storage.delete(existing_name)
+
+    # delete the orders, along with their items and payments
+    with transaction.atomic():
+        Order.objects.finalised().filter(pk__in=[order.pk for order in orders], created_at__lt=cutoff).delete()
+
+        order__invalidate__list_cache()
+
+    return len(orders)
+
+
+@typechecked
+def order__archive__finalised_orders(
+    *,
+    older_than_days: int | None = None,
+    batch_size: int = ORDER__ARCHIVE_BATCH_SIZE,
+    max_batches: int | None = ORDER__ARCHIVE_MAX_BATCHES,
+) -> int:
+    """
+    Archive the finalised orders placed more than `older_than_days` (by default `ORDER__ARCHIVE_AFTER_DAYS`) days ago,
+    batch by batch, until none are left or `max_batches` have been archived, returning the number of orders archived.
+
+    The duration and size of each batch (i.e. the throughput) are recorded, along with how far the archival is behind
+    once done (i.e. the lag).
+
+    NOTE: resumable, as archived orders are deleted from the order tables (i.e. there is no progress to keep), so an
+    interrupted (or bounded) run is simply picked up by the next. Runs never overlap (i.e. a run is skipped while
+    another holds the advisory lock, for as long as it runs), as their merges of the same archive file could otherwise
+    overwrite each other.
+    """
+
+    # avoid circular import
+    from ..selectors import order__list
+
+    if older_than_days is None:
+        older_than_days = settings.ORDER__ARCHIVE_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+
+    archived, batches = 0, 0
+    with advisory_lock(ORDER__ARCHIVE_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.warning("orders_archival_in_progress")
+            return 0
+
+        while max_batches is None or batches < max_batches:
+            started = time.perf_counter()
+            count = order__archive__batch(cutoff=cutoff, batch_size=batch_size)
+            batches += 1
+
+            if count:
+                order__record__archive_batch(duration=time.perf_counter() - started, rows=count)
+                archived += count
+
+            # a partial batch means there is nothing left to archive
+            if count < batch_size:
+                break
+
+    # record the lag, i.e. the age beyond the cutoff of the oldest order left to archive
+    oldest = (
+        order__list(optimized=False)
+        .finalised()
+        .filter(created_at__lt=cutoff)
+        .order_by("created_at")
+        .values_list("created_at", flat=True)
+        .first()
+    )
+    order__record__archive_lag(lag=(cutoff - oldest).total_seconds() if oldest else 0.0)
+
+    if archived:
+        logger.info("orders_archived", count=archived, batches=batches, cutoff=cutoff.isoformat())
+
+    return archived
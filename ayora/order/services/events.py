@@ -0,0 +1,43 @@
+import json
+from functools import cache
+
+import redis
+import structlog
+from core.utils.typechecks import typechecked
+from django.conf import settings
+from django.db import transaction
+
+from ..constants import ORDER__EVENTS_CHANNEL
+from ..enums import OrderEvent
+
+logger = structlog.get_logger(__name__)
+
+
+@cache
+def get_events_client() -> redis.Redis:
+    """Return the (shared) Redis client used to publish order events."""
+
+    return redis.Redis.from_url(settings.ORDER__EVENTS_REDIS_URL)
+
+
+@typechecked
+def order__publish__event(*, event: OrderEvent, order_ids: list[str]) -> None:
+    """
+    Publish an order event for the given orders (by `uid`), once the current transaction (if any) has been committed.
+
+    NOTE: events are best-effort notifications, a failure to publish never fails the change itself
+    (subscribers can always fall back to listing orders).
+    """
+
+    if not order_ids:
+        return
+
+    message = json.dumps({"event": event.value, "order_ids": order_ids})
+
+    def publish() -> None:
+        try:
+            get_events_client().publish(ORDER__EVENTS_CHANNEL, message)
+        except redis.RedisError:
+            logger.warning("order_event_publish_failed", event=event.value, count=len(order_ids))
+
+    transaction.on_commit(publish)
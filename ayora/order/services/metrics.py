@@ -0,0 +1,72 @@
+from core.utils.metrics import REQUEST_LATENCY_BUCKETS
+from core.utils.typechecks import typechecked
+from django.db import transaction
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..constants import ORDER__METRIC_EVENTS
+
+ORDERS_TOTAL = Counter(
+    "ayora_orders_total",
+    "Orders placed, accepted, rejected (by restaurants) and auto-rejected (once stale).",
+    ["event"],
+)
+
+STALE_SWEEP_DURATION = Histogram(
+    "ayora_order_stale_sweep_duration_seconds",
+    "Duration of the stale order sweeps (periodic and targeted).",
+    buckets=(*REQUEST_LATENCY_BUCKETS, 10.0, 30.0, 60.0),
+)
+
+STALE_SWEEP_ROWS = Counter("ayora_order_stale_sweep_rows_total", "Stale orders rejected by the stale order sweeps.")
+
+ARCHIVE_BATCH_DURATION = Histogram(
+    "ayora_order_archive_batch_duration_seconds",
+    "Duration of the archival batches (i.e. writing the archive file and deleting the orders).",
+    buckets=(*REQUEST_LATENCY_BUCKETS, 10.0, 30.0, 60.0),
+)
+
+ARCHIVE_ROWS = Counter("ayora_order_archive_rows_total", "Finalised orders archived (with their items and payments).")
+
+# NOTE: the most recent value of any process, as archival runs are sequential (i.e. never concurrent)
+ARCHIVE_LAG = Gauge(
+    "ayora_order_archive_lag_seconds",
+    "How far the archival is behind, i.e. the age beyond the cutoff of the oldest finalised order left to archive.",
+    multiprocess_mode="mostrecent",
+)
+
+
+@typechecked
+def order__record__event(*, event: str, count: int = 1) -> None:
+    """
+    Count orders for a metric event (see `ORDER__METRIC_EVENTS`), once the current transaction (if any) has been
+    committed, so rolled back changes are never counted.
+    """
+
+    assert event in ORDER__METRIC_EVENTS, f"{event} is not a valid order metric event."
+
+    if count:
+        transaction.on_commit(lambda: ORDERS_TOTAL.labels(event=event).inc(count))
+
+
+@typechecked
+def order__record__stale_sweep(*, duration: float, rows: int) -> None:
+    """Record the duration (in seconds) of a stale order sweep, and the stale orders it rejected."""
+
+    STALE_SWEEP_DURATION.observe(duration)
+    STALE_SWEEP_ROWS.inc(rows)
+    order__record__event(event="auto_rejected", count=rows)
+
+
+@typechecked
+def order__record__archive_batch(*, duration: float, rows: int) -> None:
+    """Record the duration (in seconds) of an archival batch, and the orders it archived."""
+
+    ARCHIVE_BATCH_DURATION.observe(duration)
+    ARCHIVE_ROWS.inc(rows)
+
+
+@typechecked
+def order__record__archive_lag(*, lag: float) -> None:
+    """Record how far (in seconds) the archival is behind, once it has run."""
+
+    ARCHIVE_LAG.set(lag)
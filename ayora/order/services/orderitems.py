@@ -1,8 +1,12 @@
+import uuid
+
 from core.services.models import model__update
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
+from django.db import connection
+from django.utils import timezone
 
 from ..managers import OrderItemQuerySet
-from ..models import OrderItem
+from ..models import Order, OrderItem
 
 
 @typechecked
@@ -29,6 +33,58 @@ def order_item__bulk_create(*, instances: list[OrderItem]) -> list[OrderItem]:
     return instances
 
 
+@typechecked
+def order_item__bulk_upsert(*, order: Order, quantities: dict[str, int]) -> list[OrderItem]:
+    """
+    Add quantities (keyed by `item_id`) to the items of an order in a single statement, creating any items
+    which don't exist yet, and returning the resulting item instances.
+
+    NOTE: relies on `INSERT ... ON CONFLICT DO UPDATE` against the `order__orderitem__unique_fields` constraint
+    (which also covers the placement time of the order, i.e. the partition key), so concurrent additions of the same
+    item are accumulated rather than failing with an integrity error.
+    """
+
+    if not quantities:
+        return []
+
+    # resolve identifiers
+    opts = OrderItem._meta
+    table = connection.ops.quote_name(opts.db_table)
+    insert_field_names = ["uid", "created_at", "updated_at", "order", "order_created_at", "item_id", "quantity"]
+    insert_fields = [opts.get_field(name) for name in insert_field_names]
+    insert_columns = ", ".join(connection.ops.quote_name(field.column) for field in insert_fields)
+    returning_columns = ", ".join(connection.ops.quote_name(field.column) for field in opts.concrete_fields)
+    order_column = connection.ops.quote_name(opts.get_field("order").column)
+    order_created_at_column = connection.ops.quote_name(opts.get_field("order_created_at").column)
+    item_id_column = connection.ops.quote_name(opts.get_field("item_id").column)
+    quantity_column = connection.ops.quote_name(opts.get_field("quantity").column)
+    updated_at_column = connection.ops.quote_name(opts.get_field("updated_at").column)
+
+    # build a row per item
+    now = timezone.now()
+    placeholders = ", ".join(["(" + ", ".join(["%s"] * len(insert_fields)) + ")"] * len(quantities))
+    params = []
+    for item_id, quantity in quantities.items():
+        params.extend([uuid.uuid4(), now, now, order.pk, order.created_at, item_id, quantity])
+
+    instances = list(
+        OrderItem.objects.raw(
+            f"INSERT INTO {table} AS item ({insert_columns}) VALUES {placeholders} "
+            f"ON CONFLICT ({order_column}, {order_created_at_column}, {item_id_column}) DO UPDATE "
+            f"SET {quantity_column} = item.{quantity_column} + EXCLUDED.{quantity_column}, "
+            f"{updated_at_column} = EXCLUDED.{updated_at_column} "
+            f"RETURNING {returning_columns}",
+            params,
+        )
+    )
+
+    # avoid lazily re-fetching the (known) order
+    for instance in instances:
+        instance.order = order
+
+    return instances
+
+
 @typechecked
 def order_item__get_or_create(*args, **kwargs) -> tuple[OrderItem, bool]:
     """Get or create a order item instance."""
@@ -61,7 +117,7 @@ def order_item__update(*, instance: OrderItem, updates: dict) -> tuple[OrderItem
 
 
 @typechecked
-def order_item__bulk_update(*, queryset: OrderItemQuerySet, updated_fields: list) -> int:
+def order_item__bulk_update(*, queryset: OrderItemQuerySet | list[OrderItem], updated_fields: list) -> int:
     """Bulk update order item instances."""
 
     count = OrderItem.objects.bulk_update(queryset, updated_fields)
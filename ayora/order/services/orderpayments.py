@@ -1,5 +1,5 @@
 from core.services.models import model__update
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
 
 from ..managers import OrderPaymentQuerySet
 from ..models import OrderPayment
@@ -1,11 +1,42 @@
+import time
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
 from core.services.models import model__update
-from typeguard import typechecked
+from core.utils.caches import bump_cache_version
+from core.utils.typechecks import typechecked
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..constants import (
+    ORDER__ACCEPTED_SOURCE_STATES,
+    ORDER__AUTO_REJECT_CACHE_KEY,
+    ORDER__AUTO_REJECT_MINUTES,
+    ORDER__AUTO_REJECT_WINDOW_SECONDS,
+    ORDER__BULK_REJECT_BATCH_SIZE,
+    ORDER__LIST_CACHE_NAMESPACE,
+    ORDER__REJECTED_SOURCE_STATES,
+)
+from ..enums import OrderEvent, OrderStatus
+from ..exceptions import OrderTransitionConflictError
+from ..managers import OrderQuerySet
+from ..models import Order, OrderItem, OrderPayment
+from .events import order__publish__event
+from .metrics import order__record__event, order__record__stale_sweep
+from .orderitems import order_item__build, order_item__bulk_create, order_item__bulk_upsert
+from .orderpayments import order_payment__build, order_payment__bulk_create, order_payment__create
+
+
+@typechecked
+def order__invalidate__list_cache() -> None:
+    """
+    Invalidate the cached order list pages, once the current transaction (if any) has been committed.
 
-from ..managers import OrderItemQuerySet, OrderQuerySet
-from ..models import Order, OrderPayment
-from ..selectors import order_item__list
-from .orderitems import order_item__build, order_item__bulk_create, order_item__bulk_update
-from .orderpayments import order_payment__create
+    NOTE: invalidating before the commit would let a concurrent read re-cache the pre-commit state.
+    """
+
+    transaction.on_commit(lambda: bump_cache_version(ORDER__LIST_CACHE_NAMESPACE))
 
 
 @typechecked
@@ -21,6 +52,9 @@ def order__create(*args, **kwargs) -> Order:
     """Create an order instance."""
 
     instance = Order.objects.create(*args, **kwargs)
+    order__invalidate__list_cache()
+    order__publish__event(event=OrderEvent.PLACED, order_ids=[str(instance.uid)])
+    order__record__event(event="placed")
     return instance
 
 
@@ -29,6 +63,9 @@ def order__bulk_create(*, instances: list[Order]) -> list[Order]:
     """Bulk create order instances."""
 
     instances = Order.objects.bulk_create(instances)
+    order__invalidate__list_cache()
+    order__publish__event(event=OrderEvent.PLACED, order_ids=[str(instance.uid) for instance in instances])
+    order__record__event(event="placed", count=len(instances))
     return instances
 
 
@@ -60,6 +97,8 @@ def order__update(*, instance: Order, updates: dict) -> tuple[Order, bool]:
     """Update an order."""
 
     instance, has_updated = model__update(instance=instance, fields=updates.keys(), data=updates)
+    if has_updated:
+        order__invalidate__list_cache()
     return instance, has_updated
 
 
@@ -68,46 +107,102 @@ def order__bulk_update(*, queryset: OrderQuerySet, updated_fields: list) -> int:
     """Bulk update order instances."""
 
     count = Order.objects.bulk_update(queryset, updated_fields)
+    order__invalidate__list_cache()
     return count
 
 
+def _order__transition__updates(*, target: OrderStatus) -> tuple[list[str], dict]:
+    """Return the valid source states, and the changes to apply, to transition an order to the target status."""
+
+    transitions = {
+        OrderStatus.ACCEPTED: (ORDER__ACCEPTED_SOURCE_STATES, "accepted_at"),
+        OrderStatus.REJECTED: (ORDER__REJECTED_SOURCE_STATES, "rejected_at"),
+    }
+    source_states, timestamp_field = transitions[target]
+
+    now = timezone.now()
+    return source_states, {"status": target, timestamp_field: now, "updated_at": now}
+
+
+def _order__transition__applied(*, order: Order, target: OrderStatus, updates: dict) -> Order:
+    """Reflect an applied transition on the instance, and notify of the change."""
+
+    for field, value in updates.items():
+        setattr(order, field, value)
+    order.__dict__.pop("is_finalised", None)
+
+    order__invalidate__list_cache()
+    order__publish__event(event=OrderEvent(target.value), order_ids=[str(order.uid)])
+    order__record__event(event=target.value)
+
+    return order
+
+
 @typechecked
-def order__create_items_for_order(*, order: Order, order_items_data: list[dict]) -> OrderItemQuerySet:
-    """Create or update order items for an order."""
+def order__transition(*, order: Order, target: OrderStatus) -> Order:
+    """
+    Transition an order to the target status (i.e. `accepted` or `rejected`), stamping the related timestamp.
+
+    The transition is written in a single conditional statement, only applied if the order is still in a
+    valid source state, raising a conflict if the order was transitioned concurrently (e.g. by the stale
+    order sweep) rather than overwriting it.
+    """
+
+    # apply the transition, guarded by the source states
+    source_states, updates = _order__transition__updates(target=target)
+    count = Order.objects.filter(pk=order.pk, status__in=source_states).update(**updates)
+
+    # handle a lost race
+    if not count:
+        raise OrderTransitionConflictError()
+
+    return _order__transition__applied(order=order, target=target, updates=updates)
+
+
+@typechecked
+async def order__atransition(*, order: Order, target: OrderStatus) -> Order:
+    """
+    Async variant of `order__transition`, writing the transition with the async ORM.
+
+    NOTE: the write is a single (autocommitted) statement, so no transaction is needed, the follow-up
+    notifications are run in a thread as the cache and event clients are synchronous.
+    """
+
+    # apply the transition, guarded by the source states
+    source_states, updates = _order__transition__updates(target=target)
+    count = await Order.objects.filter(pk=order.pk, status__in=source_states).aupdate(**updates)
+
+    # handle a lost race
+    if not count:
+        raise OrderTransitionConflictError()
+
+    return await sync_to_async(_order__transition__applied)(order=order, target=target, updates=updates)
+
 
-    # Get existing items as a dict for simpler lookup
-    existing_items__qs = order_item__list(order=order)
-    existing_items = {item.item_id: item for item in existing_items__qs}
+def _order__collapse__items(*, order_items_data: list[dict]) -> dict[str, int]:
+    """Collapse the requested items into quantities (keyed by `item_id`), accumulating any repeated items."""
 
-    # Process items
-    new_items = []
-    items_to_update = {}  # Dictionary to track item_id -> quantity to add
+    quantities: dict[str, int] = {}
     for item_data in order_items_data:
         item_id = item_data["item_id"]
-        quantity = item_data["quantity"]
+        quantities[item_id] = quantities.get(item_id, 0) + item_data["quantity"]
+    return quantities
 
-        if item_id in existing_items:
-            # Track the quantity to add for this item
-            if item_id not in items_to_update:
-                items_to_update[item_id] = quantity
-            else:
-                items_to_update[item_id] += quantity
-        else:
-            # Create new item
-            new_items.append(order_item__build(order=order, **item_data))
 
-    # Update existing items with accumulated quantities
-    if items_to_update:
-        items_to_update_qs = existing_items__qs.filter(item_id__in=items_to_update.keys())
-        for item in items_to_update_qs:
-            item.quantity += items_to_update[item.item_id]
-        _ = order_item__bulk_update(queryset=items_to_update_qs, updated_fields=["quantity"])
+@typechecked
+def order__create_items_for_order(*, order: Order, order_items_data: list[dict]) -> list[OrderItem]:
+    """Create or update order items for an order, returning the created and updated items."""
+
+    # Collapse the requested items, accumulating the quantity of any repeated items
+    quantities = _order__collapse__items(order_items_data=order_items_data)
 
-    # Create new order items
-    _ = order_item__bulk_create(instances=new_items)
+    # Create new items, or add to the quantity of existing items (in a single statement)
+    items = order_item__bulk_upsert(order=order, quantities=quantities)
 
-    # Return latest items for the order
-    return order_item__list(order=order)
+    order__invalidate__list_cache()
+    order__publish__event(event=OrderEvent.UPDATED, order_ids=[str(order.uid)])
+
+    return items
 
 
 @typechecked
@@ -118,19 +213,175 @@ def order__create_payment_for_order(*, order: Order, payment_info_id: str) -> Or
 
 
 @typechecked
-def order__handle__stale_orders() -> int:
-    """Handle orders that have become stale (i.e. exceeded the auto-rejection time window)"""
+def order__bulk_place(*, orders_data: list[dict]) -> list[Order]:
+    """
+    Place orders in bulk (i.e. from aggregators), each with its items and payment, in three `INSERT` statements.
+
+    Each order in `orders_data` is expected to be validated, with its `customer_id`, `menu_items`
+    and `payment_info_id`.
+
+    NOTE: the auto-rejection is scheduled once per window the orders were placed in, rather than per order.
+    """
+
+    # Create the orders
+    orders = order__bulk_create(
+        instances=[order__build(customer_id=order_data["customer_id"]) for order_data in orders_data]
+    )
+
+    # Create the order items, and payments
+    items, payments = [], []
+    for order, order_data in zip(orders, orders_data, strict=True):
+        quantities = _order__collapse__items(order_items_data=order_data["menu_items"])
+        items.extend(order_item__build(order=order, item_id=item_id, quantity=q) for item_id, q in quantities.items())
+        payments.append(order_payment__build(order=order, payment_info_id=order_data["payment_info_id"]))
+
+    _ = order_item__bulk_create(instances=items)
+    _ = order_payment__bulk_create(instances=payments)
+
+    # schedule the (coalesced) auto-rejection tasks
+    windows = {int(order.created_at.timestamp()) // ORDER__AUTO_REJECT_WINDOW_SECONDS: order for order in orders}
+    for order in windows.values():
+        order__schedule__auto_reject(order=order)
+
+    return orders
+
+
+@typechecked
+def order__bulk_reject(*, queryset: OrderQuerySet, batch_size: int = ORDER__BULK_REJECT_BATCH_SIZE) -> list[int]:
+    """
+    Reject the orders matched by `queryset` using set-based statements, returning the primary keys of
+    the orders that were rejected.
+
+    Each chunk runs as a single `UPDATE ... RETURNING` in its own transaction, mirroring the
+    `OrderFSM.mark_as_rejected` transition (i.e. only orders in a valid source state are moved to
+    `rejected`, with `rejected_at` and `updated_at` stamped).
+
+    NOTE: rows locked by a concurrent request (e.g. a restaurant accepting the order) are skipped rather
+    than waited on, and the source state is re-checked by the `UPDATE` itself, so an order can never be
+    both accepted and rejected. Skipped orders are picked up by a later run if they are still stale.
+    """
+
+    # resolve identifiers once, the statement is the same for every chunk
+    table = connection.ops.quote_name(Order._meta.db_table)
+    pk_column = connection.ops.quote_name(Order._meta.pk.column)
+    uid_column = connection.ops.quote_name(Order._meta.get_field("uid").column)
+    status_column = connection.ops.quote_name(Order._meta.get_field("status").column)
+    rejected_at_column = connection.ops.quote_name(Order._meta.get_field("rejected_at").column)
+    updated_at_column = connection.ops.quote_name(Order._meta.get_field("updated_at").column)
+    source_states = tuple(str(state) for state in ORDER__REJECTED_SOURCE_STATES)
+
+    rejected_pks: list[int] = []
+    while True:
+        with transaction.atomic():
+            # lock the next chunk of candidate orders, skipping any held by concurrent transitions
+            chunk_qs = (
+                queryset.filter(status__in=source_states)
+                .order_by("created_at")
+                .select_for_update(skip_locked=True)
+                .values("pk")[:batch_size]
+            )
+            chunk_sql, chunk_params = chunk_qs.query.sql_with_params()
+
+            # transition the chunk in a single statement
+            rejected_at = timezone.now()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} "
+                    f"SET {status_column} = %s, {rejected_at_column} = %s, {updated_at_column} = %s "
+                    f"WHERE {pk_column} IN ({chunk_sql}) AND {status_column} IN %s "
+                    f"RETURNING {pk_column}, {uid_column}",
+                    [str(OrderStatus.REJECTED), rejected_at, rejected_at, *chunk_params, source_states],
+                )
+                rows = cursor.fetchall()
+                chunk_pks = [pk for pk, _ in rows]
+
+            order__publish__event(event=OrderEvent.REJECTED, order_ids=[str(uid) for _, uid in rows])
+
+        rejected_pks.extend(chunk_pks)
+
+        # a partial chunk means there is nothing left to lock
+        if len(chunk_pks) < batch_size:
+            break
+
+    if rejected_pks:
+        order__invalidate__list_cache()
+
+    return rejected_pks
+
+
+@typechecked
+def order__handle__stale_orders(
+    *,
+    order_ids: list[int] | None = None,
+    placed_from: datetime | None = None,
+    placed_to: datetime | None = None,
+) -> int:
+    """
+    Handle orders that have become stale (i.e. exceeded the auto-rejection time window)
+
+    By default all stale orders are handled, optionally narrowed down to specific orders
+    (`order_ids`) and/or orders placed within a window (`placed_from` inclusive, `placed_to` exclusive).
+    """
 
     # avoid circular import
     from ..selectors import order__list
 
+    started = time.perf_counter()
+
     # get stale orders
-    stale_orders = order__list().stale()
+    stale_orders = order__list(optimized=False).stale()
+
+    # narrow down to the targeted orders
+    if order_ids is not None:
+        stale_orders = stale_orders.filter(pk__in=order_ids)
+    if placed_from is not None:
+        stale_orders = stale_orders.filter(created_at__gte=placed_from)
+    if placed_to is not None:
+        stale_orders = stale_orders.filter(created_at__lt=placed_to)
+
+    # reject stale orders in bulk
+    rejected_pks = order__bulk_reject(queryset=stale_orders)
+
+    order__record__stale_sweep(duration=time.perf_counter() - started, rows=len(rejected_pks))
 
-    if stale_orders.exists():
-        # reject stale orders
-        for order in stale_orders:
-            order.mark_as_rejected()
-            order.save()
+    return len(rejected_pks)
 
-    return stale_orders.count()
+
+@typechecked
+def order__schedule__auto_reject(*, order: Order) -> None:
+    """
+    Schedule the targeted auto-rejection of an order once it becomes stale.
+
+    Orders placed within the same window (see `ORDER__AUTO_REJECT_WINDOW_SECONDS`) are coalesced into a
+    single task, which is only scheduled by the first order placed in that window.
+
+    NOTE: the periodic `RejectStaleOrdersTask` sweep remains as a safety net for anything missed here.
+    """
+
+    # avoid circular import
+    from ..tasks import AutoRejectOrdersTask
+
+    # determine the window the order was placed in
+    window_start_ts = int(order.created_at.timestamp()) // ORDER__AUTO_REJECT_WINDOW_SECONDS
+    window_start_ts *= ORDER__AUTO_REJECT_WINDOW_SECONDS
+    window_start = datetime.fromtimestamp(window_start_ts, tz=order.created_at.tzinfo)
+    window_end = window_start + timedelta(seconds=ORDER__AUTO_REJECT_WINDOW_SECONDS)
+
+    # all orders in the window are stale once the last possible one is
+    eta = window_end + timedelta(minutes=ORDER__AUTO_REJECT_MINUTES)
+
+    def schedule() -> None:
+        # only the first order in the window schedules the task (i.e. `SET NX`)
+        key = ORDER__AUTO_REJECT_CACHE_KEY.format(window_start=window_start_ts)
+        timeout = int((eta - window_start).total_seconds()) + ORDER__AUTO_REJECT_WINDOW_SECONDS
+        if not cache.add(key, True, timeout=timeout):
+            return
+
+        _ = AutoRejectOrdersTask.apply_async(
+            kwargs={"placed_from": window_start.isoformat(), "placed_to": window_end.isoformat()},
+            eta=eta,
+        )
+
+    # NOTE: only schedule once the order has been committed, otherwise a rolled back placement
+    # could claim the window without a task ever being sent
+    transaction.on_commit(schedule)
@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+
+import structlog
+from core.utils.partitions import (
+    add_months,
+    create_month_partitions,
+    detach_partition,
+    get_month,
+    get_month_partitions,
+    get_months,
+)
+from core.utils.typechecks import typechecked
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..constants import ORDER__PARTITION_FOREIGN_KEY, ORDER__PARTITION_MONTHS_AHEAD
+from ..models import Order, OrderItem, OrderPayment
+
+logger = structlog.get_logger(__name__)
+
+
+@typechecked
+def order__create__partitions(
+    *, since: datetime | None = None, months_ahead: int = ORDER__PARTITION_MONTHS_AHEAD
+) -> list[str]:
+    """
+    Create the (missing) monthly partitions of the order, order item and order payment tables, from the month of
+    `since` (by default, the current month) up to `months_ahead` months ahead, returning the partitions created.
+
+    NOTE: idempotent, partitions which already exist are left as is.
+    """
+
+    now = timezone.now().astimezone(UTC)
+    months = get_months((since or now).astimezone(UTC), add_months(get_month(now), months_ahead))
+
+    created = []
+    with transaction.atomic():
+        for model in (Order, OrderItem, OrderPayment):
+            created.extend(create_month_partitions(connection, model._meta.db_table, months))
+
+    if created:
+        logger.info("order_partitions_created", partitions=created)
+
+    return created
+
+
+@typechecked
+def order__detach__partitions(*, before: datetime) -> list[str]:
+    """
+    Detach the monthly partitions of the order, order item and order payment tables for the months before that of
+    `before`, returning the partitions detached, which are left as standalone tables (e.g. to be archived, or dropped).
+
+    NOTE: the partitions of order items and payments are detached first, along with their foreign keys, as they
+    reference the partitions of orders.
+    """
+
+    month = get_month(before.astimezone(UTC))
+
+    detached = []
+    with transaction.atomic():
+        for model in (OrderItem, OrderPayment, Order):
+            table = model._meta.db_table
+            foreign_keys = []
+            if model is not Order:
+                foreign_keys.append(ORDER__PARTITION_FOREIGN_KEY.format(model_name=model._meta.model_name))
+            for partition, partition_month in get_month_partitions(connection, table).items():
+                if partition_month < month:
+                    detach_partition(connection, table, partition, foreign_keys=foreign_keys)
+                    detached.append(partition)
+
+    if detached:
+        logger.info("order_partitions_detached", partitions=detached)
+
+    return detached
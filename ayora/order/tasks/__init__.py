@@ -1 +1 @@
-from .orders import RejectStaleOrdersTask
+from .orders import ArchiveOrdersTask, AutoRejectOrdersTask, CreateOrderPartitionsTask, RejectStaleOrdersTask
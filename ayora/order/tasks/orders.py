@@ -1,8 +1,9 @@
+from datetime import datetime
 from typing import Any
 
 from celery import Task
 from config.celery import app
-from typeguard import typechecked
+from core.utils.typechecks import typechecked
 
 
 @typechecked
@@ -22,4 +23,60 @@ class RejectStaleOrdersTask(Task):
         return count
 
 
+@typechecked
+class AutoRejectOrdersTask(Task):
+    """Task to reject specific orders (by id, or placement window) once they have become stale."""
+
+    def run(
+        self,
+        order_ids: list[int] | None = None,
+        placed_from: str | None = None,
+        placed_to: str | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> int:
+        # avoid circular import
+        from ..services import order__handle__stale_orders
+
+        # handle the targeted stale orders (if they exist)
+        # NOTE: datetimes are passed as ISO strings to remain JSON serializable
+        count = order__handle__stale_orders(
+            order_ids=order_ids,
+            placed_from=datetime.fromisoformat(placed_from) if placed_from else None,
+            placed_to=datetime.fromisoformat(placed_to) if placed_to else None,
+        )
+
+        return count
+
+
+@typechecked
+class CreateOrderPartitionsTask(Task):
+    """Task to create the monthly partitions of the order tables ahead of time."""
+
+    def run(self, *args: Any, **kwargs: Any) -> list[str]:
+        # avoid circular import
+        from ..services import order__create__partitions
+
+        # NOTE: partitions are created months ahead, so a missed run (or several) never leaves orders without one
+        return order__create__partitions()
+
+
+@typechecked
+class ArchiveOrdersTask(Task):
+    """Task to archive finalised orders (with their items and payments) out of the order tables."""
+
+    def run(self, *args: Any, **kwargs: Any) -> int:
+        # avoid circular import
+        from ..services import order__archive__finalised_orders
+
+        # NOTE: each run archives a bounded number of batches, so a backlog is drained over several runs
+        return order__archive__finalised_orders()
+
+
 RejectStaleOrdersTask = app.register_task(RejectStaleOrdersTask())
+
+AutoRejectOrdersTask = app.register_task(AutoRejectOrdersTask())
+
+CreateOrderPartitionsTask = app.register_task(CreateOrderPartitionsTask())
+
+ArchiveOrdersTask = app.register_task(ArchiveOrdersTask())
@@ -0,0 +1,94 @@
+import pytest
+from django.db import connection
+
+from order.filters import OrderFilter
+from order.selectors import order__list
+
+
+@pytest.fixture
+def disable_seqscan(db) -> None:
+    """Discourage sequential scans so plans reflect index usability rather than (tiny) table sizes."""
+
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def get_partition_indexes(index_name: str) -> list[str]:
+    """Return the indexes of the partitions (i.e. of a partitioned table) which inherit the given index."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s",
+            [index_name],
+        )
+        return [name for (name,) in cursor.fetchall()]
+
+
+def assert_index_scan(queryset, index_name: str) -> None:
+    """Assert the query plan for the queryset uses the given index (i.e. on each partition scanned)."""
+
+    plan = queryset.explain()
+    assert "Seq Scan" not in plan, plan
+
+    index_names = get_partition_indexes(index_name) or [index_name]
+    scanned = [line for line in plan.splitlines() if " using " in line]
+    assert scanned, plan
+    assert all(any(f" using {name} " in line for name in index_names) for line in scanned), plan
+
+
+def test__success__order__indexes__stale(disable_seqscan, generate_orders):
+    """Test that the stale order sweep uses the partial index on placed orders."""
+
+    _ = generate_orders(amount=3)
+
+    assert_index_scan(order__list(optimized=False).stale(), "order__order__placed_idx")
+
+
+def test__success__order__indexes__actionable(disable_seqscan, generate_orders):
+    """Test that actionable orders use the partial index on placed orders."""
+
+    _ = generate_orders(amount=3)
+
+    assert_index_scan(order__list(optimized=False).actionable(), "order__order__placed_idx")
+
+
+@pytest.mark.parametrize(
+    "data, index_name",
+    [
+        ({}, "order__order__created_idx"),
+        ({"status": "accepted"}, "order__order__status_idx"),
+        ({"status": "REJECTED"}, "order__order__status_idx"),
+    ],
+)
+def test__success__order__indexes__restaurant_list(disable_seqscan, data, index_name, generate_orders):
+    """Test that the (paginated) restaurant order list uses an index matching its filters and ordering."""
+
+    _ = generate_orders(amount=3)
+
+    queryset = OrderFilter(data=data, queryset=order__list(optimized=False)).qs[:20]
+
+    assert_index_scan(queryset, index_name)
+
+
+@pytest.mark.parametrize(
+    "data, index_name",
+    [
+        ({}, "order__order__created_idx"),
+        ({"status": "placed"}, "order__order__status_idx"),
+    ],
+)
+def test__success__order__indexes__restaurant_list__cursor(disable_seqscan, data, index_name, generate_orders):
+    """Test that a cursor paginated restaurant order list page uses an index matching its keyset."""
+
+    orders = generate_orders(amount=3)
+
+    queryset = (
+        OrderFilter(data=data, queryset=order__list(optimized=False))
+        .qs.filter(created_at__lt=orders[-1].created_at)
+        .order_by("-created_at", "-id")[:20]
+    )
+
+    assert_index_scan(queryset, index_name)
@@ -0,0 +1,216 @@
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.files.storage import storages
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from core.utils.databases import advisory_lock
+from order.constants import ORDER__ARCHIVE_LOCK_KEY
+from order.enums import OrderStatus
+from order.models import Order, OrderItem, OrderPayment
+from order.services import (
+    order__archive__finalised_orders,
+    order__create_items_for_order,
+    order__create_payment_for_order,
+)
+from order.services import archives
+
+
+@pytest.fixture
+def archive_storage(settings):
+    """Archive orders to an in-memory storage."""
+
+    settings.STORAGES = {**settings.STORAGES, "archive": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+    settings.ORDER__ARCHIVE_STORAGE = "archive"
+    return storages["archive"]
+
+
+def place_orders(generate_orders, amount: int, status: str, days_ago: int) -> list[Order]:
+    """Place orders (with an item and a payment each) in the given status, backdated by the given days."""
+
+    orders = generate_orders(amount=amount, status=status)
+    for order in orders:
+        order__create_items_for_order(order=order, order_items_data=[{"item_id": "item1", "quantity": 2}])
+        order__create_payment_for_order(order=order, payment_info_id=f"payment-{order.pk}")
+
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+        created_at=timezone.now() - timedelta(days=days_ago)
+    )
+    return orders
+
+
+def get_archive_files(storage) -> list[str]:
+    """Return the names of every archive file (in order)."""
+
+    return sorted(
+        f"orders/{year}/{month}/{directory}/{name}"
+        for year in storage.listdir("orders")[0]
+        for month in storage.listdir(f"orders/{year}")[0]
+        for directory in storage.listdir(f"orders/{year}/{month}")[0]
+        for name in storage.listdir(f"orders/{year}/{month}/{directory}")[1]
+    )
+
+
+def read_archive(storage) -> list[dict]:
+    """Return the archived orders, across every archive file (in order)."""
+
+    lines = []
+    for name in get_archive_files(storage):
+        with storage.open(name) as file:
+            lines.extend(gzip.decompress(file.read()).decode().splitlines())
+    return [json.loads(line) for line in lines]
+
+
+def test__success__order__archive__finalised_orders(archive_storage, generate_orders, settings):
+    """Test that only finalised orders older than the cutoff are archived, with their items and payments."""
+
+    settings.ORDER__ARCHIVE_AFTER_DAYS = 90
+    archived = [
+        *place_orders(generate_orders, amount=2, status=OrderStatus.ACCEPTED, days_ago=100),
+        *place_orders(generate_orders, amount=1, status=OrderStatus.REJECTED, days_ago=95),
+    ]
+    placed = place_orders(generate_orders, amount=1, status=OrderStatus.PLACED, days_ago=100)
+    recent = place_orders(generate_orders, amount=1, status=OrderStatus.ACCEPTED, days_ago=10)
+    rows = REGISTRY.get_sample_value("ayora_order_archive_rows_total") or 0
+
+    count = order__archive__finalised_orders()
+
+    assert count == 3
+    assert set(Order.objects.values_list("pk", flat=True)) == {placed[0].pk, recent[0].pk}
+    assert set(OrderItem.objects.values_list("order_id", flat=True)) == {placed[0].pk, recent[0].pk}
+    assert set(OrderPayment.objects.values_list("order_id", flat=True)) == {placed[0].pk, recent[0].pk}
+
+    lines = read_archive(archive_storage)
+    assert [line["id"] for line in lines] == [order.pk for order in archived]
+    assert lines[0]["orderitems"][0]["item_id"] == "item1"
+    assert lines[0]["orderpayments"][0]["payment_info_id"] == f"payment-{archived[0].pk}"
+
+    assert REGISTRY.get_sample_value("ayora_order_archive_rows_total") == rows + 3
+    assert REGISTRY.get_sample_value("ayora_order_archive_lag_seconds") == 0
+
+
+def test__success__order__archive__finalised_orders__resumable(archive_storage, generate_orders):
+    """Test that a bounded run archives whole batches, leaving the rest (and a lag) to the next run."""
+
+    orders = place_orders(generate_orders, amount=5, status=OrderStatus.ACCEPTED, days_ago=100)
+
+    count = order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=1)
+
+    assert count == 2
+    assert Order.objects.count() == 3
+    assert REGISTRY.get_sample_value("ayora_order_archive_lag_seconds") > 0
+
+    count = order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=None)
+
+    assert count == 3
+    assert Order.objects.count() == 0
+    assert [line["id"] for line in read_archive(archive_storage)] == sorted(order.pk for order in orders)
+    assert REGISTRY.get_sample_value("ayora_order_archive_lag_seconds") == 0
+
+
+def test__success__order__archive__finalised_orders__rerun_after_failure(archive_storage, generate_orders, monkeypatch):
+    """Test that orders archived again (i.e. as their deletion failed) are never duplicated, whatever their batch."""
+
+    orders = place_orders(generate_orders, amount=5, status=OrderStatus.ACCEPTED, days_ago=100)
+
+    def fail():
+        raise RuntimeError("commit failed")
+
+    # fail the deletion of the first batch, once its file is written
+    with monkeypatch.context() as patch:
+        patch.setattr(archives, "order__invalidate__list_cache", fail)
+        with pytest.raises(RuntimeError):
+            order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=1)
+
+    assert Order.objects.count() == 5
+
+    # archive again, in differently sized batches
+    count = order__archive__finalised_orders(older_than_days=90, batch_size=3, max_batches=None)
+
+    assert count == 5
+    assert Order.objects.count() == 0
+    assert [line["id"] for line in read_archive(archive_storage)] == sorted(order.pk for order in orders)
+
+
+def test__success__order__archive__finalised_orders__rerun_after_save_failure(
+    archive_storage, generate_orders, monkeypatch
+):
+    """Test that the orders of an archive file are kept when its replacement (i.e. merged with a batch) fails."""
+
+    # NOTE: every order is archived to the same directory, whatever its id
+    monkeypatch.setattr(archives, "ORDER__ARCHIVE_FILE_IDS", 10**12)
+    orders = place_orders(generate_orders, amount=4, status=OrderStatus.ACCEPTED, days_ago=100)
+    order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=1)
+    [name] = get_archive_files(archive_storage)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    # fail the save of the merged file
+    with monkeypatch.context() as patch:
+        patch.setattr(archive_storage, "save", fail)
+        with pytest.raises(OSError):
+            order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=None)
+
+    assert get_archive_files(archive_storage) == [name]
+    assert [line["id"] for line in read_archive(archive_storage)] == sorted(order.pk for order in orders[:2])
+    assert Order.objects.count() == 2
+
+    count = order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=None)
+
+    assert count == 2
+    assert len(get_archive_files(archive_storage)) == 1
+    assert [line["id"] for line in read_archive(archive_storage)] == sorted(order.pk for order in orders)
+
+
+@pytest.mark.parametrize("allow_overwrite", [False, True])
+def test__success__order__archive__finalised_orders__file_name_taken(
+    generate_orders, monkeypatch, settings, tmp_path, allow_overwrite
+):
+    """Test that an archive file is replaced when its replacement is named alike, whether renamed or overwriting it."""
+
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "archive": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": tmp_path, "allow_overwrite": allow_overwrite},
+        },
+    }
+    settings.ORDER__ARCHIVE_STORAGE = "archive"
+    archive_storage = storages["archive"]
+    monkeypatch.setattr(archives, "ORDER__ARCHIVE_FILE_IDS", 10**12)
+    orders = place_orders(generate_orders, amount=4, status=OrderStatus.ACCEPTED, days_ago=100)
+
+    # NOTE: the replacement is written at the same time, so is named like the file it replaces
+    now = timezone.now()
+    monkeypatch.setattr(timezone, "now", lambda: now)
+    order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=1)
+    [name] = get_archive_files(archive_storage)
+
+    count = order__archive__finalised_orders(older_than_days=90, batch_size=2, max_batches=None)
+
+    assert count == 2
+    assert len(get_archive_files(archive_storage)) == 1
+    assert (get_archive_files(archive_storage) == [name]) is allow_overwrite
+    assert [line["id"] for line in read_archive(archive_storage)] == sorted(order.pk for order in orders)
+
+
+def test__success__order__archive__finalised_orders__skipped_in_progress(archive_storage, generate_orders):
+    """Test that a run is skipped while another one is in progress (i.e. holds the lock), and released once done."""
+
+    _ = place_orders(generate_orders, amount=1, status=OrderStatus.ACCEPTED, days_ago=100)
+
+    with advisory_lock(ORDER__ARCHIVE_LOCK_KEY):
+        count = order__archive__finalised_orders(older_than_days=90)
+
+    assert count == 0
+    assert Order.objects.count() == 1
+
+    count = order__archive__finalised_orders(older_than_days=90)
+
+    assert count == 1
+    with advisory_lock(ORDER__ARCHIVE_LOCK_KEY) as acquired:
+        assert acquired
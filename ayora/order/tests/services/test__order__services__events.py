@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+
+from order.constants import ORDER__EVENTS_CHANNEL
+from order.enums import OrderEvent
+from order.services import get_events_client, order__create, order__publish__event
+from order.views.events import stream_order_events
+
+
+@pytest.fixture
+def order_events():
+    """Subscribe to the order events channel, yielding a callable returning the events published so far."""
+
+    pubsub = get_events_client().pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(ORDER__EVENTS_CHANNEL)
+
+    def get_events() -> list[dict]:
+        events = []
+        while message := pubsub.get_message(timeout=0.5):
+            events.append(json.loads(message["data"]))
+        return events
+
+    yield get_events
+    pubsub.close()
+
+
+@pytest.mark.django_db
+def test__success__order__publish__event__on_commit(order_events, django_capture_on_commit_callbacks):
+    """Test that order changes are published once committed, and only then."""
+
+    with django_capture_on_commit_callbacks(execute=True):
+        order = order__create(customer_id="customer")
+        assert order_events() == []
+
+    assert order_events() == [{"event": OrderEvent.PLACED, "order_ids": [str(order.uid)]}]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        order.mark_as_accepted()
+
+    assert order_events() == [{"event": OrderEvent.ACCEPTED, "order_ids": [str(order.uid)]}]
+
+
+def test__success__order__events__stream(order_events):
+    """Test that published events are streamed as server-sent events, with keep-alives in between."""
+
+    async def consume() -> list[str]:
+        stream = stream_order_events(heartbeat=0.1, max_seconds=0.5)
+        chunks = [await anext(stream)]
+
+        # NOTE: published from another connection while the stream is subscribed
+        await asyncio.to_thread(
+            get_events_client().publish,
+            ORDER__EVENTS_CHANNEL,
+            json.dumps({"event": OrderEvent.PLACED, "order_ids": ["abc"]}),
+        )
+        chunks.extend([chunk async for chunk in stream])
+        return chunks
+
+    chunks = asyncio.run(consume())
+
+    assert chunks[0] == "retry: 100\n\n"
+    assert 'event: order\ndata: {"event": "placed", "order_ids": ["abc"]}\n\n' in chunks
+    assert ": keep-alive\n\n" in chunks
+
+
+def test__success__order__publish__event__nothing_to_publish(order_events, django_capture_on_commit_callbacks):
+    """Test that no event is published for an empty set of orders."""
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        order__publish__event(event=OrderEvent.REJECTED, order_ids=[])
+
+    assert callbacks == []
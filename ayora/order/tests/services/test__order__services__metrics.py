@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from order.constants import ORDER__AUTO_REJECT_MINUTES
+from order.enums import OrderStatus
+from order.models import Order
+from order.services import order__create, order__handle__stale_orders, order__transition
+
+
+def get_sample(name: str, labels: dict | None = None) -> float:
+    """Return the current value of a metric sample (`0` if never recorded)."""
+
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+@pytest.mark.django_db
+def test__success__order__record__event__on_commit(django_capture_on_commit_callbacks):
+    """Test that placements and transitions are counted once committed, and only then."""
+
+    placed = get_sample("ayora_orders_total", {"event": "placed"})
+    accepted = get_sample("ayora_orders_total", {"event": "accepted"})
+
+    with django_capture_on_commit_callbacks(execute=True):
+        order = order__create(customer_id="customer")
+        assert get_sample("ayora_orders_total", {"event": "placed"}) == placed
+
+    assert get_sample("ayora_orders_total", {"event": "placed"}) == placed + 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        order__transition(order=order, target=OrderStatus.ACCEPTED)
+
+    assert get_sample("ayora_orders_total", {"event": "accepted"}) == accepted + 1
+
+
+def test__success__order__record__stale_sweep(generate_orders, django_capture_on_commit_callbacks):
+    """Test that stale sweeps record their duration and rows, and count the auto-rejected orders."""
+
+    sweeps = get_sample("ayora_order_stale_sweep_duration_seconds_count")
+    rows = get_sample("ayora_order_stale_sweep_rows_total")
+    auto_rejected = get_sample("ayora_orders_total", {"event": "auto_rejected"})
+
+    stale_orders = generate_orders(amount=3)
+    created_at = timezone.now() - timedelta(minutes=ORDER__AUTO_REJECT_MINUTES + 1)
+    Order.objects.filter(pk__in=[order.pk for order in stale_orders]).update(created_at=created_at)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        count = order__handle__stale_orders()
+
+    assert count == 3
+    assert get_sample("ayora_order_stale_sweep_duration_seconds_count") == sweeps + 1
+    assert get_sample("ayora_order_stale_sweep_rows_total") == rows + 3
+    assert get_sample("ayora_orders_total", {"event": "auto_rejected"}) == auto_rejected + 3
@@ -0,0 +1,47 @@
+import uuid
+
+from order.models import OrderItem
+from order.services import order__create_items_for_order
+
+
+def test__success__order__create_items_for_order__upsert(generate_orders, generate_order_items):
+    """Test that new items are created and existing items have their quantity accumulated."""
+
+    order = generate_orders()[0]
+    existing_item = generate_order_items(order=order)[0]
+    existing_quantity = existing_item.quantity
+    new_item_id = str(uuid.uuid4())
+
+    items = order__create_items_for_order(
+        order=order,
+        order_items_data=[
+            {"item_id": existing_item.item_id, "quantity": 2},
+            {"item_id": new_item_id, "quantity": 3},
+        ],
+    )
+
+    # verify the returned items reflect the final state
+    quantities = {item.item_id: item.quantity for item in items}
+    assert quantities == {existing_item.item_id: existing_quantity + 2, new_item_id: 3}
+    assert all(item.order == order for item in items)
+
+    # verify the persisted state
+    existing_item.refresh_from_db()
+    assert existing_item.quantity == existing_quantity + 2
+    assert OrderItem.objects.get(order=order, item_id=new_item_id).quantity == 3
+
+
+def test__success__order__create_items_for_order__duplicates_collapsed(generate_orders, django_assert_num_queries):
+    """Test that repeated items within the same payload are collapsed into a single statement."""
+
+    order = generate_orders()[0]
+    item_id = str(uuid.uuid4())
+
+    with django_assert_num_queries(1):
+        items = order__create_items_for_order(
+            order=order,
+            order_items_data=[{"item_id": item_id, "quantity": 1}, {"item_id": item_id, "quantity": 4}],
+        )
+
+    assert [(item.item_id, item.quantity) for item in items] == [(item_id, 5)]
+    assert OrderItem.objects.get(order=order, item_id=item_id).quantity == 5
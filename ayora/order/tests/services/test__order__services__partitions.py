@@ -0,0 +1,128 @@
+from datetime import UTC, date, datetime, timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from core.utils.partitions import add_months, get_month, get_month_partition_name, get_partitions
+from order.constants import (
+    ORDER__AUTO_REJECT_MINUTES,
+    ORDER__PARTITION_MONTHS_AHEAD,
+    ORDER__STALE_SWEEP_LOOKBACK_DAYS,
+)
+from order.models import Order, OrderItem, OrderPayment
+from order.selectors import order__list
+from order.services import (
+    order__create__partitions,
+    order__create_items_for_order,
+    order__create_payment_for_order,
+    order__detach__partitions,
+)
+
+TABLES = [Order._meta.db_table, OrderItem._meta.db_table, OrderPayment._meta.db_table]
+
+
+def get_current_month():
+    return get_month(timezone.now().astimezone(UTC))
+
+
+def get_month_start(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=UTC)
+
+
+def get_partition(model, pk: int) -> str:
+    """Return the partition a row is stored in."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT tableoid::regclass::text FROM {model._meta.db_table} WHERE id = %s", [pk])
+        return cursor.fetchone()[0]
+
+
+def place_order(generate_orders) -> Order:
+    [order] = generate_orders(amount=1)
+    order__create_items_for_order(order=order, order_items_data=[{"item_id": "item1", "quantity": 1}])
+    order__create_payment_for_order(order=order, payment_info_id="payment1")
+    return order
+
+
+def test__success__order__create__partitions(db):
+    """Test that the monthly partitions of every order table are created ahead, and only once."""
+
+    month = add_months(get_current_month(), ORDER__PARTITION_MONTHS_AHEAD + 2)
+
+    created = order__create__partitions(months_ahead=ORDER__PARTITION_MONTHS_AHEAD + 2)
+
+    assert sorted(created) == sorted(
+        get_month_partition_name(table, add_months(month, offset)) for table in TABLES for offset in (-1, 0)
+    )
+    for table in TABLES:
+        assert get_month_partition_name(table, month) in get_partitions(connection, table)
+
+    assert order__create__partitions(months_ahead=ORDER__PARTITION_MONTHS_AHEAD + 2) == []
+
+
+def test__success__order__partitions__colocated(generate_orders):
+    """Test that the items and payment of an order are stored in the partition of its month, moving along with it."""
+
+    order = place_order(generate_orders)
+    item, payment = order.orderitems.get(), order.orderpayments.get()
+
+    assert item.order_created_at == payment.order_created_at == order.created_at
+    for model, pk in ((Order, order.pk), (OrderItem, item.pk), (OrderPayment, payment.pk)):
+        assert get_partition(model, pk) == get_month_partition_name(model._meta.db_table, get_current_month())
+
+    # backdate the order, beyond the partitioned months
+    Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=366))
+
+    for model, pk in ((Order, order.pk), (OrderItem, item.pk), (OrderPayment, payment.pk)):
+        assert get_partition(model, pk) == f"{model._meta.db_table}_default"
+
+
+def test__success__order__partitions__stale_pruned(generate_orders):
+    """Test that the stale order sweep only scans the partitions of the months within its bounds."""
+
+    # NOTE: the sweep looks back 31 days, so may scan the partitions of the previous two months (e.g. on March 1st)
+    past_month = add_months(get_current_month(), -3)
+    order__create__partitions(since=get_month_start(past_month))
+
+    _ = generate_orders(amount=1)
+
+    # NOTE: the scanned months are derived from the bounds of the sweep, as its cutoff lags behind the current time
+    # (e.g. in the first minutes of a month, the partition of the current month is pruned as well)
+    cutoff_time = timezone.now().astimezone(UTC) - timedelta(minutes=ORDER__AUTO_REJECT_MINUTES)
+    lookback_month = get_month(cutoff_time - timedelta(days=ORDER__STALE_SWEEP_LOOKBACK_DAYS))
+    scanned_months = [lookback_month]
+    while scanned_months[-1] < get_month(cutoff_time):
+        scanned_months.append(add_months(scanned_months[-1], 1))
+
+    plan = order__list(optimized=False).stale().explain()
+
+    for offset in range(-3, 2):
+        month = add_months(get_current_month(), offset)
+        partition = get_month_partition_name(Order._meta.db_table, month)
+        assert partition in get_partitions(connection, Order._meta.db_table)
+        assert (partition in plan) is (month in scanned_months)
+
+
+def test__success__order__detach__partitions(generate_orders):
+    """Test that the partitions of past months are detached (items and payments first), keeping their rows."""
+
+    past_month = add_months(get_current_month(), -2)
+    order__create__partitions(since=get_month_start(past_month))
+
+    order = place_order(generate_orders)
+    recent_order = place_order(generate_orders)
+    Order.objects.filter(pk=order.pk).update(created_at=get_month_start(past_month) + timedelta(days=14))
+
+    # run the (deferred) foreign key checks, as if committed
+    connection.check_constraints()
+
+    detached = order__detach__partitions(before=get_month_start(add_months(past_month, 1)))
+
+    assert get_month_partition_name(Order._meta.db_table, past_month) in detached
+    assert list(Order.objects.values_list("pk", flat=True)) == [recent_order.pk]
+    assert OrderItem.objects.get().order_id == recent_order.pk
+    assert OrderPayment.objects.get().order_id == recent_order.pk
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT id FROM {get_month_partition_name(Order._meta.db_table, past_month)}")
+        assert cursor.fetchall() == [(order.pk,)]
@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from order.constants import ORDER__AUTO_REJECT_MINUTES
+from order.enums import OrderStatus
+from order.models import Order
+from order.selectors import order__list
+from order.services import order__bulk_reject, order__handle__stale_orders
+
+
+def make_stale(orders: list[Order]) -> None:
+    """Backdate the given orders beyond the auto-rejection window."""
+
+    created_at = timezone.now() - timedelta(minutes=ORDER__AUTO_REJECT_MINUTES + 1)
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(created_at=created_at)
+
+
+@pytest.mark.parametrize("stale_amount, fresh_amount", [(0, 2), (3, 0), (4, 2)])
+def test__success__order__handle__stale_orders(stale_amount, fresh_amount, generate_orders):
+    """Test that only stale placed orders are rejected, and the exact count is returned."""
+
+    stale_orders = generate_orders(amount=stale_amount)
+    make_stale(stale_orders)
+    _ = generate_orders(amount=fresh_amount)
+
+    count = order__handle__stale_orders()
+
+    assert count == stale_amount
+    assert Order.objects.filter(status=OrderStatus.REJECTED).count() == stale_amount
+    assert Order.objects.filter(status=OrderStatus.PLACED).count() == fresh_amount
+
+    # verify the transition matches the FSM rules
+    for order in Order.objects.filter(status=OrderStatus.REJECTED):
+        assert order.rejected_at is not None
+        assert order.accepted_at is None
+        assert order.updated_at == order.rejected_at
+
+
+def test__success__order__handle__stale_orders__finalised_untouched(generate_orders):
+    """Test that stale orders which have already been finalised are left untouched."""
+
+    accepted_orders = generate_orders(amount=2, accepted=True)
+    rejected_orders = generate_orders(amount=2, rejected=True)
+    make_stale(accepted_orders + rejected_orders)
+    rejected_at = {order.pk: order.rejected_at for order in rejected_orders}
+
+    count = order__handle__stale_orders()
+
+    assert count == 0
+    assert Order.objects.filter(status=OrderStatus.ACCEPTED, rejected_at__isnull=True).count() == 2
+    for order in Order.objects.filter(status=OrderStatus.REJECTED):
+        assert order.rejected_at == rejected_at[order.pk]
+
+
+def test__success__order__bulk_reject__chunked(generate_orders):
+    """Test that rejection is applied across multiple chunks."""
+
+    stale_orders = generate_orders(amount=5)
+    make_stale(stale_orders)
+
+    rejected_pks = order__bulk_reject(queryset=order__list(optimized=False).stale(), batch_size=2)
+
+    assert sorted(rejected_pks) == sorted(order.pk for order in stale_orders)
+    assert not order__list().stale().exists()
+
+
+def test__success__order__handle__stale_orders__targeted(generate_orders):
+    """Test that targeted handling only rejects the referenced stale orders."""
+
+    stale_orders = generate_orders(amount=4)
+    make_stale(stale_orders)
+    targeted, untargeted = stale_orders[:2], stale_orders[2:]
+
+    count = order__handle__stale_orders(order_ids=[order.pk for order in targeted])
+
+    assert count == len(targeted)
+    assert Order.objects.filter(pk__in=[order.pk for order in targeted], status=OrderStatus.REJECTED).count() == 2
+    assert Order.objects.filter(pk__in=[order.pk for order in untargeted], status=OrderStatus.PLACED).count() == 2
+
+
+def test__success__order__handle__stale_orders__window(generate_orders):
+    """Test that window-targeted handling only rejects stale orders placed within the window."""
+
+    stale_orders = generate_orders(amount=2)
+    make_stale(stale_orders)
+    older_orders = generate_orders(amount=2)
+    Order.objects.filter(pk__in=[order.pk for order in older_orders]).update(
+        created_at=timezone.now() - timedelta(hours=1)
+    )
+
+    count = order__handle__stale_orders(placed_from=timezone.now() - timedelta(minutes=30))
+
+    assert count == len(stale_orders)
+    assert Order.objects.filter(status=OrderStatus.PLACED).count() == len(older_orders)
+
+
+def test__success__order__schedule__auto_reject__coalesced(
+    generate_orders, monkeypatch, django_capture_on_commit_callbacks
+):
+    """Test that orders placed within the same window share a single scheduled task."""
+
+    from order.services import order__schedule__auto_reject
+    from order.tasks import AutoRejectOrdersTask
+
+    scheduled = []
+    monkeypatch.setattr(AutoRejectOrdersTask, "apply_async", lambda **kwargs: scheduled.append(kwargs))
+
+    # place a burst of orders within the same window
+    orders = generate_orders(amount=5)
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(created_at=orders[0].created_at)
+    with django_capture_on_commit_callbacks(execute=True):
+        for order in Order.objects.filter(pk__in=[order.pk for order in orders]):
+            order__schedule__auto_reject(order=order)
+
+    assert len(scheduled) == 1
+    assert scheduled[0]["eta"] > orders[0].created_at + timedelta(minutes=ORDER__AUTO_REJECT_MINUTES)
@@ -0,0 +1,50 @@
+import pytest
+from django.utils import timezone
+
+from order.enums import OrderStatus
+from order.exceptions import OrderTransitionConflictError
+from order.models import Order
+
+
+@pytest.mark.parametrize(
+    "method, expected_status, timestamp_field",
+    [
+        ("mark_as_accepted", OrderStatus.ACCEPTED, "accepted_at"),
+        ("mark_as_rejected", OrderStatus.REJECTED, "rejected_at"),
+    ],
+)
+def test__success__order__transition(
+    method, expected_status, timestamp_field, generate_orders, django_assert_num_queries
+):
+    """Test that a transition persists the status and timestamp in a single write."""
+
+    order = generate_orders()[0]
+
+    with django_assert_num_queries(1):
+        getattr(order, method)()
+
+    assert order.status == expected_status
+    assert order.is_finalised
+
+    order.refresh_from_db()
+    assert order.status == expected_status
+    assert getattr(order, timestamp_field) is not None
+    assert order.updated_at == getattr(order, timestamp_field)
+
+
+def test__failure__order__transition__lost_race(generate_orders):
+    """Test that a transition raises a conflict, rather than overwriting, when the order was finalised concurrently."""
+
+    order = generate_orders()[0]
+
+    # finalise the order behind the loaded instance's back (e.g. by the stale order sweep)
+    rejected_at = timezone.now()
+    Order.objects.filter(pk=order.pk).update(status=OrderStatus.REJECTED, rejected_at=rejected_at)
+
+    with pytest.raises(OrderTransitionConflictError):
+        order.mark_as_accepted()
+
+    order.refresh_from_db()
+    assert order.status == OrderStatus.REJECTED
+    assert order.rejected_at == rejected_at
+    assert order.accepted_at is None
@@ -0,0 +1,193 @@
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connections
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import include, path, reverse
+from rest_framework import status
+
+from order.enums import OrderStatus
+from order.models import Order
+from order.urls import get_urlpatterns
+from order.views import CustomerOrdersView
+
+# NOTE: route the order endpoints to their async variants (i.e. as with `ORDER__ASYNC_VIEWS`)
+urlpatterns = [path("", include((get_urlpatterns(asynchronous=True), "order"), namespace="orders"))]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+@pytest.fixture
+def async_client() -> AsyncClient:
+    """Unauthenticated (anonymous) async API client, requests are made through the ASGI handler."""
+
+    return AsyncClient()
+
+
+def request(async_client: AsyncClient, method: str, url: str, data: dict | None = None):
+    """Make a (JSON) request through the ASGI handler, from a synchronous test."""
+
+    return async_to_sync(getattr(async_client, method))(url, data, content_type="application/json")
+
+
+def test__success__async__customer_orders__place(async_client, db, django_capture_on_commit_callbacks):
+    """Test that an order is placed, with its items and payment, through the async view."""
+
+    request_data = {"menuItems": [{"itemId": "item1", "quantity": 2}], "paymentInfoId": "payment1"}
+
+    with django_capture_on_commit_callbacks():
+        response = request(
+            async_client, "post", reverse("order:customer-orders", kwargs={"customerId": "customer1"}), request_data
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["menuItems"] == [{"itemId": "item1", "quantity": 2}]
+
+    order = Order.objects.get(uid=response.json()["orderId"])
+    assert order.orderitems.get().quantity == 2
+    assert order.orderpayments.get().payment_info_id == "payment1"
+
+
+def test__failure__async__customer_orders__invalid(async_client, db):
+    """Test that an invalid order is rejected (and nothing is persisted) through the async view."""
+
+    request_data = {"menuItems": [], "paymentInfoId": "payment1"}
+
+    response = request(
+        async_client, "post", reverse("order:customer-orders", kwargs={"customerId": "customer1"}), request_data
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Order.objects.exists()
+
+
+def test__success__async__customer_orders__place__idempotent_retry(async_client, db, monkeypatch):
+    """
+    Test that a retried order placement replays the first response through the async view, a placement failing
+    with an unhandled exception first releasing its lock.
+    """
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer1"})
+    request_data = {"menuItems": [{"itemId": "item1", "quantity": 2}], "paymentInfoId": "payment1"}
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    def perform_create(self, serializer):
+        raise RuntimeError("database unavailable")
+
+    def post():
+        return async_to_sync(async_client.post)(url, request_data, content_type="application/json", headers=headers)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(CustomerOrdersView, "perform_create", perform_create)
+        # NOTE: the exception is left unhandled (i.e. re-raised by DRF), as when the exception handler fails
+        patch.setattr(CustomerOrdersView, "get_exception_handler", lambda self: lambda exc, context: None)
+        with pytest.raises(RuntimeError):
+            post()
+
+    response = post()
+    assert response.status_code == status.HTTP_201_CREATED
+
+    retry_response = post()
+    assert retry_response.status_code == status.HTTP_201_CREATED
+    assert retry_response.headers["Idempotent-Replayed"] == "true"
+    assert retry_response.json() == response.json()
+    assert Order.objects.count() == 1
+
+
+def test__success__async__customer_order__add_items(async_client, generate_orders, generate_order_items):
+    """Test that items are added to an order through the async view."""
+
+    order = generate_orders()[0]
+    request_data = {"menuItems": [{"itemId": "item1", "quantity": 1}], "paymentInfoId": "payment2"}
+
+    response = request(
+        async_client,
+        "patch",
+        reverse("order:customer-order", kwargs={"customerId": order.customer_id, "orderId": order.uid}),
+        request_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert order.orderitems.filter(item_id="item1").exists()
+
+
+@pytest.mark.parametrize("action,expected_status", [("accept", OrderStatus.ACCEPTED), ("reject", OrderStatus.REJECTED)])
+def test__success__async__restaurant_order__action(action, expected_status, async_client, generate_orders):
+    """Test that an order is transitioned through the async view."""
+
+    order = generate_orders()[0]
+
+    response = request(
+        async_client, "patch", reverse("order:restaurant-order", kwargs={"orderId": order.uid}), {"action": action}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    order.refresh_from_db()
+    assert order.status == expected_status
+
+
+def test__failure__async__restaurant_order__already_finalised(async_client, generate_orders):
+    """Test that a finalised order cannot be transitioned through the async view."""
+
+    order = generate_orders(accepted=True)[0]
+
+    response = request(
+        async_client, "patch", reverse("order:restaurant-order", kwargs={"orderId": order.uid}), {"action": "reject"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test__failure__async__restaurant_order__not_found(async_client, db):
+    """Test that an unknown order is not found through the async view."""
+
+    response = request(
+        async_client, "patch", reverse("order:restaurant-order", kwargs={"orderId": "unknown"}), {"action": "accept"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize("params", [{}, {"pagination": "cursor"}])
+def test__success__async__restaurant_orders__list(params, async_client, generate_orders, generate_order_items):
+    """Test that orders are listed (and paginated) through the async view, as through the sync view."""
+
+    orders = generate_orders(amount=3)
+    for order in orders:
+        generate_order_items(amount=2, order=order)
+
+    response = async_to_sync(async_client.get)(reverse("order:restaurant-orders"), params)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {result["orderId"] for result in data["results"]} == {str(order.uid) for order in orders}
+    assert all(len(result["menuItems"]) == 2 for result in data["results"])
+    if not params:
+        assert data["count"] == 3
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+def test__success__async__restaurant_orders__read_from_replica(async_client, generate_orders, settings):
+    """Test that the restaurant orders are listed from the replica through the async view, when one is configured."""
+
+    settings.CORE__REPLICA_DATABASE = "replica"
+    _ = generate_orders(amount=3)
+
+    with CaptureQueriesContext(connections["replica"]) as read:
+        response = request(async_client, "get", reverse("order:restaurant-orders"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == 3
+    assert len(read.captured_queries) > 0
+
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test__success__order_events__routed_with_async_views(asynchronous):
+    """Test that the order events stream is only routed to alongside the async views (i.e. under ASGI)."""
+
+    names = {pattern.name for pattern in get_urlpatterns(asynchronous=asynchronous)}
+
+    assert ("restaurant-order-events" in names) is asynchronous
+    assert "restaurant-orders" in names
@@ -98,3 +98,60 @@ def test__failure__customer_order__put_method_not_allowed(api_client, generate_o
 
     # Assert method not allowed
     assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+def test__success__customer_order__add_items__query_budget(
+    db, api_client, generate_orders, generate_order_items, django_assert_max_num_queries
+):
+    """Test that adding items loads the order once, within a fixed query budget."""
+
+    orders = generate_orders()
+    order = orders[0]
+    existing_item = generate_order_items(order=order)[0]
+    existing_quantity = existing_item.quantity
+
+    # Add to an existing item, and a new item
+    request_data = {
+        "menu_items": [
+            {"item_id": existing_item.item_id, "quantity": 2},
+            {"item_id": str(uuid.uuid4()), "quantity": 1},
+        ],
+        "payment_info_id": str(uuid.uuid4()),
+    }
+
+    # NOTE: savepoint + locked order + item upsert + payment insert + release
+    with django_assert_max_num_queries(5) as captured:
+        response = api_client.patch(
+            reverse("order:customer-order", kwargs={"customerId": order.customer_id, "orderId": order.uid}),
+            request_data,
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # Verify the order is only fetched once (and locked)
+    order_selects = [
+        query["sql"] for query in captured.captured_queries if query["sql"].startswith('SELECT "order_order"')
+    ]
+    assert len(order_selects) == 1
+    assert "FOR UPDATE" in order_selects[0]
+
+    # Verify the quantities
+    existing_item.refresh_from_db()
+    assert existing_item.quantity == existing_quantity + 2
+    assert OrderItem.objects.filter(order=order).count() == 2
+
+
+def test__success__customer_order__add_items__idempotent_retry(db, api_client, generate_orders):
+    """Test that a retried item addition is replayed, rather than adding the items twice."""
+
+    order = generate_orders()[0]
+    url = reverse("order:customer-order", kwargs={"customerId": order.customer_id, "orderId": order.uid})
+    request_data = {"menu_items": [{"item_id": "item1", "quantity": 2}], "payment_info_id": "payment123"}
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    for _ in range(2):
+        response = api_client.patch(url, request_data, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert OrderItem.objects.get(order=order, item_id="item1").quantity == 2
@@ -1,9 +1,15 @@
+import hashlib
+import uuid
+
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 
+from core.mixins.views import IDEMPOTENCY_LOCK_CACHE_KEY
 from order.enums import OrderStatus
 from order.models import Order, OrderItem, OrderPayment
+from order.views import CustomerOrdersView
 
 
 @pytest.mark.parametrize("menu_items_count", [1, 3])
@@ -71,3 +77,81 @@ def test__failure__customer_orders__create__missing_payment_info(db, api_client)
     # Assert the request fails with appropriate error
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert "payment_info_id" in str(response.data)
+
+
+def test__success__customer_orders__create__idempotent_retry(db, api_client, django_assert_num_queries):
+    """Test that a retried order placement replays the first response, without placing a duplicate order."""
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer123"})
+    request_data = {"menu_items": [{"item_id": "item1", "quantity": 1}], "payment_info_id": "payment123"}
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    response = api_client.post(url, request_data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    # NOTE: the retry is served from the cache
+    with django_assert_num_queries(0):
+        retry_response = api_client.post(url, request_data, headers=headers)
+
+    assert retry_response.status_code == status.HTTP_201_CREATED
+    assert retry_response.headers["Idempotent-Replayed"] == "true"
+    assert retry_response.json() == response.json()
+    assert Order.objects.count() == 1
+
+
+def test__failure__customer_orders__create__idempotency_key_reused(db, api_client):
+    """Test that an idempotency key cannot be reused for a different order."""
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer123"})
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    request_data = {"menu_items": [{"item_id": "item1", "quantity": 1}], "payment_info_id": "payment123"}
+    response = api_client.post(url, request_data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    request_data = {"menu_items": [{"item_id": "item2", "quantity": 1}], "payment_info_id": "payment123"}
+    response = api_client.post(url, request_data, headers=headers)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert Order.objects.count() == 1
+
+
+def test__failure__customer_orders__create__idempotent_request_in_progress(db, api_client):
+    """Test that a duplicate of an order placement still in progress is rejected, rather than run concurrently."""
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer123"})
+    request_data = {"menu_items": [{"item_id": "item1", "quantity": 1}], "payment_info_id": "payment123"}
+    key = str(uuid.uuid4())
+
+    # hold the lock, as the first request would
+    digest = hashlib.md5(f"POST:{url}:{key}".encode(), usedforsecurity=False).hexdigest()
+    cache.add(IDEMPOTENCY_LOCK_CACHE_KEY.format(digest=digest), True)
+
+    response = api_client.post(url, request_data, headers={"Idempotency-Key": key})
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert not Order.objects.exists()
+
+
+def test__success__customer_orders__create__idempotent_retry_after_server_error(db, api_client, monkeypatch):
+    """Test that an order placement failing with an unhandled exception releases its lock, so it can be retried."""
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer123"})
+    request_data = {"menu_items": [{"item_id": "item1", "quantity": 1}], "payment_info_id": "payment123"}
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    def perform_create(self, serializer):
+        raise RuntimeError("database unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(CustomerOrdersView, "perform_create", perform_create)
+        # NOTE: the exception is left unhandled (i.e. re-raised by DRF), as when the exception handler fails
+        patch.setattr(CustomerOrdersView, "get_exception_handler", lambda self: lambda exc, context: None)
+        with pytest.raises(RuntimeError):
+            api_client.post(url, request_data, headers=headers)
+
+    response = api_client.post(url, request_data, headers=headers)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "Idempotent-Replayed" not in response.headers
+    assert Order.objects.count() == 1
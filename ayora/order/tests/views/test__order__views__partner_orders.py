@@ -0,0 +1,87 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from order.constants import ORDER__BULK_PLACE_MAX_SIZE
+from order.enums import OrderStatus
+from order.models import Order, OrderItem, OrderPayment
+
+
+def build_order_data(index: int, **kwargs) -> dict:
+    """Build the request data for an order placed in bulk."""
+
+    return {
+        "customer_id": f"customer{index}",
+        "menu_items": [{"item_id": "item1", "quantity": 1}, {"item_id": "item2", "quantity": 2}],
+        "payment_info_id": f"payment{index}",
+        **kwargs,
+    }
+
+
+def test__success__partner_orders__bulk_place(db, api_client, django_assert_max_num_queries):
+    """Test that orders are placed in bulk, with their items and payments, in a bounded number of queries."""
+
+    request_data = {"orders": [build_order_data(index) for index in range(50)]}
+
+    # NOTE: the savepoint, the three inserts and its release, regardless of the number of orders
+    with django_assert_max_num_queries(5):
+        response = api_client.post(reverse("order:partner-orders"), request_data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["created"] == 50
+    assert response.data["failed"] == 0
+    assert [result["index"] for result in response.data["results"]] == list(range(50))
+
+    orders = Order.objects.filter(uid__in=[result["order_id"] for result in response.data["results"]])
+    assert orders.count() == 50
+    assert all(order.status == OrderStatus.PLACED for order in orders)
+    assert OrderItem.objects.filter(order__in=orders).count() == 100
+    assert OrderPayment.objects.get(order__customer_id="customer7").payment_info_id == "payment7"
+
+
+def test__success__partner_orders__bulk_place__repeated_items(db, api_client):
+    """Test that repeated items within an order are collapsed into a single item."""
+
+    order_data = build_order_data(0, menu_items=[{"item_id": "item1", "quantity": 1}] * 3)
+
+    response = api_client.post(reverse("order:partner-orders"), {"orders": [order_data]})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert OrderItem.objects.get(order__uid=response.data["results"][0]["order_id"]).quantity == 3
+
+
+def test__success__partner_orders__bulk_place__partial_failure(db, api_client):
+    """Test that invalid orders are reported, while the valid orders are still placed."""
+
+    request_data = {
+        "orders": [
+            build_order_data(0),
+            build_order_data(1, menu_items=[]),
+            build_order_data(2, menu_items=[{"item_id": "item1", "quantity": 0}]),
+            build_order_data(3),
+        ]
+    }
+
+    response = api_client.post(reverse("order:partner-orders"), request_data)
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    assert response.data["created"] == 2
+    assert response.data["failed"] == 2
+
+    results = response.data["results"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["order_id"] is not None for result in results] == [True, False, False, True]
+    assert results[1]["errors"] and results[2]["errors"]
+    assert set(Order.objects.values_list("customer_id", flat=True)) == {"customer0", "customer3"}
+
+
+@pytest.mark.parametrize("orders_count", [0, ORDER__BULK_PLACE_MAX_SIZE + 1])
+def test__failure__partner_orders__bulk_place__batch_size(orders_count, db, api_client):
+    """Test that empty and oversized batches are rejected as a whole."""
+
+    request_data = {"orders": [build_order_data(index) for index in range(orders_count)]}
+
+    response = api_client.post(reverse("order:partner-orders"), request_data)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Order.objects.exists()
@@ -0,0 +1,122 @@
+"""
+Query budgets for every order view, so that regressions (e.g. a repeated or N+1 lookup) fail the suite.
+
+NOTE: budgets include the `SAVEPOINT` and `RELEASE SAVEPOINT` of each atomic block, as tests run in a transaction.
+"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+# NOTE: view (and variant) -> maximum number of queries per request
+QUERY_BUDGETS = {
+    # savepoint, order, items (upsert), payment, release, items (rendered)
+    "CustomerOrdersView.post": 6,
+    # savepoint, order (locked), items (upsert), payment, release
+    "CustomerOrderView.patch": 5,
+    # savepoint, orders, items, payments, release
+    "PartnerOrdersView.post": 5,
+    # count, orders, items (prefetched)
+    "RestaurantOrdersView.get": 3,
+    "RestaurantOrdersView.get__cursor": 2,
+    "RestaurantOrdersView.get__cached": 0,
+    # order, conditional update
+    "RestaurantOrderView.patch": 2,
+    # count, payments (joined with orders)
+    "RefundsView.get": 2,
+    "RefundsView.get__cursor": 1,
+    "RefundsView.get__feed": 1,
+}
+
+MENU_ITEMS = [{"item_id": f"item{i}", "quantity": 1} for i in range(5)]
+
+
+@pytest.fixture
+def orders(generate_orders, generate_order_items, generate_order_payments):
+    """Orders (some rejected), each with several items and a payment, so any N+1 lookup exceeds the budgets."""
+
+    orders = generate_orders(amount=5) + generate_orders(amount=5, rejected=True)
+    for order in orders:
+        generate_order_items(amount=3, order=order)
+        generate_order_payments(amount=1, order=order)
+    return orders
+
+
+def test__success__customer_orders__create__query_budget(api_client, query_budget):
+    """Test that placing an order stays within its query budget."""
+
+    url = reverse("order:customer-orders", kwargs={"customerId": "customer123"})
+
+    with query_budget(QUERY_BUDGETS["CustomerOrdersView.post"]):
+        response = api_client.post(url, {"menu_items": MENU_ITEMS, "payment_info_id": "payment123"})
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+def test__success__customer_order__add_items__query_budget(orders, api_client, query_budget):
+    """Test that adding items to an order stays within its query budget."""
+
+    order = orders[0]
+    url = reverse("order:customer-order", kwargs={"customerId": order.customer_id, "orderId": order.uid})
+
+    with query_budget(QUERY_BUDGETS["CustomerOrderView.patch"]):
+        response = api_client.patch(url, {"menu_items": MENU_ITEMS, "payment_info_id": "payment123"})
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test__success__partner_orders__bulk_place__query_budget(api_client, query_budget):
+    """Test that placing orders in bulk stays within its query budget, whatever the number of orders."""
+
+    orders = [
+        {"customer_id": f"customer{index}", "menu_items": MENU_ITEMS, "payment_info_id": "payment"}
+        for index in range(20)
+    ]
+
+    with query_budget(QUERY_BUDGETS["PartnerOrdersView.post"]):
+        response = api_client.post(reverse("order:partner-orders"), {"orders": orders})
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.parametrize("variant, params", [("get", {}), ("get__cursor", {"pagination": "cursor"})])
+def test__success__restaurant_orders__list__query_budget(variant, params, orders, api_client, query_budget):
+    """Test that listing orders (and serving the list from the cache) stays within its query budget."""
+
+    url = reverse("order:restaurant-orders")
+
+    with query_budget(QUERY_BUDGETS[f"RestaurantOrdersView.{variant}"]):
+        response = api_client.get(url, params)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    # identical requests are served from the cache
+    with query_budget(QUERY_BUDGETS["RestaurantOrdersView.get__cached"]):
+        response = api_client.get(url, params)
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test__success__restaurant_order__action__query_budget(orders, api_client, query_budget):
+    """Test that accepting an order stays within its query budget."""
+
+    url = reverse("order:restaurant-order", kwargs={"orderId": orders[0].uid})
+
+    with query_budget(QUERY_BUDGETS["RestaurantOrderView.patch"]):
+        response = api_client.patch(url, {"action": "accept"})
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.parametrize(
+    "variant, params",
+    [("get", {}), ("get__cursor", {"pagination": "cursor"}), ("get__feed", {"since": ""})],
+)
+def test__success__refunds_view__list__query_budget(variant, params, orders, api_client, query_budget):
+    """Test that listing refunds (including the incremental feed) stays within its query budget."""
+
+    with query_budget(QUERY_BUDGETS[f"RefundsView.{variant}"]):
+        response = api_client.get(reverse("order:internal-refunds"), params)
+
+    assert response.status_code == status.HTTP_200_OK
@@ -1,7 +1,11 @@
+from datetime import timedelta
+
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 
+from order.constants import ORDER__REFUNDS_FEED_LAG_SECONDS
 from order.enums import OrderStatus
 from order.models import Order
 
@@ -42,3 +46,101 @@ def test__success__refunds_view__list(
         order_id = refund_item["order_id"]
         order = Order.objects.get(uid=order_id)
         assert order.status == OrderStatus.REJECTED
+
+
+def test__success__refunds_view__list__cursor_pagination(api_client, generate_orders):
+    """Test that the refunds consumer can opt in to cursor pagination."""
+
+    _ = generate_orders(amount=3, rejected=True)
+
+    # Make the API request
+    response = api_client.get(reverse("order:internal-refunds") + "?pagination=cursor&size=2")
+
+    # Assert response status
+    assert response.status_code == status.HTTP_200_OK
+
+    # Verify the cursor page
+    assert "count" not in response.data
+    assert len(response.data["results"]) == 2
+    assert "cursor=" in response.data["next"]
+
+    # Verify the next page
+    response = api_client.get(response.data["next"])
+    assert len(response.data["results"]) == 1
+    assert response.data["next"] is None
+
+
+def settle_rejections(orders: list[Order]) -> None:
+    """Backdate the rejection of the given orders beyond the refunds feed lag."""
+
+    rejected_at = timezone.now() - timedelta(seconds=ORDER__REFUNDS_FEED_LAG_SECONDS + 1)
+    Order.objects.filter(pk__in=[order.pk for order in orders]).update(rejected_at=rejected_at)
+
+
+def test__success__refunds_view__feed(api_client, generate_orders):
+    """Test that the incremental feed only returns refunds which became due since the previous watermark."""
+
+    # Generate rejected orders, and orders which don't need refunds
+    first_orders = generate_orders(amount=3, rejected=True)
+    settle_rejections(first_orders)
+    _ = generate_orders(amount=2, accepted=True)
+    _ = generate_orders(amount=2)
+
+    # Poll from the beginning of the history, in pages
+    response = api_client.get(reverse("order:internal-refunds"), {"since": "", "size": 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 2
+    assert response.data["has_more"] is True
+
+    response = api_client.get(reverse("order:internal-refunds"), {"since": response.data["watermark"], "size": 2})
+    assert len(response.data["results"]) == 1
+    assert response.data["has_more"] is False
+    watermark = response.data["watermark"]
+
+    # Verify polling again returns nothing new, keeping the watermark
+    response = api_client.get(reverse("order:internal-refunds"), {"since": watermark})
+    assert response.data["results"] == []
+    assert response.data["watermark"] == watermark
+
+    # Verify only new rejections are returned, once settled
+    new_orders = generate_orders(amount=2, rejected=True)
+    response = api_client.get(reverse("order:internal-refunds"), {"since": watermark})
+    assert response.data["results"] == []
+
+    settle_rejections(new_orders)
+    response = api_client.get(reverse("order:internal-refunds"), {"since": watermark})
+    assert sorted(str(refund["order_id"]) for refund in response.data["results"]) == sorted(
+        str(order.uid) for order in new_orders
+    )
+
+
+def test__failure__refunds_view__feed__invalid_watermark(api_client):
+    """Test that an invalid watermark is rejected."""
+
+    response = api_client.get(reverse("order:internal-refunds"), {"since": "invalid"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test__success__refunds_view__list__query_shape(api_client, generate_orders, django_assert_num_queries):
+    """Test that listing refunds loads the payments and their orders in a single query (after the count)."""
+
+    _ = generate_orders(amount=3, rejected=True)
+
+    # NOTE: count + payments (joined with orders)
+    with django_assert_num_queries(2) as captured:
+        response = api_client.get(reverse("order:internal-refunds"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 3
+    assert '"order_order"."customer_id"' not in captured.captured_queries[-1]["sql"]
+
+
+def test__success__refunds_view__schema(api_client):
+    """Test that the incremental feed parameter is documented in the API schema."""
+
+    response = api_client.get(reverse("schema"), {"format": "json"})
+
+    assert response.status_code == status.HTTP_200_OK
+    parameters = response.json()["paths"][reverse("order:internal-refunds")]["get"]["parameters"]
+    assert "since" in {parameter["name"] for parameter in parameters}
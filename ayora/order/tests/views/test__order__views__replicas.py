@@ -0,0 +1,134 @@
+import time
+
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from core.utils.replicas import REPLICA_PIN_COOKIE, REPLICA_PIN_HEADER, get_read_database
+
+# NOTE: the replica mirrors the test database through its own connection, so the data must be committed
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+
+
+@pytest.fixture
+def replica(settings):
+    settings.CORE__REPLICA_DATABASE = "replica"
+    return "replica"
+
+
+def test__success__replicas__list__read_from_replica(api_client, generate_orders, replica):
+    """Test that the restaurant orders are listed from the replica, leaving the primary untouched."""
+
+    _ = generate_orders(amount=3)
+
+    with CaptureQueriesContext(connections["default"]) as primary, CaptureQueriesContext(connections[replica]) as read:
+        response = api_client.get(reverse("order:restaurant-orders"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 3
+    assert len(read.captured_queries) > 0
+    assert len(primary.captured_queries) == 0
+
+    # the routing does not leak out of the request
+    assert get_read_database() is None
+
+
+def test__success__replicas__list__read_from_primary_without_replica(api_client, generate_orders):
+    """Test that the restaurant orders are listed from the primary, when no replica is configured."""
+
+    _ = generate_orders(amount=3)
+
+    with (
+        CaptureQueriesContext(connections["default"]) as primary,
+        CaptureQueriesContext(connections["replica"]) as read,
+    ):
+        response = api_client.get(reverse("order:restaurant-orders"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(primary.captured_queries) > 0
+    assert len(read.captured_queries) == 0
+
+
+def test__success__replicas__write__pins_to_primary(api_client, generate_orders, replica):
+    """Test that a client which wrote is pinned to the primary, so it reads its own writes."""
+
+    [order] = generate_orders(amount=1)
+
+    response = api_client.patch(
+        reverse("order:restaurant-order", kwargs={"orderId": order.uid}), data={"action": "accept"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert float(response.headers[REPLICA_PIN_HEADER]) > time.time()
+    assert response.cookies[REPLICA_PIN_COOKIE].value == response.headers[REPLICA_PIN_HEADER]
+
+    # the pin cookie is sent back by the client
+    with CaptureQueriesContext(connections["default"]) as primary, CaptureQueriesContext(connections[replica]) as read:
+        response = api_client.get(reverse("order:restaurant-orders"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(primary.captured_queries) > 0
+    assert len(read.captured_queries) == 0
+
+
+@pytest.mark.parametrize("pin_offset, reads_from_replica", [(60, False), (-60, True)])
+def test__success__replicas__pin_header(pin_offset, reads_from_replica, api_client, generate_orders, replica):
+    """Test that clients can pin themselves to the primary through a header, until the pin expires."""
+
+    _ = generate_orders(amount=1)
+
+    headers = {REPLICA_PIN_HEADER: str(int(time.time()) + pin_offset)}
+    with CaptureQueriesContext(connections[replica]) as read:
+        response = api_client.get(reverse("order:restaurant-orders"), headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert (len(read.captured_queries) > 0) == reads_from_replica
+
+
+def test__failure__replicas__failed_write__not_pinned(api_client, replica):
+    """Test that a failed write does not pin the client to the primary."""
+
+    response = api_client.patch(
+        reverse("order:restaurant-order", kwargs={"orderId": "unknown"}), data={"action": "accept"}
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert REPLICA_PIN_HEADER not in response.headers
+    assert REPLICA_PIN_COOKIE not in response.cookies
+
+
+@pytest.mark.parametrize("params, reads_from_replica", [({}, True), ({"since": ""}, False)])
+def test__success__replicas__refunds__feed_read_from_primary(params, reads_from_replica, api_client, replica):
+    """Test that the refunds are listed from the replica, but the incremental feed from the primary (i.e. no lag)."""
+
+    with CaptureQueriesContext(connections["default"]) as primary, CaptureQueriesContext(connections[replica]) as read:
+        response = api_client.get(reverse("order:internal-refunds"), params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert (len(read.captured_queries) > 0) == reads_from_replica
+    assert (len(primary.captured_queries) > 0) != reads_from_replica
+
+
+def test__success__replicas__list__cache_not_shared_with_pinned_clients(api_client, generate_orders, replica):
+    """Test that a page cached from the replica is never served to a client pinned to the primary."""
+
+    _ = generate_orders(amount=1)
+
+    # cache the page (as read from the replica) under the current version
+    response = api_client.get(reverse("order:restaurant-orders"))
+    assert response.status_code == status.HTTP_200_OK
+
+    headers = {REPLICA_PIN_HEADER: str(int(time.time()) + 60)}
+    with CaptureQueriesContext(connections["default"]) as primary:
+        response = api_client.get(reverse("order:restaurant-orders"), headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(primary.captured_queries) > 0
+
+    # the page read from the primary is cached (apart) in turn
+    with CaptureQueriesContext(connections["default"]) as primary:
+        response = api_client.get(reverse("order:restaurant-orders"), headers=headers)
+
+    assert len(primary.captured_queries) == 0
@@ -48,3 +48,85 @@ def test__success__restaurant_orders__filter_by_status(api_client, filter_status
     # All returned orders should have the requested status
     for order in response.data["results"]:
         assert order["status"] == filter_status
+
+
+@pytest.mark.parametrize("page_size", [2, 3])
+def test__success__restaurant_orders__list__cursor_pagination(page_size, api_client, generate_orders):
+    """Test that restaurants can opt in to cursor pagination, walking every order exactly once."""
+
+    orders = generate_orders(amount=5)
+
+    # Walk the pages by following the cursor links
+    url = reverse("order:restaurant-orders") + f"?pagination=cursor&size={page_size}"
+    order_ids = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert len(response.data["results"]) <= page_size
+        order_ids.extend(result["order_id"] for result in response.data["results"])
+        url = response.data["next"]
+
+    # Verify stable, newest first, ordering without duplicates
+    expected = sorted(orders, key=lambda order: (order.created_at, order.pk), reverse=True)
+    assert order_ids == [str(order.uid) for order in expected]
+
+
+def test__success__restaurant_orders__list__query_shape(api_client, generate_orders, django_assert_num_queries):
+    """Test that listing orders only loads the rendered columns and items (i.e. never payments)."""
+
+    _ = generate_orders(amount=3, items=True, payments=True)
+
+    # NOTE: count + orders + items
+    with django_assert_num_queries(3) as captured:
+        response = api_client.get(reverse("order:restaurant-orders"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert all(len(result["menu_items"]) == 1 for result in response.data["results"])
+
+    # Verify the query shape
+    queries = [query["sql"] for query in captured.captured_queries]
+    assert not any('"order_orderpayment"' in sql for sql in queries)
+    assert not any('"order_order"."rejected_at"' in sql for sql in queries)
+
+
+def test__success__restaurant_orders__list__cached(
+    api_client, generate_orders, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    """Test that identical list requests are served from the cache until an order changes."""
+
+    orders = generate_orders(amount=3)
+    url = reverse("order:restaurant-orders") + f"?status={OrderStatus.PLACED}"
+
+    # Prime the cache
+    response = api_client.get(url)
+    assert response.data["count"] == 3
+
+    # Verify identical requests don't touch the database
+    with django_assert_num_queries(0):
+        response = api_client.get(url)
+    assert response.data["count"] == 3
+
+    # Change an order (invalidating once committed)
+    with django_capture_on_commit_callbacks(execute=True):
+        orders[0].mark_as_accepted()
+
+    # Verify the change is reflected
+    response = api_client.get(url)
+    assert response.data["count"] == 2
+
+
+def test__success__restaurant_orders__filter_by_placement(api_client, generate_orders):
+    """Test that orders can be filtered by placement time."""
+
+    orders = generate_orders(amount=3)
+    placed_at = orders[1].created_at.isoformat()
+
+    response = api_client.get(reverse("order:restaurant-orders"), {"ordered_after": placed_at})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [order["order_id"] for order in response.data["results"]] == [str(orders[2].uid), str(orders[1].uid)]
+
+    response = api_client.get(reverse("order:restaurant-orders"), {"ordered_before": placed_at})
+
+    assert [order["order_id"] for order in response.data["results"]] == [str(orders[0].uid)]
@@ -1,22 +1,61 @@
+from django.conf import settings
 from django.urls import path
 
+from .views.events import RestaurantOrderEventsView
 from .views.orders import (
     CustomerOrdersView,
     CustomerOrderView,
+    PartnerOrdersView,
     RefundsView,
     RestaurantOrdersView,
     RestaurantOrderView,
 )
+from .views.orders_async import (
+    AsyncCustomerOrdersView,
+    AsyncCustomerOrderView,
+    AsyncRestaurantOrdersView,
+    AsyncRestaurantOrderView,
+)
 
 app_name = "order"
 
-urlpatterns = [
-    # Customer
-    path("customers/<str:customerId>/orders", CustomerOrdersView.as_view(), name="customer-orders"),
-    path("customers/<str:customerId>/orders/<str:orderId>", CustomerOrderView.as_view(), name="customer-order"),
-    # Restaurant
-    path("restaurant/orders", RestaurantOrdersView.as_view(), name="restaurant-orders"),
-    path("restaurant/orders/<str:orderId>", RestaurantOrderView.as_view(), name="restaurant-order"),
-    # Internal
-    path("internal/refunds", RefundsView.as_view(), name="internal-refunds"),
-]
+
+def get_urlpatterns(*, asynchronous: bool = False) -> list:
+    """
+    Return the order URL patterns, routing the customer and restaurant order endpoints to their async variants
+    (and mounting the order events stream) if requested.
+
+    NOTE: the async views only pay off when served through ASGI (i.e. `config.asgi`), under WSGI each async
+    view is run in its own event loop, so they are opted in per deployment (see `ORDER__ASYNC_VIEWS`).
+
+    NOTE: the order events stream is only mounted alongside the async views, as under WSGI the whole stream
+    would be buffered, holding a worker until it ends (and timing out on Lambda).
+    """
+
+    if asynchronous:
+        customer_orders, customer_order = AsyncCustomerOrdersView, AsyncCustomerOrderView
+        restaurant_orders, restaurant_order = AsyncRestaurantOrdersView, AsyncRestaurantOrderView
+    else:
+        customer_orders, customer_order = CustomerOrdersView, CustomerOrderView
+        restaurant_orders, restaurant_order = RestaurantOrdersView, RestaurantOrderView
+
+    events = [
+        path("restaurant/orders/events", RestaurantOrderEventsView.as_view(), name="restaurant-order-events"),
+    ]
+
+    return [
+        # Customer
+        path("customers/<str:customerId>/orders", customer_orders.as_view(), name="customer-orders"),
+        path("customers/<str:customerId>/orders/<str:orderId>", customer_order.as_view(), name="customer-order"),
+        # Restaurant
+        path("restaurant/orders", restaurant_orders.as_view(), name="restaurant-orders"),
+        *(events if asynchronous else []),
+        path("restaurant/orders/<str:orderId>", restaurant_order.as_view(), name="restaurant-order"),
+        # Partners
+        path("partners/orders", PartnerOrdersView.as_view(), name="partner-orders"),
+        # Internal
+        path("internal/refunds", RefundsView.as_view(), name="internal-refunds"),
+    ]
+
+
+urlpatterns = get_urlpatterns(asynchronous=settings.ORDER__ASYNC_VIEWS)
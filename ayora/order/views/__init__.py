@@ -1 +1,15 @@
-from .orders import CustomerOrdersView, CustomerOrderView, RefundsView, RestaurantOrdersView, RestaurantOrderView
+from .events import RestaurantOrderEventsView
+from .orders import (
+    CustomerOrdersView,
+    CustomerOrderView,
+    PartnerOrdersView,
+    RefundsView,
+    RestaurantOrdersView,
+    RestaurantOrderView,
+)
+from .orders_async import (
+    AsyncCustomerOrdersView,
+    AsyncCustomerOrderView,
+    AsyncRestaurantOrdersView,
+    AsyncRestaurantOrderView,
+)
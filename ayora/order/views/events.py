@@ -0,0 +1,62 @@
+import time
+from collections.abc import AsyncIterator
+
+from django.conf import settings
+from django.http import HttpRequest, StreamingHttpResponse
+from django.views import View
+
+from ..constants import ORDER__EVENTS_CHANNEL, ORDER__EVENTS_HEARTBEAT_SECONDS, ORDER__EVENTS_STREAM_MAX_SECONDS
+
+
+async def stream_order_events(
+    *,
+    heartbeat: float = ORDER__EVENTS_HEARTBEAT_SECONDS,
+    max_seconds: float = ORDER__EVENTS_STREAM_MAX_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Yield order events, published by the order services, formatted as server-sent events.
+
+    NOTE: a comment is sent every `heartbeat` seconds to keep proxies from closing idle connections,
+    and the stream ends after `max_seconds` (clients reconnect after the advertised `retry`).
+    """
+
+    # NOTE: imported lazily, as `redis.asyncio` (and so `asyncio`) is otherwise only needed on ASGI deployments
+    import redis.asyncio as aioredis
+
+    client = aioredis.Redis.from_url(settings.ORDER__EVENTS_REDIS_URL)
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe(ORDER__EVENTS_CHANNEL)
+
+    try:
+        yield f"retry: {int(heartbeat * 1000)}\n\n"
+
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(timeout=heartbeat)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield f"event: order\ndata: {message['data'].decode()}\n\n"
+    finally:
+        await pubsub.unsubscribe(ORDER__EVENTS_CHANNEL)
+        await pubsub.aclose()
+        await client.aclose()
+
+
+class RestaurantOrderEventsView(View):
+    """
+    View for restaurants to be notified of new orders (and order status changes) as they happen.
+
+    NOTE: this is an async view, meant to be served through `config.asgi`, so that open streams do not each
+    hold a worker thread. Under WSGI the stream would be collected whole before being sent, holding a worker for
+    up to `ORDER__EVENTS_STREAM_MAX_SECONDS`, so it is only routed to with `ORDER__ASYNC_VIEWS`.
+    """
+
+    async def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        """Stream order events as server-sent events."""
+
+        response = StreamingHttpResponse(stream_order_events(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
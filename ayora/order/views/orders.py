@@ -1,38 +1,53 @@
 from typing import TYPE_CHECKING, Any
 
+from core.mixins.paginators import OptionalCursorPaginationMixin
+from core.mixins.views import IdempotentViewMixin, ReplicaReadViewMixin
+from core.utils.caches import get_cache_version, make_cache_key
+from core.utils.replicas import get_read_database
 from core.utils.responses import success_response
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import exceptions, generics, permissions, request, response, status
 
-from ..constants import ORDER__AUTO_REJECT_MINUTES
+from ..constants import ORDER__LIST_CACHE_NAMESPACE, ORDER__LIST_CACHE_TIMEOUT
 from ..enums import OrderStatus
 from ..filters import OrderFilter
 from ..models import Order
-from ..selectors import order__list, order_payment__list
+from ..selectors import order__list, order_item__list, order_payment__list
 from ..serializers import (
     AcceptRejectRequestSerializer,
     AddItemRequestSerializer,
+    BulkOrderRequestSerializer,
+    BulkOrdersRequestSerializer,
+    BulkOrdersSerializer,
     OrderRequestSerializer,
     OrderSerializer,
     RefundItemSerializer,
+    RefundsFeedRequestSerializer,
+    RefundsFeedSerializer,
+)
+from ..services import (
+    order__bulk_place,
+    order__create,
+    order__create_items_for_order,
+    order__create_payment_for_order,
+    order__schedule__auto_reject,
 )
-from ..services import order__create, order__create_items_for_order, order__create_payment_for_order
-from ..tasks import RejectStaleOrdersTask
 
 if TYPE_CHECKING:
     from ..models import Order as OrderModelType  # noqa: F401
 
 
-class CustomerOrdersView(generics.CreateAPIView):
+class CustomerOrdersView(IdempotentViewMixin, generics.CreateAPIView):
     """View for customers to place orders."""
 
     serializer_class = OrderRequestSerializer
     permission_classes = [permissions.AllowAny]
 
-    # NOTE: Execute as a db transaction, only commit if all related objects are successfully created
-    @transaction.atomic
     def post(self, request: request.Request, customerId: str, *args: Any, **kwargs: Any) -> response.Response:
         """Place a new order."""
 
@@ -40,8 +55,18 @@ class CustomerOrdersView(generics.CreateAPIView):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
+        # Create the order
+        order = self.perform_create(serializer)
+
+        return response.Response(OrderSerializer(instance=order).data, status=status.HTTP_201_CREATED)
+
+    # NOTE: Execute as a db transaction, only commit if all related objects are successfully created
+    @transaction.atomic
+    def perform_create(self, serializer: OrderRequestSerializer) -> "OrderModelType":
+        """Create the order, with its items and payment, from the validated request."""
+
         # Create order with validated data
-        order = order__create(customer_id=customerId)
+        order = order__create(customer_id=self.kwargs["customerId"])
 
         # Create order items
         _ = order__create_items_for_order(order=order, order_items_data=serializer.validated_data["menu_items"])
@@ -49,23 +74,65 @@ class CustomerOrdersView(generics.CreateAPIView):
         # Create order payment
         _ = order__create_payment_for_order(order=order, payment_info_id=serializer.validated_data["payment_info_id"])
 
-        # schedule the auto-rejection task
+        # schedule the (coalesced) auto-rejection task
         # (although we have a regularly polling task, this will track the timing more closely per-order.)
-        _ = RejectStaleOrdersTask.apply_async(
-            countdown=ORDER__AUTO_REJECT_MINUTES * 60,
-        )
+        order__schedule__auto_reject(order=order)
 
-        return response.Response(OrderSerializer(instance=order).data, status=status.HTTP_201_CREATED)
+        return order
+
+
+class PartnerOrdersView(generics.GenericAPIView):
+    """View for aggregator partners to place orders in bulk."""
 
+    serializer_class = BulkOrdersRequestSerializer
+    permission_classes = [permissions.AllowAny]
+
+    @extend_schema(responses={201: BulkOrdersSerializer, 207: BulkOrdersSerializer})
+    def post(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
+        """Place orders in bulk, reporting the orders which could not be placed (if any)."""
 
-class CustomerOrderView(generics.UpdateAPIView):
+        # Validate the request
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        orders_data = serializer.validated_data["orders"]
+
+        # Validate each order separately, so that invalid orders don't fail the whole batch
+        results, valid = [], []
+        for index, order_data in enumerate(orders_data):
+            order_serializer = BulkOrderRequestSerializer(data=order_data)
+            if order_serializer.is_valid():
+                valid.append((index, order_serializer.validated_data))
+            else:
+                results.append({"index": index, "order_id": None, "errors": order_serializer.errors})
+
+        # Place the valid orders, with their items and payments, in a single transaction
+        if valid:
+            with transaction.atomic():
+                orders = order__bulk_place(orders_data=[order_data for _, order_data in valid])
+            results.extend(
+                {"index": index, "order_id": str(order.uid), "errors": None}
+                for (index, _), order in zip(valid, orders, strict=True)
+            )
+
+        # NOTE: responds with a multi-status if any order could not be placed
+        data = {
+            "created": len(valid),
+            "failed": len(orders_data) - len(valid),
+            "results": sorted(results, key=lambda result: result["index"]),
+        }
+        response_status = status.HTTP_207_MULTI_STATUS if data["failed"] else status.HTTP_201_CREATED
+        return response.Response(BulkOrdersSerializer(instance=data).data, status=response_status)
+
+
+class CustomerOrderView(IdempotentViewMixin, generics.UpdateAPIView):
     """View for customers to add items to their orders."""
 
     serializer_class = AddItemRequestSerializer
     permission_classes = [permissions.AllowAny]
     # NOTE: we could use `queryset = order__list().actionable()` as another layer if assurance, but would give 404
-    # which is less informative to the client, could imply the order details are incorrect
-    queryset = order__list()
+    # which is less informative to the client, could imply the order details are incorrect.
+    # No related objects are needed to add items, so the prefetches are skipped.
+    queryset = order__list(optimized=False)
     lookup_field = "uid"
     lookup_url_kwarg = "orderId"
 
@@ -80,7 +147,9 @@ class CustomerOrderView(generics.UpdateAPIView):
         queryset = self.get_queryset()  # Already filtered by customer ID
         order_id = self.kwargs.get(self.lookup_url_kwarg)
         try:
-            obj = queryset.get(**{self.lookup_field: order_id})
+            # NOTE: the order is locked for the remainder of the transaction, so concurrent changes to the order
+            # (i.e. additions or transitions) are serialized against the validation of its status
+            obj = queryset.select_for_update().get(**{self.lookup_field: order_id})
             return obj
         except Order.DoesNotExist:
             raise exceptions.NotFound()
@@ -99,12 +168,12 @@ class CustomerOrderView(generics.UpdateAPIView):
     ) -> response.Response:
         """Add items to an existing order."""
 
-        # Get the order object
+        # Get the (locked) order object, loaded once and shared with validation and services
         order: OrderModelType = self.get_object()
 
         # Validate the request
         serializer = self.get_serializer(data=request.data)
-        serializer.context.update({"customerId": customerId, "orderId": orderId})
+        serializer.context.update({"customerId": customerId, "orderId": orderId, "order": order})
         serializer.is_valid(raise_exception=True)
 
         # Create order items
@@ -116,19 +185,48 @@ class CustomerOrderView(generics.UpdateAPIView):
         return success_response()
 
 
-class RestaurantOrdersView(generics.ListAPIView):
+class RestaurantOrdersView(ReplicaReadViewMixin, OptionalCursorPaginationMixin, generics.ListAPIView):
     """View for restaurants to list orders."""
 
     serializer_class = OrderSerializer
     permission_classes = [permissions.AllowAny]
-    queryset = order__list()
+    # NOTE: only the columns (and items) rendered by `OrderSerializer` are loaded, payments are never rendered
+    queryset = order__list(
+        prefetch=[
+            Prefetch("orderitems", queryset=order_item__list(optimized=False, only=["order_id", "item_id", "quantity"]))
+        ],
+        only=["id", "uid", "customer_id", "created_at", "status"],
+    )
     filter_backends = [DjangoFilterBackend]
     filterset_class = OrderFilter
 
     def get(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
         """Retrieve a list of orders."""
 
-        return self.list(request, *args, **kwargs)
+        # Serve identical requests from the cache, until an order changes (i.e. the namespace version is bumped)
+        # NOTE: the version is read before the queries, so a page can never be cached against a newer version
+        version = get_cache_version(ORDER__LIST_CACHE_NAMESPACE)
+        key = make_cache_key(ORDER__LIST_CACHE_NAMESPACE, version, request.query_params, get_read_database())
+        data = cache.get(key)
+
+        if data is None:
+            data = self.list(request, *args, **kwargs).data
+            cache.set(key, data, timeout=self.get_cache_timeout())
+
+        return response.Response(data)
+
+    def get_cache_timeout(self) -> int:
+        """
+        Return the timeout of a cached page, which is only as long as the primary pin when the page was read from the
+        replica, as it may have lagged behind the (already bumped) version.
+
+        NOTE: pages read from the replica are cached apart (see `make_cache_key`), so they are never served to the
+        clients pinned to the primary.
+        """
+
+        if self.reads_from_replica:
+            return min(settings.CORE__REPLICA_PIN_SECONDS, ORDER__LIST_CACHE_TIMEOUT)
+        return ORDER__LIST_CACHE_TIMEOUT
 
 
 class RestaurantOrderView(generics.UpdateAPIView):
@@ -139,7 +237,8 @@ class RestaurantOrderView(generics.UpdateAPIView):
     # NOTE: we could use `queryset = order__list().actionable()` as another layer if assurance, but would give 404
     # which is less informative to the client, could imply the order details are incorrect. Instead, we rely on the
     # finite-state machine logic at the model level.
-    queryset = order__list()
+    # Only the order row is needed to apply an action, so the prefetches are skipped.
+    queryset = order__list(optimized=False)
     lookup_field = "uid"
     lookup_url_kwarg = "orderId"
 
@@ -156,7 +255,7 @@ class RestaurantOrderView(generics.UpdateAPIView):
 
         # Validate the request
         serializer = self.get_serializer(data=request.data)
-        serializer.context.update({"orderId": orderId})
+        serializer.context.update({"orderId": orderId, "order": order})
         serializer.is_valid(raise_exception=True)
 
         # Map the action to the appropriate status
@@ -165,24 +264,73 @@ class RestaurantOrderView(generics.UpdateAPIView):
         order_status = status_map[action]
 
         # Handle the desired action
+        # NOTE: each transition is persisted in a single conditional write, and responds with a conflict
+        # if the order was finalised concurrently (e.g. by the stale order sweep)
         if order_status == OrderStatus.ACCEPTED:
             order.mark_as_accepted()
-            order.save()
         else:
             order.mark_as_rejected()
-            order.save()
 
         return success_response()
 
 
-class RefundsView(generics.ListAPIView):
+class RefundsView(ReplicaReadViewMixin, OptionalCursorPaginationMixin, generics.ListAPIView):
     """View for internal services to get refund items."""
 
     serializer_class = RefundItemSerializer
     permission_classes = [permissions.AllowAny]
-    queryset = order_payment__list().rejected()
-
+    # NOTE: only the columns rendered by `RefundItemSerializer` (and needed for pagination) are loaded
+    queryset_only = ["id", "created_at", "payment_info_id", "order__uid", "order__rejected_at"]
+    queryset = order_payment__list(only=queryset_only).rejected()
+
+    def use_replica(self, request: request.Request) -> bool:
+        # NOTE: the incremental feed always reads from the primary, as the replica may lag behind by more than the
+        # feed holds back recent refunds (i.e. `ORDER__REFUNDS_FEED_LAG_SECONDS`), so refunds which had yet to be
+        # replicated could fall behind a watermark already handed out, and be skipped by the consumer for good
+        return "since" not in request.query_params and super().use_replica(request)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="since",
+                type=str,
+                required=False,
+                description=(
+                    "Opt in to the incremental feed, passing the watermark returned by the previous poll "
+                    "(an empty value starts from the beginning of the history)."
+                ),
+            ),
+        ],
+    )
     def get(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
         """Retrieve a list of refunds (i.e. order payments linked to rejected orders)."""
 
+        # handle the incremental feed
+        if "since" in request.query_params:
+            return self.feed(request, *args, **kwargs)
+
         return self.list(request, *args, **kwargs)
+
+    def feed(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
+        """Retrieve the refunds which became due since the given watermark."""
+
+        # Validate the request
+        serializer = RefundsFeedRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        since, size = serializer.validated_data["since"], serializer.validated_data["size"]
+
+        # Get the refunds after the watermark (fetching one extra to determine if there are more)
+        queryset = order_payment__list(only=self.queryset_only).rejected_since(*(since or ()))
+        refunds = list(queryset[: size + 1])
+        has_more = len(refunds) > size
+        refunds = refunds[:size]
+
+        # Determine the next watermark (unchanged if there are no new refunds)
+        if refunds:
+            last = refunds[-1]
+            watermark = RefundsFeedRequestSerializer.encode_watermark(last.order.rejected_at, last.pk)
+        else:
+            watermark = request.query_params["since"]
+
+        data = {"watermark": watermark, "has_more": has_more, "results": refunds}
+        return response.Response(RefundsFeedSerializer(instance=data).data)
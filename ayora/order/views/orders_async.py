@@ -0,0 +1,122 @@
+from typing import TYPE_CHECKING, Any
+
+from asgiref.sync import sync_to_async
+from core.mixins.views import AsyncAPIViewMixin
+from core.utils.caches import aget_cache_version, make_cache_key
+from core.utils.paginators import AsyncPageNumberPaginator
+from core.utils.replicas import get_read_database
+from core.utils.responses import success_response
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import aprefetch_related_objects
+from rest_framework import exceptions, request, response, status
+
+from ..constants import ORDER__LIST_CACHE_NAMESPACE
+from ..enums import OrderStatus
+from ..models import Order
+from ..serializers import OrderSerializer
+from ..services import order__atransition
+from .orders import CustomerOrdersView, CustomerOrderView, RestaurantOrdersView, RestaurantOrderView
+
+if TYPE_CHECKING:
+    from ..models import Order as OrderModelType  # noqa: F401
+
+
+class AsyncCustomerOrdersView(AsyncAPIViewMixin, CustomerOrdersView):
+    """Async variant of `CustomerOrdersView`."""
+
+    async def post(self, request: request.Request, customerId: str, *args: Any, **kwargs: Any) -> response.Response:
+        """Place a new order."""
+
+        # Validate the request
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Create the order
+        # NOTE: the async ORM cannot run in a transaction (yet), so the order and its related objects are created
+        # in a single thread hop, keeping them all-or-nothing
+        order = await sync_to_async(self.perform_create)(serializer)
+        await aprefetch_related_objects([order], "orderitems")
+
+        return response.Response(OrderSerializer(instance=order).data, status=status.HTTP_201_CREATED)
+
+
+class AsyncCustomerOrderView(AsyncAPIViewMixin, CustomerOrderView):
+    """Async variant of `CustomerOrderView`."""
+
+    async def patch(
+        self, request: request.Request, customerId: str, orderId: str, *args: Any, **kwargs: Any
+    ) -> response.Response:
+        """Add items to an existing order."""
+
+        # NOTE: the order is locked (i.e. `SELECT ... FOR UPDATE`) while it is validated and updated, which needs a
+        # transaction, so the whole addition is run in a single thread hop
+        return await sync_to_async(super().patch)(request, customerId, orderId, *args, **kwargs)
+
+
+class AsyncRestaurantOrdersView(AsyncAPIViewMixin, RestaurantOrdersView):
+    """Async variant of `RestaurantOrdersView`."""
+
+    pagination_class = AsyncPageNumberPaginator
+
+    async def get(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
+        """Retrieve a list of orders."""
+
+        # Serve identical requests from the cache, until an order changes (i.e. the namespace version is bumped)
+        version = await aget_cache_version(ORDER__LIST_CACHE_NAMESPACE)
+        key = make_cache_key(ORDER__LIST_CACHE_NAMESPACE, version, request.query_params, get_read_database())
+        data = await cache.aget(key)
+
+        if data is None:
+            data = (await self.alist(request, *args, **kwargs)).data
+            await cache.aset(key, data, timeout=self.get_cache_timeout())
+
+        return response.Response(data)
+
+    async def alist(self, request: request.Request, *args: Any, **kwargs: Any) -> response.Response:
+        """Async variant of `list`, evaluating the page with the async ORM."""
+
+        queryset = self.filter_queryset(self.get_queryset())
+
+        # NOTE: DRF's cursor pagination evaluates the page synchronously
+        if self.use_cursor_pagination():
+            page = await sync_to_async(self.paginate_queryset)(queryset)
+        else:
+            page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class AsyncRestaurantOrderView(AsyncAPIViewMixin, RestaurantOrderView):
+    """Async variant of `RestaurantOrderView`."""
+
+    async def aget_object(self) -> "OrderModelType":
+        """Async variant of `get_object`."""
+
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            return await queryset.aget(**{self.lookup_field: self.kwargs[self.lookup_url_kwarg]})
+        except (Order.DoesNotExist, ValidationError, ValueError):
+            raise exceptions.NotFound()
+
+    async def patch(self, request: request.Request, orderId: str, *args: Any, **kwargs: Any) -> response.Response:
+        """Accept or reject an order."""
+
+        # Get the order
+        order: OrderModelType = await self.aget_object()
+
+        # Validate the request
+        serializer = self.get_serializer(data=request.data)
+        serializer.context.update({"orderId": orderId, "order": order})
+        serializer.is_valid(raise_exception=True)
+
+        # Map the action to the appropriate status
+        action = serializer.validated_data["action"]
+        status_map = {"accept": OrderStatus.ACCEPTED, "reject": OrderStatus.REJECTED}
+
+        # Handle the desired action
+        # NOTE: the transition is a single conditional write, so is applied with the async ORM
+        await order__atransition(order=order, target=status_map[action])
+
+        return success_response()
@@ -0,0 +1,7 @@
+#!/bin/sh
+# Allow streaming replication connections (i.e. from `db-replica`), run once when the data directory is initialised.
+
+set -o errexit
+set -o nounset
+
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"